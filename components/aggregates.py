@@ -0,0 +1,123 @@
+"""
+Aggregates for Level Up Application
+Thống kê nhiệm vụ, danh hiệu và nguồn vốn, cập nhật dần thay vì quét lại mỗi lần hiển thị
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List
+
+from components.quest_store import QuestStore
+from utils.helpers import calculate_resource_total
+
+# Count name -> indexed Quest attribute
+QUEST_FIELDS = {
+    'status': 'status',
+    'priority': 'priority',
+    'category': 'category',
+    'stat': 'required_stat'
+}
+
+# Counter name -> Achievement attribute
+ACHIEVEMENT_FIELDS = {
+    'tier': 'tier',
+    'category': 'category'
+}
+
+class Aggregates:
+    """Counts over the session's quests, achievements and resource details
+    
+    Quest counts are read from the QuestStore's own field indexes, which
+    every quest change already goes through. Achievements and resource
+    details are counted in one pass when loaded or replaced, then adjusted
+    record by record when sync patches rows: remove the old record, add
+    the new one. Pages read every count in O(1).
+    """
+    
+    def __init__(self):
+        self.quests = QuestStore()
+        
+        self.achievement_total = 0
+        self.achievement_counts: Dict[str, Counter] = {name: Counter() for name in ACHIEVEMENT_FIELDS}
+        self.unlocked_by_tier = Counter()
+        
+        self.resource_totals: Dict[str, float] = {}
+    
+    # Quests
+    def set_quests(self, quests: QuestStore):
+        """Count the quests of this store from now on (call when the session's store is replaced)"""
+        self.quests = quests
+    
+    @property
+    def quest_total(self) -> int:
+        return len(self.quests)
+    
+    def quest_count(self, field: str, value: str) -> int:
+        """Count the quests whose field (status, priority, category, stat) equals value"""
+        return self.quests.count(QUEST_FIELDS[field], value)
+    
+    @property
+    def completed_quests(self) -> int:
+        return self.quests.count('status', 'completed')
+    
+    @property
+    def pending_quests(self) -> int:
+        return self.quest_total - self.completed_quests
+    
+    @property
+    def completion_rate(self) -> float:
+        """Quest completion rate as a percentage"""
+        return self.completed_quests / self.quest_total * 100 if self.quest_total else 0.0
+    
+    # Achievements
+    def _count_achievement(self, achievement, sign: int):
+        self.achievement_total += sign
+        for name, attribute in ACHIEVEMENT_FIELDS.items():
+            self.achievement_counts[name][getattr(achievement, attribute)] += sign
+        if achievement.unlocked:
+            self.unlocked_by_tier[achievement.tier] += sign
+    
+    def add_achievement(self, achievement):
+        """Count a new or updated achievement"""
+        self._count_achievement(achievement, 1)
+    
+    def remove_achievement(self, achievement):
+        """Uncount an achievement before it is deleted or changed"""
+        self._count_achievement(achievement, -1)
+    
+    def rebuild_achievements(self, achievements: Iterable):
+        """Recount every achievement"""
+        self.achievement_total = 0
+        self.achievement_counts = {name: Counter() for name in ACHIEVEMENT_FIELDS}
+        self.unlocked_by_tier = Counter()
+        for achievement in achievements:
+            self._count_achievement(achievement, 1)
+    
+    def achievement_count(self, field: str, value: str) -> int:
+        """Count the achievements whose field (tier, category) equals value"""
+        return self.achievement_counts[field][value]
+    
+    @property
+    def unlocked_achievements(self) -> int:
+        return sum(self.unlocked_by_tier.values())
+    
+    @property
+    def unlock_rate(self) -> float:
+        """Achievement unlock rate as a percentage"""
+        return self.unlocked_achievements / self.achievement_total * 100 if self.achievement_total else 0.0
+    
+    # Resource details
+    def add_resource_detail(self, resource_name: str, detail: Dict):
+        """Add a detail's contribution to its resource total"""
+        self.resource_totals[resource_name] = self.resource_totals.get(resource_name, 0.0) + calculate_resource_total([detail])
+    
+    def remove_resource_detail(self, resource_name: str, detail: Dict):
+        """Take a detail's contribution out of its resource total"""
+        self.resource_totals[resource_name] = self.resource_totals.get(resource_name, 0.0) - calculate_resource_total([detail])
+    
+    def rebuild_resource_details(self, details_by_resource: Dict[str, List[Dict]]):
+        """Recompute every resource total"""
+        self.resource_totals = {name: calculate_resource_total(details) for name, details in details_by_resource.items()}
+    
+    def resource_total(self, resource_name: str) -> float:
+        """Get the net value of a resource's active details"""
+        return self.resource_totals.get(resource_name, 0.0)
\ No newline at end of file
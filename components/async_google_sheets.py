@@ -0,0 +1,359 @@
+"""
+Async Google Sheets Client for Level Up Application
+Phiên bản bất đồng bộ của GoogleSheetsManager, dùng chung một pool kết nối trên mỗi event loop
+"""
+
+import asyncio
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from config import (REQUEST_TIMEOUT, HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR, ASYNC_HTTP_POOL_SIZE,
+                    READ_WINDOW_ROWS, SYNC_RANGE_TIMEOUT)
+from utils.rate_limiter import RateLimitExceeded, TokenBucket, get_rate_limiter
+from utils.retry_policy import RETRYABLE_STATUS_CODES, UnconfirmedWriteError, backoff_delay, is_idempotent
+from utils.sheet_cache import SheetCache, get_sheet_cache
+from components.local_store import get_local_store
+from components.write_queue import may_be_stale
+from components.sheet_data import SheetDataMixin, CHARACTER_WRITE_RANGE, CHAT_APPEND_RANGE, RESOURCE_DETAILS_APPEND_RANGE
+
+# One pooled client per event loop, shared by every async manager on it
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the keep-alive client shared on the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=ASYNC_HTTP_POOL_SIZE, max_keepalive_connections=ASYNC_HTTP_POOL_SIZE),
+            headers={'Content-Type': 'application/json'}
+        )
+        _clients[loop] = client
+    return client
+
+async def close_async_client():
+    """Close the shared client of the running event loop"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+class AsyncGoogleSheetsManager(SheetDataMixin):
+    """asyncio version of GoogleSheetsManager
+    
+    Same methods as the sync manager, as coroutines, so one event loop can
+    serve many sheets without a thread each. Requests go through the
+    process-wide rate limiter and sheet cache, and reads are mirrored to
+    the local store, exactly like the sync manager.
+    """
+    
+    def __init__(self, sheet_id: str, api_key: str,
+                 timeout: float = REQUEST_TIMEOUT,
+                 max_retries: int = HTTP_MAX_RETRIES,
+                 backoff_factor: float = HTTP_BACKOFF_FACTOR,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 window_rows: int = READ_WINDOW_ROWS,
+                 cache: Optional[SheetCache] = None,
+                 client: Optional[httpx.AsyncClient] = None):
+        self.sheet_id = sheet_id
+        self.api_key = api_key
+        self.base_url = f"https://sheets.googleapis.com/v4/spreadsheets/{sheet_id}"
+        
+        # HTTP settings; the pooled client is looked up on first use
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._client = client
+        
+        # Shared with the sync managers
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.last_rate_limit_wait = 0.0
+        self.cache = cache or get_sheet_cache()
+        self.local_store = get_local_store(sheet_id)
+        
+        # Ranges and parsers
+        self._init_sheet_data(window_rows)
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for this manager (the loop's shared pool by default)"""
+        return self._client or get_async_client()
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Same retry policy as the sync manager"""
+        return backoff_delay(attempt, self.backoff_factor, retry_after)
+    
+    async def _make_request(self, endpoint: str, method: str = 'GET', data: Dict = None, params: Dict = None) -> Dict:
+        """Make HTTP request to Google Sheets API (same retry rules as GoogleSheetsManager._make_request)"""
+        if method not in ('GET', 'PUT', 'POST'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        url = f"{self.base_url}{endpoint}"
+        query = {'key': self.api_key}
+        if params:
+            query.update(params)
+        idempotent = is_idempotent(method, endpoint)
+        
+        response = None
+        for attempt in range(self.max_retries + 1):
+            # Raises RateLimitExceeded when the queue is too long
+            self.last_rate_limit_wait = self.rate_limiter.reserve()
+            if self.last_rate_limit_wait > 0:
+                await asyncio.sleep(self.last_rate_limit_wait)
+            
+            try:
+                response = await self.client.request(method, url, params=query, json=data, timeout=self.timeout)
+            except httpx.TransportError as e:
+                # Connect and pool errors are raised before anything is sent
+                if not idempotent and not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+                    raise UnconfirmedWriteError(f"Lỗi kết nối: {str(e)}")
+                if attempt >= self.max_retries:
+                    raise Exception(f"Lỗi kết nối: {str(e)}")
+                await asyncio.sleep(self._backoff_delay(attempt))
+                continue
+            
+            retryable = response.status_code in RETRYABLE_STATUS_CODES and (idempotent or response.status_code == 429)
+            if retryable and attempt < self.max_retries:
+                await asyncio.sleep(self._backoff_delay(attempt, response.headers.get('Retry-After')))
+                continue
+            break
+        
+        if not idempotent and response.status_code >= 500:
+            raise UnconfirmedWriteError(f"Lỗi kết nối: {response.status_code}")
+        if response.status_code == 403:
+            raise Exception("API Key không hợp lệ hoặc không có quyền truy cập")
+        elif response.status_code == 404:
+            raise Exception("Không tìm thấy Google Sheet với ID này")
+        elif response.is_error:
+            raise Exception(f"Lỗi kết nối: {response.status_code}")
+        return response.json()
+    
+    async def test_connection(self) -> bool:
+        """Test connection to Google Sheets"""
+        await self._make_request("")
+        return True
+    
+    async def read_range(self, range_name: str) -> List[List[str]]:
+        """Read data from a specific range"""
+        try:
+            response = await self._make_request(f"/values/{range_name}")
+            return response.get('values', [])
+        except Exception as e:
+            print(f"Warning: Could not read range {range_name}: {str(e)}")
+            return []
+    
+    async def write_range(self, range_name: str, values: List[List[str]]) -> bool:
+        """Write data to a specific range"""
+        try:
+            await self._make_request(f"/values/{range_name}", method='PUT', data={'values': values},
+                                     params={'valueInputOption': 'RAW'})
+            self._invalidate(range_name)
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi ghi dữ liệu: {str(e)}")
+    
+    async def append_row(self, range_name: str, values: List[str]) -> bool:
+        """Append a row to a sheet"""
+        return await self.append_rows(range_name, [values])
+    
+    async def append_rows(self, range_name: str, rows: List[List[str]]) -> bool:
+        """Append several rows to a sheet in one request"""
+        try:
+            await self._make_request(f"/values/{range_name}:append", method='POST', data={'values': rows},
+                                     params={'valueInputOption': 'RAW'})
+            self._invalidate(range_name)
+            return True
+        except UnconfirmedWriteError as e:
+            self._invalidate(range_name)
+            raise UnconfirmedWriteError(f"Lỗi thêm dữ liệu: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Lỗi thêm dữ liệu: {str(e)}")
+    
+    async def batch_update(self, updates: Dict[str, List[List[str]]]) -> bool:
+        """Write several ranges in one values:batchUpdate request"""
+        try:
+            data = {
+                'valueInputOption': 'RAW',
+                'data': [{'range': range_name, 'values': values} for range_name, values in updates.items()]
+            }
+            await self._make_request("/values:batchUpdate", method='POST', data=data)
+            for range_name in updates:
+                self._invalidate(range_name)
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi ghi dữ liệu: {str(e)}")
+    
+    async def batch_clear(self, range_names: List[str]) -> bool:
+        """Clear several ranges in one values:batchClear request"""
+        try:
+            await self._make_request("/values:batchClear", method='POST', data={'ranges': range_names})
+            for range_name in range_names:
+                self._invalidate(range_name)
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi xóa dữ liệu: {str(e)}")
+    
+    def _invalidate(self, range_name: str):
+        """Drop the cached reads of the tab a write went to"""
+        self.cache.invalidate(self.sheet_id, range_name.split('!')[0])
+    
+    async def _fetch_ranges(self, ranges: List[str]) -> List[List[List[str]]]:
+        """Fetch several A1 ranges with one values:batchGet request"""
+        response = await self._make_request("/values:batchGet", params={'ranges': ranges})
+        value_ranges = response.get('valueRanges', [])
+        return [value_ranges[i].get('values', []) if i < len(value_ranges) else [] for i in range(len(ranges))]
+    
+    async def _batch_get(self, ranges: List[str], refresh: bool = False) -> List[List[List[str]]]:
+        """Get several A1 ranges through the shared cache, fetching the missing ones in one batchGet
+        
+        Unlike the sync manager this does not wait on loads in flight in
+        other threads (that would block the event loop); a miss is fetched
+        and stored unless a write invalidated the sheet in the meantime.
+        """
+        keys = [(self.sheet_id, range_name) for range_name in ranges]
+        generation = self.cache.generation
+        values = {} if refresh else self.cache.peek_many(keys)
+        
+        missing = [key for key in keys if key not in values]
+        if missing:
+            fetched = dict(zip(missing, await self._fetch_ranges([range_name for _, range_name in missing])))
+            self.cache.put_many(fetched, generation)
+            values.update(fetched)
+        
+        return [values[key] for key in keys]
+    
+    async def fetch_all_values(self, names: Optional[List[str]] = None, refresh: bool = False) -> Dict[str, List[List[str]]]:
+        """Fetch the raw values of the given ranges (default: all of self.ranges), paginating open-ended ones"""
+        rounds = self._paginate(list(self.ranges) if names is None else names)
+        try:
+            batch = next(rounds)
+            while True:
+                batch = rounds.send(await self._batch_get(list(batch.values()), refresh))
+        except StopIteration as done:
+            return done.value
+    
+    async def read_values(self, name: str) -> List[List[str]]:
+        """Read the raw values of one range in self.ranges, paginating if open-ended"""
+        try:
+            return (await self.fetch_all_values([name]))[name]
+        except Exception as e:
+            print(f"Warning: Could not read range {self.ranges[name]}: {str(e)}")
+            return []
+    
+    async def fetch_values_concurrently(self, names: Optional[List[str]] = None, refresh: bool = False,
+                                        timeout: float = SYNC_RANGE_TIMEOUT) -> Tuple[Dict[str, List[List[str]]], Dict[str, str]]:
+        """Fetch each range with its own request concurrently; returns (values, errors)"""
+        names = list(self.ranges) if names is None else names
+        results = await asyncio.gather(
+            *(asyncio.wait_for(self.fetch_all_values([name], refresh), timeout) for name in names),
+            return_exceptions=True
+        )
+        
+        values, errors = {}, {}
+        for name, result in zip(names, results):
+            if isinstance(result, asyncio.TimeoutError):
+                errors[name] = f"Quá thời gian chờ ({timeout:.0f} giây)"
+            elif isinstance(result, Exception):
+                errors[name] = str(result)
+            else:
+                values[name] = result[name]
+        return values, errors
+    
+    async def read_all_values(self, refresh: bool = False) -> Tuple[Dict[str, List[List[str]]], Dict[str, str]]:
+        """Fetch the raw values of every range and mirror them to the local store
+        
+        Same contract as GoogleSheetsManager.read_all_values(): one batched
+        read first, concurrent per-range reads if it fails, and the local
+        store is left alone when queued writes may be missing from the values.
+        """
+        started = time.monotonic()
+        try:
+            values, errors = await self.fetch_all_values(refresh=refresh), {}
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            print(f"Warning: batchGet failed, reading ranges separately: {str(e)}")
+            values, errors = await self.fetch_values_concurrently(refresh=refresh)
+            if not values:
+                raise Exception(next(iter(errors.values()), str(e)))
+        
+        # Stale values would undo queued writes; SQLite writes are blocking, keep them off the event loop
+        if not may_be_stale(self.sheet_id, started):
+            await asyncio.to_thread(self.local_store.save_all, values)
+        return values, errors
+    
+    async def read_all(self, refresh: bool = False) -> Dict[str, Any]:
+        """Read every range in self.ranges and parse it (ranges that failed are left out)"""
+        values, _ = await self.read_all_values(refresh)
+        return self.parse_all(values)
+    
+    async def read_character(self) -> Optional[Dict]:
+        """Read character data from sheet"""
+        return self._parse_character(await self.read_values('character'))
+    
+    async def update_character(self, character) -> bool:
+        """Update character data in sheet"""
+        try:
+            values = self._character_values(character)
+            await self.write_range(CHARACTER_WRITE_RANGE, values)
+            await asyncio.to_thread(self.local_store.put_rows, 'character', 0, values)
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi cập nhật nhân vật: {str(e)}")
+    
+    async def read_quests(self) -> List[Dict]:
+        """Read quests data from sheet"""
+        return self._parse_quests(await self.read_values('quests'))
+    
+    async def update_quest(self, quest) -> bool:
+        """Update a specific quest in sheet"""
+        try:
+            row = self._quest_row(quest)
+            await self.write_range(self._quest_range(quest), [row])
+            await asyncio.to_thread(self.local_store.put_rows, 'quests', quest.id - 1, [row])
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi cập nhật nhiệm vụ: {str(e)}")
+    
+    async def read_achievements(self) -> List[Dict]:
+        """Read achievements data from sheet"""
+        return self._parse_achievements(await self.read_values('achievements'))
+    
+    async def read_resources(self) -> List[Dict]:
+        """Read resources data from sheet"""
+        return self._parse_resources(await self.read_values('resources'))
+    
+    async def read_resource_details(self) -> Dict[str, List[Dict]]:
+        """Read resource details data from sheet"""
+        return self._parse_resource_details(await self.read_values('resource_details'))
+    
+    async def add_resource_detail(self, resource_name: str, detail: Dict) -> bool:
+        """Add a new resource detail"""
+        try:
+            values = self._resource_detail_row(resource_name, detail)
+            await self.append_row(RESOURCE_DETAILS_APPEND_RANGE, values)
+            detail['id'] = await asyncio.to_thread(self.local_store.append_rows, 'resource_details', [values]) + 1
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi thêm chi tiết: {str(e)}")
+    
+    async def read_chat(self) -> List[Dict]:
+        """Read chat messages from sheet"""
+        return self._parse_chat(await self.read_values('chat'))
+    
+    async def add_chat_message(self, message: Dict) -> bool:
+        """Add a new chat message"""
+        try:
+            row = self._chat_row(message)
+            await self.append_row(CHAT_APPEND_RANGE, row)
+            message['id'] = await asyncio.to_thread(self.local_store.append_rows, 'chat', [row]) + 1
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi thêm tin nhắn: {str(e)}")
+    
+    async def read_goals(self) -> Optional[Dict]:
+        """Read goals data from sheet"""
+        return self._parse_goals(await self.read_values('goals'))
\ No newline at end of file
@@ -0,0 +1,321 @@
+"""
+Backup Engine for Level Up Application
+Sao lưu định kỳ dữ liệu đã đồng bộ thành các khối nén theo nội dung, khôi phục về bản lưu cục bộ hoặc Google Sheets
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+from config import BACKUP_DIR, BACKUP_CHUNK_ROWS, BACKUP_KEEP, BACKUP_RESTORE_BATCH_ROWS, FEATURES
+from components.sheet_data import A1_RANGE
+
+class BackupEngine:
+    """Snapshots of one sheet's raw values, stored as deduplicated chunks
+    
+    Each range is cut into runs of chunk_rows rows. A run is serialized,
+    named by the SHA-256 of its content and written gzip-compressed only
+    if no earlier snapshot stored it, so unchanged data (an append-only
+    chat history, a quest list where one row changed) costs only the
+    chunks that differ. A snapshot is a small manifest listing the chunk
+    hashes of every range; restoring streams the chunks back in order.
+    
+    Layout under backup_dir/<sheet>/: chunks/ab/<hash>.json.gz and
+    manifests/<snapshot id>.json.
+    """
+    
+    def __init__(self, sheet_id: str, backup_dir: Path = BACKUP_DIR, chunk_rows: int = BACKUP_CHUNK_ROWS,
+                 keep: int = BACKUP_KEEP):
+        safe_id = re.sub(r'[^A-Za-z0-9_-]', '_', sheet_id) or 'default'
+        self.sheet_id = sheet_id
+        self.root = Path(backup_dir) / safe_id
+        self.chunk_dir = self.root / 'chunks'
+        self.manifest_dir = self.root / 'manifests'
+        self.chunk_rows = max(1, chunk_rows)
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        # Time of the last snapshot attempt, including ones that found nothing changed
+        self._last_run: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+    
+    # Storage
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunk_dir / digest[:2] / f"{digest}.json.gz"
+    
+    def _write_atomic(self, path: Path, data: bytes):
+        """Write a file through a temporary file and rename"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _put_chunk(self, rows: List[List[str]]) -> Tuple[str, int]:
+        """Store a run of rows unless already stored; returns (hash, bytes written)"""
+        data = json.dumps(rows, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._chunk_path(digest)
+        if path.exists():
+            return digest, 0
+        compressed = gzip.compress(data, compresslevel=6, mtime=0)
+        self._write_atomic(path, compressed)
+        return digest, len(compressed)
+    
+    def _get_chunk(self, digest: str) -> List[List[str]]:
+        try:
+            with gzip.open(self._chunk_path(digest), 'rb') as f:
+                return json.loads(f.read().decode('utf-8'))
+        except (OSError, ValueError) as e:
+            raise Exception(f"Lỗi đọc bản sao lưu: khối {digest[:12]} bị thiếu hoặc hỏng ({str(e)})")
+    
+    # Snapshots
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """Get the manifests of every snapshot, newest first"""
+        if not self.manifest_dir.exists():
+            return []
+        manifests = []
+        for path in sorted(self.manifest_dir.glob('*.json'), reverse=True):
+            try:
+                manifests.append(json.loads(path.read_text(encoding='utf-8')))
+            except (OSError, ValueError):
+                continue
+        return manifests
+    
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Get the manifest of the newest snapshot"""
+        if not self.manifest_dir.exists():
+            return None
+        for path in sorted(self.manifest_dir.glob('*.json'), reverse=True):
+            try:
+                return json.loads(path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                continue
+        return None
+    
+    def get_snapshot(self, snapshot_id: str) -> Dict[str, Any]:
+        """Get the manifest of a snapshot"""
+        try:
+            return json.loads((self.manifest_dir / f"{snapshot_id}.json").read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            raise Exception(f"Không tìm thấy bản sao lưu {snapshot_id}: {str(e)}")
+    
+    def snapshot(self, values_by_name: Dict[str, List[List[str]]]) -> Optional[Dict[str, Any]]:
+        """Back up raw values (as read by read_all_values); returns the new manifest
+        
+        Ranges missing from values_by_name (failed reads) keep their
+        chunks from the previous snapshot. Returns None without writing a
+        manifest when nothing changed since the previous snapshot.
+        """
+        with self._lock:
+            previous = self.latest()
+            ranges = dict(previous['ranges']) if previous else {}
+            new_chunks = new_bytes = 0
+            
+            for name, values in values_by_name.items():
+                digests = []
+                for start in range(0, len(values), self.chunk_rows):
+                    digest, written = self._put_chunk(values[start:start + self.chunk_rows])
+                    digests.append(digest)
+                    if written:
+                        new_chunks += 1
+                        new_bytes += written
+                ranges[name] = {'rows': len(values), 'chunks': digests}
+            
+            self._last_run = datetime.now()
+            if previous and previous['ranges'] == ranges:
+                return None
+            
+            created_at = datetime.now()
+            manifest = {
+                'id': created_at.strftime('%Y%m%d-%H%M%S-%f'),
+                'created_at': created_at.isoformat(),
+                'sheet_id': self.sheet_id,
+                'chunk_rows': self.chunk_rows,
+                'ranges': ranges,
+                'new_chunks': new_chunks,
+                'new_bytes': new_bytes
+            }
+            self._write_atomic(
+                self.manifest_dir / f"{manifest['id']}.json",
+                json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+            )
+            self._prune()
+            return manifest
+    
+    def _prune(self):
+        """Drop manifests beyond the newest keep and the chunks no manifest uses (lock held)"""
+        if self.keep <= 0:
+            return
+        paths = sorted(self.manifest_dir.glob('*.json'), reverse=True)
+        if len(paths) <= self.keep:
+            return
+        for path in paths[self.keep:]:
+            path.unlink(missing_ok=True)
+        
+        used = {digest for manifest in self.list_snapshots()
+                for entry in manifest['ranges'].values() for digest in entry['chunks']}
+        for path in self.chunk_dir.glob('*/*.json.gz'):
+            if path.name[:-len('.json.gz')] not in used:
+                path.unlink(missing_ok=True)
+    
+    def is_due(self, interval_hours: float) -> bool:
+        """Check if the newest snapshot is older than interval_hours"""
+        latest = self.latest()
+        last = datetime.fromisoformat(latest['created_at']) if latest else None
+        if self._last_run and (last is None or self._last_run > last):
+            last = self._last_run
+        return last is None or datetime.now() - last >= timedelta(hours=interval_hours)
+    
+    def schedule(self, values_by_name: Dict[str, List[List[str]]], interval_hours: float) -> bool:
+        """Snapshot on a daemon thread if one is due and none is running; returns True if started
+        
+        values_by_name must not be modified afterwards (sync snapshots are
+        shared read-only, so they qualify).
+        """
+        if not FEATURES['auto_backup'] or not values_by_name:
+            return False
+        if self._worker and self._worker.is_alive():
+            return False
+        if not self.is_due(interval_hours):
+            return False
+        
+        def run():
+            try:
+                self.snapshot(values_by_name)
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Warning: Backup failed: {str(e)}")
+        
+        self._worker = threading.Thread(target=run, name=f"levelup-backup-{self.sheet_id[:8]}", daemon=True)
+        self._worker.start()
+        return True
+    
+    # Restore
+    def iter_chunks(self, snapshot_id: str, name: str) -> Generator[List[List[str]], None, None]:
+        """Stream one range of a snapshot as runs of rows, in order"""
+        entry = self.get_snapshot(snapshot_id)['ranges'].get(name)
+        if entry is None:
+            return
+        for digest in entry['chunks']:
+            yield self._get_chunk(digest)
+    
+    def load_values(self, snapshot_id: str) -> Dict[str, List[List[str]]]:
+        """Load every range of a snapshot into memory"""
+        manifest = self.get_snapshot(snapshot_id)
+        return {
+            name: [row for digest in entry['chunks'] for row in self._get_chunk(digest)]
+            for name, entry in manifest['ranges'].items()
+        }
+    
+    def restore_to_local_store(self, snapshot_id: str, local_store, names: Optional[List[str]] = None):
+        """Replace ranges of a LocalStore with a snapshot, streaming chunk by chunk"""
+        manifest = self.get_snapshot(snapshot_id)
+        for name in names or list(manifest['ranges']):
+            local_store.replace_rows(name, self.iter_chunks(snapshot_id, name))
+    
+    def restore_to_sheets(self, snapshot_id: str, manager, names: Optional[List[str]] = None,
+                          batch_rows: int = BACKUP_RESTORE_BATCH_ROWS):
+        """Overwrite ranges of the Google Sheet with a snapshot
+        
+        Every chunk is read once before anything is written, so a missing
+        or broken chunk fails the restore with the sheet untouched. Writes
+        queued for the restored tabs are dropped first, so they cannot land
+        on top of the restored rows. The rows are then written with
+        batchUpdate requests of about batch_rows rows, streamed from the
+        chunks and padded to the range width so no stale cells remain, and
+        only after that are the rows past each restored range cleared, in
+        one batchClear. A failure part way leaves old and restored rows
+        mixed, but never an empty sheet.
+        """
+        manifest = self.get_snapshot(snapshot_id)
+        names = [name for name in (names or list(manifest['ranges'])) if name in manager.ranges]
+        for name in names:
+            for _ in self.iter_chunks(snapshot_id, name):
+                pass
+        
+        manager.get_write_queue().discard(
+            {manager.ranges[name].split('!')[0] for name in names},
+            "Đã hủy vì dữ liệu được khôi phục từ bản sao lưu"
+        )
+        
+        updates: Dict[str, List[List[str]]] = {}
+        pending = 0
+        tails = []
+        for name in names:
+            width = range_width(manager.ranges[name])
+            offset = 0
+            for rows in self.iter_chunks(snapshot_id, name):
+                if rows:
+                    padded = [list(row) + [''] * (width - len(row)) for row in rows]
+                    updates[rows_range(manager.ranges[name], offset, len(rows))] = padded
+                    pending += len(rows)
+                offset += len(rows)
+                if pending >= batch_rows:
+                    manager.batch_update(updates)
+                    updates, pending = {}, 0
+            tail = rows_range(manager.ranges[name], offset)
+            if tail:
+                tails.append(tail)
+        if updates:
+            manager.batch_update(updates)
+        if tails:
+            manager.batch_clear(tails)
+
+def _column_number(column: str) -> int:
+    number = 0
+    for letter in column:
+        number = number * 26 + ord(letter) - ord('A') + 1
+    return number
+
+def range_width(range_name: str) -> int:
+    """Get the number of columns of an A1 range"""
+    match = A1_RANGE.match(range_name)
+    if not match:
+        raise Exception(f"Vùng dữ liệu không hợp lệ: {range_name}")
+    return _column_number(match.group('end_col')) - _column_number(match.group('start_col')) + 1
+
+def rows_range(range_name: str, offset: int, count: Optional[int] = None) -> Optional[str]:
+    """Get the A1 range of count rows starting offset rows into range_name
+    
+    Without count, the rest of range_name from offset (None if nothing is left).
+    """
+    match = A1_RANGE.match(range_name)
+    if not match:
+        raise Exception(f"Vùng dữ liệu không hợp lệ: {range_name}")
+    first = int(match.group('start_row')) + offset
+    if count is not None:
+        last = str(first + count - 1)
+    else:
+        last = match.group('end_row')
+        if last and int(last) < first:
+            return None
+    return f"{match.group('sheet')}!{match.group('start_col')}{first}:{match.group('end_col')}{last}"
+
+# Process-wide engines, one per sheet
+_engines: Dict[str, BackupEngine] = {}
+_engines_lock = threading.Lock()
+
+def get_backup_engine(sheet_id: str) -> BackupEngine:
+    """Get the shared backup engine for a sheet"""
+    with _engines_lock:
+        engine = _engines.get(sheet_id)
+        if engine is None:
+            engine = BackupEngine(sheet_id)
+            _engines[sheet_id] = engine
+        return engine
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Delta Sync for Level Up Application
+So sánh dấu vân tay từng dòng với lần đồng bộ trước, chỉ cập nhật những dòng thay đổi
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+@dataclass
+class RowDelta:
+    """Row indices that changed in one range since the previous sync"""
+    inserted: List[int] = field(default_factory=list)
+    updated: List[int] = field(default_factory=list)
+    deleted: List[int] = field(default_factory=list)
+    
+    def is_empty(self) -> bool:
+        """Check if nothing changed"""
+        return not (self.inserted or self.updated or self.deleted)
+    
+    def changed(self) -> List[int]:
+        """Get the indices whose rows must be parsed (inserted or updated)"""
+        return self.inserted + self.updated
+    
+    def __len__(self) -> int:
+        return len(self.inserted) + len(self.updated) + len(self.deleted)
+
+class RowFingerprints:
+    """Per-row hashes of each range as of the last applied sync
+    
+    Empty rows (no value in the first column) are skipped by every parser,
+    so they have no fingerprint: blanking a row counts as a delete and
+    filling one in counts as an insert.
+    """
+    
+    def __init__(self):
+        self._hashes: Dict[str, Dict[int, int]] = {}
+    
+    def has(self, name: str) -> bool:
+        """Check if a range has a baseline to diff against"""
+        return name in self._hashes
+    
+    def reset(self, name: Optional[str] = None):
+        """Drop the baseline of one range, or of every range"""
+        if name is None:
+            self._hashes.clear()
+        else:
+            self._hashes.pop(name, None)
+    
+    @staticmethod
+    def _hash_rows(values: List[List[str]]) -> Dict[int, int]:
+        return {i: hash(tuple(row)) for i, row in enumerate(values) if row and row[0]}
+    
+    def remember(self, name: str, values: List[List[str]]):
+        """Record values as the new baseline without diffing"""
+        self._hashes[name] = self._hash_rows(values)
+    
+    def diff(self, name: str, values: List[List[str]]) -> RowDelta:
+        """Compare values with the baseline and make them the new baseline"""
+        old = self._hashes.get(name, {})
+        new = self._hash_rows(values)
+        self._hashes[name] = new
+        
+        delta = RowDelta()
+        for i, row_hash in new.items():
+            previous = old.get(i)
+            if previous is None:
+                delta.inserted.append(i)
+            elif previous != row_hash:
+                delta.updated.append(i)
+        delta.deleted = [i for i in old if i not in new]
+        return delta
+
+def _search(records: List[Any], record_id: int, get_id: Callable[[Any], int]) -> int:
+    """Binary search for the position of record_id in a list sorted by id"""
+    lo, hi = 0, len(records)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if get_id(records[mid]) < record_id:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def patch_sorted(records: List[Any], changes: Dict[int, Any], get_id: Callable[[Any], int]) -> List[Any]:
+    """Patch a list kept in id order in place
+    
+    changes maps record id to the new record, or to None for a deleted row.
+    Existing ids are replaced in their slot and new ids are inserted at
+    their sorted position, so each change costs a binary search. Returns
+    the records that were replaced or deleted.
+    """
+    removed = []
+    for record_id in sorted(changes):
+        record = changes[record_id]
+        pos = _search(records, record_id, get_id)
+        exists = pos < len(records) and get_id(records[pos]) == record_id
+        if exists:
+            removed.append(records[pos])
+        
+        if record is None:
+            if exists:
+                del records[pos]
+        elif exists:
+            records[pos] = record
+        else:
+            records.insert(pos, record)
+    return removed
+
+def patch_unordered(records: List[Any], changes: Dict[int, Any], get_id: Callable[[Any], int]) -> List[Any]:
+    """Patch a list that is not in id order in place
+    
+    Replaced records keep their slot, new ids are appended and deleted ids
+    are removed. Callers re-sort afterwards if the list has its own order.
+    Returns the records that were replaced or deleted.
+    """
+    positions = {get_id(record): pos for pos, record in enumerate(records) if get_id(record) in changes}
+    removed = [records[pos] for pos in positions.values()]
+    
+    deleted = set()
+    for record_id, record in changes.items():
+        pos = positions.get(record_id)
+        if record is None:
+            if pos is not None:
+                deleted.add(pos)
+        elif pos is not None:
+            records[pos] = record
+        else:
+            records.append(record)
+    
+    if deleted:
+        records[:] = [record for pos, record in enumerate(records) if pos not in deleted]
+    return removed
+
+def patch_grouped(groups: Dict[str, List[Any]], changes: Dict[int, Optional[Tuple[str, Any]]],
+                  get_id: Callable[[Any], int]) -> List[Tuple[str, Any]]:
+    """Patch a dict of id-ordered lists (records grouped by key) in place
+    
+    changes maps record id to (group key, record), or to None for a deleted
+    row. A changed record is removed from whatever group held it and
+    re-inserted into its new group, so renaming the key moves it. Returns
+    the (group key, record) pairs that were replaced or deleted.
+    """
+    removed = []
+    for key, records in groups.items():
+        if any(get_id(record) in changes for record in records):
+            removed.extend((key, record) for record in records if get_id(record) in changes)
+            records[:] = [record for record in records if get_id(record) not in changes]
+    
+    for record_id in sorted(changes):
+        change = changes[record_id]
+        if change is not None:
+            key, record = change
+            patch_sorted(groups.setdefault(key, []), {record_id: record}, get_id)
+    return removed
\ No newline at end of file
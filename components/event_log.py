@@ -0,0 +1,199 @@
+"""
+Event Log for Level Up Application
+Nhật ký sự kiện nhị phân chỉ ghi thêm (mmap) cho hoàn thành nhiệm vụ, EXP, lên cấp, chỉ số và chi tiết nguồn vốn
+"""
+
+import mmap
+import re
+import struct
+import threading
+import time
+import zlib
+from datetime import date, datetime
+from enum import IntEnum
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Union
+
+from config import DATA_DIR
+
+class EventKind(IntEnum):
+    QUEST_COMPLETED = 1  # ref: quest id, value: reward EXP
+    EXP_DELTA = 2        # ref: level after the change, value: EXP gained (negative when spent)
+    LEVEL_UP = 3         # ref: new level, value: levels gained
+    STAT_DELTA = 4       # code: stat position in STATS_CONFIG, value: points gained
+    DETAIL_ADDED = 5     # code: detail type position in RESOURCE_TYPES, ref: name_code(resource name), amount: detail amount
+
+class Event(NamedTuple):
+    """One fixed-size log record"""
+    time: float  # seconds since the epoch
+    kind: int
+    code: int = 0
+    ref: int = 0
+    value: int = 0
+    amount: float = 0.0
+    
+    @property
+    def when(self) -> datetime:
+        return datetime.fromtimestamp(self.time)
+
+# time, kind, code, 2 pad bytes, ref, value, amount: 32 bytes, little-endian
+RECORD = struct.Struct('<dBB2xiqd')
+# magic, record count
+HEADER = struct.Struct('<8sQ')
+MAGIC = b'LVLEVT01'
+# Records copied out per lock hold while replaying
+REPLAY_BATCH = 4096
+INITIAL_CAPACITY = 1024
+
+TimeLike = Union[float, datetime, date]
+
+def name_code(name: str) -> int:
+    """Stable 32-bit code of a name for the ref field (CRC-32, signed)
+    
+    Unlike a list position it does not change when the list is reordered
+    or synced, so old records keep pointing at the same name.
+    """
+    code = zlib.crc32(name.encode('utf-8'))
+    return code - (1 << 32) if code >= 1 << 31 else code
+
+def _timestamp(value: TimeLike) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day).timestamp()
+    return float(value)
+
+class EventLog:
+    """Append-only file of fixed-size event records, memory-mapped
+    
+    Record i lives at HEADER.size + i * RECORD.size, and the header holds
+    the number of committed records, updated after the records are
+    written, so readers never see a half-written record. Timestamps
+    never go backwards (a clock step back reuses the last time), so the
+    file is its own offset index: time-range queries bisect on the record
+    timestamps and then read sequentially. The file grows by doubling.
+    Every append is flushed to disk before it returns.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        exists = self.path.exists() and self.path.stat().st_size >= HEADER.size
+        self._file = open(self.path, 'r+b' if exists else 'w+b')
+        if not exists:
+            self._file.truncate(HEADER.size + INITIAL_CAPACITY * RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        
+        if exists:
+            magic, count = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise Exception(f"Lỗi đọc nhật ký sự kiện: {self.path.name} không đúng định dạng")
+            self._count = min(count, (len(self._map) - HEADER.size) // RECORD.size)
+        else:
+            self._count = 0
+            HEADER.pack_into(self._map, 0, MAGIC, 0)
+        self._last_time = self._time_at(self._count - 1) if self._count else 0.0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def _time_at(self, i: int) -> float:
+        return struct.unpack_from('<d', self._map, HEADER.size + i * RECORD.size)[0]
+    
+    def _reserve(self, count: int):
+        """Grow the file to hold count records (lock held)"""
+        needed = HEADER.size + count * RECORD.size
+        if needed <= len(self._map):
+            return
+        size = len(self._map)
+        while size < needed:
+            size = HEADER.size + (size - HEADER.size) * 2
+        self._map.close()
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+    
+    def append(self, kind: int, code: int = 0, ref: int = 0, value: int = 0, amount: float = 0.0,
+               at: Optional[float] = None) -> Event:
+        """Append one event (at defaults to now); returns the stored record"""
+        return self.append_many([Event(at if at is not None else time.time(), kind, code, ref, value, amount)])[0]
+    
+    def append_many(self, events: List[Event]) -> List[Event]:
+        """Append several events with one header update; returns the stored records"""
+        stored = []
+        with self._lock:
+            self._reserve(self._count + len(events))
+            offset = HEADER.size + self._count * RECORD.size
+            for event in events:
+                self._last_time = max(self._last_time, event.time)
+                event = event._replace(time=self._last_time)
+                RECORD.pack_into(self._map, offset, *event)
+                offset += RECORD.size
+                stored.append(event)
+            self._count += len(events)
+            HEADER.pack_into(self._map, 0, MAGIC, self._count)
+            # Appends are rare (one per user action), so pay for durability each time
+            self._map.flush()
+        return stored
+    
+    def flush(self):
+        """Write the mapped pages to disk"""
+        with self._lock:
+            self._map.flush()
+    
+    def replay(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Event]:
+        """Iterate the records from position start to stop, in order"""
+        stop = self._count if stop is None else min(stop, self._count)
+        position = max(0, start)
+        while position < stop:
+            end = min(stop, position + REPLAY_BATCH)
+            with self._lock:
+                data = self._map[HEADER.size + position * RECORD.size:HEADER.size + end * RECORD.size]
+            for record in RECORD.iter_unpack(data):
+                yield Event(*record)
+            position = end
+    
+    def position_at(self, at: TimeLike) -> int:
+        """Get the position of the first record at or after a time"""
+        timestamp = _timestamp(at)
+        with self._lock:
+            low, high = 0, self._count
+            while low < high:
+                middle = (low + high) // 2
+                if self._time_at(middle) < timestamp:
+                    low = middle + 1
+                else:
+                    high = middle
+            return low
+    
+    def between(self, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None) -> Iterator[Event]:
+        """Iterate the records with start <= time < end"""
+        first = self.position_at(start) if start is not None else 0
+        last = self.position_at(end) if end is not None else None
+        return self.replay(first, last)
+    
+    def daily_totals(self, kind: int, start: Optional[TimeLike] = None,
+                     end: Optional[TimeLike] = None) -> Dict[date, int]:
+        """Sum the values of one kind of event per day, e.g. EXP gained per day"""
+        totals: Dict[date, int] = {}
+        for event in self.between(start, end):
+            if event.kind == kind:
+                day = event.when.date()
+                totals[day] = totals.get(day, 0) + event.value
+        return totals
+
+# Process-wide logs, one per sheet
+_logs: Dict[str, EventLog] = {}
+_logs_lock = threading.Lock()
+
+def get_event_log(sheet_id: str = '', data_dir: Path = DATA_DIR) -> EventLog:
+    """Get the shared event log of a sheet ('' for data not linked to a sheet)"""
+    safe_id = re.sub(r'[^A-Za-z0-9_-]', '_', sheet_id) or 'default'
+    path = Path(data_dir) / f"events_{safe_id}.log"
+    with _logs_lock:
+        log = _logs.get(str(path))
+        if log is None:
+            log = EventLog(path)
+            _logs[str(path)] = log
+        return log
\ No newline at end of file
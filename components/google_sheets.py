@@ -1,366 +1,475 @@
-import gspread
-import json
-import requests
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-
-class GoogleSheetsManager:
-    """Manager for Google Sheets integration"""
-    
-    def __init__(self, sheet_id: str, api_key: str):
-        self.sheet_id = sheet_id
-        self.api_key = api_key
-        self.base_url = f"https://sheets.googleapis.com/v4/spreadsheets/{sheet_id}"
-        
-        # Sheet ranges
-        self.ranges = {
-            'character': 'Character!A1:B25',
-            'quests': 'Quests!A2:K1000',
-            'achievements': 'Achievements!A2:I1000',
-            'goals': 'Goals!A1:E100',
-            'resources': 'Resources!A2:F10',
-            'resource_details': 'ResourceDetails!A2:G1000',
-            'chat': 'Chat!A2:E1000'
-        }
-    
-    def _make_request(self, endpoint: str, method: str = 'GET', data: Dict = None) -> Dict:
-        """Make HTTP request to Google Sheets API"""
-        url = f"{self.base_url}{endpoint}?key={self.api_key}"
-        
-        headers = {'Content-Type': 'application/json'}
-        
-        try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers)
-            elif method == 'PUT':
-                response = requests.put(url, headers=headers, json=data)
-            elif method == 'POST':
-                response = requests.post(url, headers=headers, json=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            if response.status_code == 403:
-                raise Exception("API Key không hợp lệ hoặc không có quyền truy cập")
-            elif response.status_code == 404:
-                raise Exception("Không tìm thấy Google Sheet với ID này")
-            else:
-                raise Exception(f"Lỗi kết nối: {str(e)}")
-    
-    def test_connection(self) -> bool:
-        """Test connection to Google Sheets"""
-        try:
-            self._make_request("")
-            return True
-        except Exception as e:
-            raise e
-    
-    def read_range(self, range_name: str) -> List[List[str]]:
-        """Read data from a specific range"""
-        try:
-            endpoint = f"/values/{range_name}"
-            response = self._make_request(endpoint)
-            return response.get('values', [])
-        except Exception as e:
-            print(f"Warning: Could not read range {range_name}: {str(e)}")
-            return []
-    
-    def write_range(self, range_name: str, values: List[List[str]]) -> bool:
-        """Write data to a specific range"""
-        try:
-            endpoint = f"/values/{range_name}?valueInputOption=RAW"
-            data = {'values': values}
-            self._make_request(endpoint, method='PUT', data=data)
-            return True
-        except Exception as e:
-            raise Exception(f"Lỗi ghi dữ liệu: {str(e)}")
-    
-    def append_row(self, range_name: str, values: List[str]) -> bool:
-        """Append a row to a sheet"""
-        try:
-            endpoint = f"/values/{range_name}:append?valueInputOption=RAW"
-            data = {'values': [values]}
-            self._make_request(endpoint, method='POST', data=data)
-            return True
-        except Exception as e:
-            raise Exception(f"Lỗi thêm dữ liệu: {str(e)}")
-    
-    def read_character(self) -> Optional[Dict]:
-        """Read character data from sheet"""
-        try:
-            data = self.read_range(self.ranges['character'])
-            if not data:
-                return None
-            
-            character = {
-                'name': '',
-                'avatar': '',
-                'birth_year': None,
-                'level': 1,
-                'exp': 0,
-                'exp_to_next': 100,
-                'stats': {'WILL': 10, 'PHY': 10, 'MEN': 10, 'AWR': 10, 'EXE': 10}
-            }
-            
-            for row in data:
-                if len(row) >= 2:
-                    key, value = row[0], row[1]
-                    
-                    if key == 'name':
-                        character['name'] = value
-                    elif key == 'avatar':
-                        character['avatar'] = value
-                    elif key == 'birthYear':
-                        try:
-                            character['birth_year'] = int(value) if value else None
-                        except ValueError:
-                            character['birth_year'] = None
-                    elif key in ['level', 'exp', 'expToNext']:
-                        try:
-                            character[key.replace('expToNext', 'exp_to_next')] = int(value)
-                        except ValueError:
-                            pass
-                    elif key == 'stats':
-                        try:
-                            character['stats'] = json.loads(value) if value else character['stats']
-                        except json.JSONDecodeError:
-                            pass
-            
-            return character
-            
-        except Exception as e:
-            print(f"Warning: Could not read character data: {str(e)}")
-            return None
-    
-    def update_character(self, character) -> bool:
-        """Update character data in sheet"""
-        try:
-            values = [
-                ['name', character.name],
-                ['avatar', character.avatar],
-                ['birthYear', str(character.birth_year) if character.birth_year else ''],
-                ['level', str(character.level)],
-                ['exp', str(character.exp)],
-                ['expToNext', str(character.exp_to_next)],
-                ['stats', json.dumps(character.stats)]
-            ]
-            return self.write_range('Character!A1:B7', values)
-        except Exception as e:
-            raise Exception(f"Lỗi cập nhật nhân vật: {str(e)}")
-    
-    def read_quests(self) -> List[Dict]:
-        """Read quests data from sheet"""
-        try:
-            data = self.read_range(self.ranges['quests'])
-            quests = []
-            
-            for i, row in enumerate(data):
-                if len(row) > 0 and row[0]:  # Skip empty rows
-                    quest = {
-                        'id': i + 1,
-                        'title': row[0] if len(row) > 0 else '',
-                        'description': row[1] if len(row) > 1 else '',
-                        'required_stat': row[2] if len(row) > 2 else 'WILL',
-                        'difficulty': max(1, min(5, int(row[3]) if len(row) > 3 and row[3].isdigit() else 1)),
-                        'deadline': row[4] if len(row) > 4 else '',
-                        'reward_exp': int(row[5]) if len(row) > 5 and row[5].isdigit() else 0,
-                        'reward_stat': row[6] if len(row) > 6 else '',
-                        'status': row[7] if len(row) > 7 and row[7] in ['todo', 'in-progress', 'completed'] else 'todo',
-                        'category': row[8] if len(row) > 8 else 'general',
-                        'priority': row[9] if len(row) > 9 and row[9] in ['high', 'medium', 'low'] else 'medium'
-                    }
-                    quests.append(quest)
-            
-            return quests
-            
-        except Exception as e:
-            print(f"Warning: Could not read quests: {str(e)}")
-            return []
-    
-    def update_quest(self, quest) -> bool:
-        """Update a specific quest in sheet"""
-        try:
-            # Find quest row and update
-            quest_row = [
-                quest.title, quest.description, quest.required_stat,
-                str(quest.difficulty), quest.deadline, str(quest.reward_exp),
-                quest.reward_stat, quest.status, quest.category, quest.priority
-            ]
-            
-            range_name = f"Quests!A{quest.id + 1}:J{quest.id + 1}"
-            return self.write_range(range_name, [quest_row])
-            
-        except Exception as e:
-            raise Exception(f"Lỗi cập nhật nhiệm vụ: {str(e)}")
-    
-    def read_achievements(self) -> List[Dict]:
-        """Read achievements data from sheet"""
-        try:
-            data = self.read_range(self.ranges['achievements'])
-            achievements = []
-            
-            for i, row in enumerate(data):
-                if len(row) > 0 and row[0]:  # Skip empty rows
-                    achievement = {
-                        'id': i + 1,
-                        'title': row[0] if len(row) > 0 else '',
-                        'description': row[1] if len(row) > 1 else '',
-                        'icon': row[2] if len(row) > 2 else '🏆',
-                        'tier': row[3] if len(row) > 3 and row[3] in ['bronze', 'silver', 'gold', 'legendary'] else 'bronze',
-                        'unlocked': row[4] in ['TRUE', 'true', True] if len(row) > 4 else False,
-                        'unlocked_date': row[5] if len(row) > 5 else '',
-                        'progress': max(0, min(100, int(row[6]) if len(row) > 6 and row[6].isdigit() else 0)),
-                        'condition': row[7] if len(row) > 7 else '',
-                        'category': row[8] if len(row) > 8 else 'general'
-                    }
-                    achievements.append(achievement)
-            
-            return achievements
-            
-        except Exception as e:
-            print(f"Warning: Could not read achievements: {str(e)}")
-            return []
-    
-    def read_resources(self) -> List[Dict]:
-        """Read resources data from sheet"""
-        try:
-            data = self.read_range(self.ranges['resources'])
-            resources = []
-            
-            for row in data:
-                if len(row) > 0 and row[0]:
-                    resource = {
-                        'name': row[0],
-                        'level': max(1, int(row[1]) if len(row) > 1 and row[1].isdigit() else 1),
-                        'progress': max(0, min(100, int(row[2]) if len(row) > 2 and row[2].isdigit() else 0)),
-                        'next_milestone': row[3] if len(row) > 3 else '',
-                        'related_quests': int(row[4]) if len(row) > 4 and row[4].isdigit() else 0
-                    }
-                    resources.append(resource)
-            
-            return resources
-            
-        except Exception as e:
-            print(f"Warning: Could not read resources: {str(e)}")
-            return []
-    
-    def read_resource_details(self) -> Dict[str, List[Dict]]:
-        """Read resource details data from sheet"""
-        try:
-            data = self.read_range(self.ranges['resource_details'])
-            details = {}
-            
-            for i, row in enumerate(data):
-                if len(row) > 0 and row[0]:
-                    resource_name = row[0]
-                    if resource_name not in details:
-                        details[resource_name] = []
-                    
-                    detail = {
-                        'id': i + 1,
-                        'name': row[1] if len(row) > 1 else '',
-                        'amount': float(row[2]) if len(row) > 2 and row[2].replace('.', '').isdigit() else 0,
-                        'type': row[3] if len(row) > 3 and row[3] in ['asset', 'loan', 'investment', 'income', 'expense'] else 'asset',
-                        'notes': row[4] if len(row) > 4 else '',
-                        'date': row[5] if len(row) > 5 else datetime.now().strftime('%d/%m/%Y'),
-                        'status': row[6] if len(row) > 6 else 'active'
-                    }
-                    details[resource_name].append(detail)
-            
-            return details
-            
-        except Exception as e:
-            print(f"Warning: Could not read resource details: {str(e)}")
-            return {}
-    
-    def add_resource_detail(self, resource_name: str, detail: Dict) -> bool:
-        """Add a new resource detail"""
-        try:
-            values = [
-                resource_name,
-                detail['name'],
-                str(detail['amount']),
-                detail['type'],
-                detail['notes'],
-                detail['date'],
-                detail['status']
-            ]
-            return self.append_row('ResourceDetails!A:G', values)
-        except Exception as e:
-            raise Exception(f"Lỗi thêm chi tiết: {str(e)}")
-    
-    def read_chat(self) -> List[Dict]:
-        """Read chat messages from sheet"""
-        try:
-            data = self.read_range(self.ranges['chat'])
-            messages = []
-            
-            for i, row in enumerate(data):
-                if len(row) > 0 and row[0]:
-                    message = {
-                        'id': i + 1,
-                        'text': row[0],
-                        'timestamp': row[1] if len(row) > 1 else '',
-                        'type': row[2] if len(row) > 2 and row[2] in ['note', 'reminder', 'achievement'] else 'note',
-                        'date': row[3] if len(row) > 3 else '',
-                        'author': row[4] if len(row) > 4 else 'user'
-                    }
-                    messages.append(message)
-            
-            # Sort by date and time
-            messages.sort(key=lambda x: (x['date'], x['timestamp']))
-            return messages
-            
-        except Exception as e:
-            print(f"Warning: Could not read chat: {str(e)}")
-            return []
-    
-    def add_chat_message(self, message: Dict) -> bool:
-        """Add a new chat message"""
-        try:
-            values = [
-                message['text'],
-                message['timestamp'],
-                message['type'],
-                message['date'],
-                message['author']
-            ]
-            return self.append_row('Chat!A:E', values)
-        except Exception as e:
-            raise Exception(f"Lỗi thêm tin nhắn: {str(e)}")
-    
-    def read_goals(self) -> Optional[Dict]:
-        """Read goals data from sheet"""
-        try:
-            data = self.read_range(self.ranges['goals'])
-            goals = {
-                'mission': '',
-                'yearly': [],
-                'quarterly': [],
-                'monthly': []
-            }
-            
-            for row in data:
-                if len(row) >= 2:
-                    goal_type = row[0]
-                    title = row[1]
-                    
-                    if goal_type == 'mission' and title:
-                        goals['mission'] = title
-                    elif goal_type in ['yearly', 'quarterly', 'monthly'] and title:
-                        goal = {
-                            'title': title,
-                            'progress': max(0, min(100, int(row[2]) if len(row) > 2 and row[2].isdigit() else 0)),
-                            'deadline': row[3] if len(row) > 3 else '',
-                            'category': row[4] if len(row) > 4 else 'general'
-                        }
-                        goals[goal_type].append(goal)
-            
-            return goals
-            
-        except Exception as e:
-            print(f"Warning: Could not read goals: {str(e)}")
-            return None
\ No newline at end of file
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
+
+from config import (REQUEST_TIMEOUT, HTTP_POOL_SIZE, HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR,
+                    READ_WINDOW_ROWS, SYNC_MAX_WORKERS, SYNC_RANGE_TIMEOUT)
+from utils.rate_limiter import RateLimitExceeded, TokenBucket, get_rate_limiter
+from utils.retry_policy import RETRYABLE_STATUS_CODES, UnconfirmedWriteError, backoff_delay, is_idempotent
+from utils.sheet_cache import SheetCache, get_sheet_cache
+from components.local_store import get_local_store
+from components.sheet_data import SheetDataMixin, CHARACTER_WRITE_RANGE, CHAT_APPEND_RANGE, RESOURCE_DETAILS_APPEND_RANGE
+
+if TYPE_CHECKING:
+    # Only for annotations; requests is imported on first use to keep startup light
+    import requests
+
+def _request_not_sent(error: Exception) -> bool:
+    """Check if a requests error happened before the request reached the server"""
+    import requests
+    from urllib3.exceptions import NewConnectionError
+    
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    # Refused connections and failed DNS lookups never send anything
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+# Bounded pool shared by every manager for per-range fallback reads
+_fetch_executor: Optional[ThreadPoolExecutor] = None
+_fetch_executor_lock = threading.Lock()
+
+def _get_fetch_executor() -> ThreadPoolExecutor:
+    """Get the process-wide thread pool for concurrent range reads"""
+    global _fetch_executor
+    with _fetch_executor_lock:
+        if _fetch_executor is None:
+            _fetch_executor = ThreadPoolExecutor(max_workers=SYNC_MAX_WORKERS, thread_name_prefix="levelup-fetch")
+        return _fetch_executor
+
+class GoogleSheetsManager(SheetDataMixin):
+    """Manager for Google Sheets integration"""
+    
+    def __init__(self, sheet_id: str, api_key: str,
+                 pool_size: int = HTTP_POOL_SIZE,
+                 timeout: float = REQUEST_TIMEOUT,
+                 max_retries: int = HTTP_MAX_RETRIES,
+                 backoff_factor: float = HTTP_BACKOFF_FACTOR,
+                 rate_limiter: Optional[TokenBucket] = None,
+                 window_rows: int = READ_WINDOW_ROWS,
+                 cache: Optional[SheetCache] = None):
+        self.sheet_id = sheet_id
+        self.api_key = api_key
+        self.base_url = f"https://sheets.googleapis.com/v4/spreadsheets/{sheet_id}"
+        
+        # HTTP settings; the session is created on the first request
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.pool_size = pool_size
+        self._session = None
+        
+        # Shared across sessions so the whole process stays under the quota
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.last_rate_limit_wait = 0.0
+        
+        # Shared across sessions so tabs open on the same sheet reuse one read
+        self.cache = cache or get_sheet_cache()
+        
+        # Local SQLite mirror, refreshed by read_all() and by local writes
+        self.local_store = get_local_store(sheet_id)
+        
+        # Ranges and parsers
+        self._init_sheet_data(window_rows)
+    
+    @property
+    def session(self) -> "requests.Session":
+        """Keep-alive HTTP session, created on first use"""
+        if self._session is None:
+            self._session = self._create_session(self.pool_size)
+        return self._session
+    
+    def _create_session(self, pool_size: int) -> "requests.Session":
+        """Create a keep-alive session with a bounded connection pool"""
+        # requests is only imported once the app actually talks to Google,
+        # so pages served from the local store don't pay for it
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('https://', adapter)
+        session.headers.update({'Content-Type': 'application/json'})
+        return session
+    
+    def close(self):
+        """Close pooled connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Exponential backoff with full jitter, honoring Retry-After when sent"""
+        return backoff_delay(attempt, self.backoff_factor, retry_after)
+    
+    def _make_request(self, endpoint: str, method: str = 'GET', data: Dict = None, params: Dict = None) -> Dict:
+        """Make HTTP request to Google Sheets API
+        
+        Idempotent requests are retried on connection errors, timeouts and
+        RETRYABLE_STATUS_CODES. Others (values:append) are retried only when
+        they certainly were not applied: a 429, or a connection that could
+        not be opened. Any other failure raises UnconfirmedWriteError.
+        """
+        import requests
+        
+        if method not in ('GET', 'PUT', 'POST'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        url = f"{self.base_url}{endpoint}"
+        query = {'key': self.api_key}
+        if params:
+            query.update(params)
+        idempotent = is_idempotent(method, endpoint)
+        
+        response = None
+        for attempt in range(self.max_retries + 1):
+            # Raises RateLimitExceeded when the queue is too long
+            self.last_rate_limit_wait = self.rate_limiter.acquire()
+            
+            try:
+                response = self.session.request(method, url, params=query, json=data, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not idempotent and not _request_not_sent(e):
+                    raise UnconfirmedWriteError(f"Lỗi kết nối: {str(e)}")
+                if attempt >= self.max_retries:
+                    raise Exception(f"Lỗi kết nối: {str(e)}")
+                time.sleep(self._backoff_delay(attempt))
+                continue
+            
+            retryable = response.status_code in RETRYABLE_STATUS_CODES and (idempotent or response.status_code == 429)
+            if retryable and attempt < self.max_retries:
+                time.sleep(self._backoff_delay(attempt, response.headers.get('Retry-After')))
+                continue
+            break
+        
+        if not idempotent and response.status_code >= 500:
+            raise UnconfirmedWriteError(f"Lỗi kết nối: {response.status_code}")
+        
+        try:
+            response.raise_for_status()
+            return response.json()
+            
+        except requests.exceptions.RequestException as e:
+            if response.status_code == 403:
+                raise Exception("API Key không hợp lệ hoặc không có quyền truy cập")
+            elif response.status_code == 404:
+                raise Exception("Không tìm thấy Google Sheet với ID này")
+            else:
+                raise Exception(f"Lỗi kết nối: {str(e)}")
+    
+    def test_connection(self) -> bool:
+        """Test connection to Google Sheets"""
+        try:
+            self._make_request("")
+            return True
+        except Exception as e:
+            raise e
+    
+    def read_range(self, range_name: str) -> List[List[str]]:
+        """Read data from a specific range"""
+        try:
+            endpoint = f"/values/{range_name}"
+            response = self._make_request(endpoint)
+            return response.get('values', [])
+        except Exception as e:
+            print(f"Warning: Could not read range {range_name}: {str(e)}")
+            return []
+    
+    def write_range(self, range_name: str, values: List[List[str]]) -> bool:
+        """Write data to a specific range"""
+        try:
+            endpoint = f"/values/{range_name}"
+            data = {'values': values}
+            self._make_request(endpoint, method='PUT', data=data, params={'valueInputOption': 'RAW'})
+            self._invalidate(range_name)
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi ghi dữ liệu: {str(e)}")
+    
+    def append_row(self, range_name: str, values: List[str]) -> bool:
+        """Append a row to a sheet"""
+        return self.append_rows(range_name, [values])
+    
+    def append_rows(self, range_name: str, rows: List[List[str]]) -> bool:
+        """Append several rows to a sheet in one request"""
+        try:
+            endpoint = f"/values/{range_name}:append"
+            data = {'values': rows}
+            self._make_request(endpoint, method='POST', data=data, params={'valueInputOption': 'RAW'})
+            self._invalidate(range_name)
+            return True
+        except UnconfirmedWriteError as e:
+            # The rows may be in the sheet already, so callers must not blindly resend them
+            self._invalidate(range_name)
+            raise UnconfirmedWriteError(f"Lỗi thêm dữ liệu: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Lỗi thêm dữ liệu: {str(e)}")
+    
+    def batch_update(self, updates: Dict[str, List[List[str]]]) -> bool:
+        """Write several ranges in one values:batchUpdate request"""
+        try:
+            data = {
+                'valueInputOption': 'RAW',
+                'data': [{'range': range_name, 'values': values} for range_name, values in updates.items()]
+            }
+            self._make_request("/values:batchUpdate", method='POST', data=data)
+            for range_name in updates:
+                self._invalidate(range_name)
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi ghi dữ liệu: {str(e)}")
+    
+    def batch_clear(self, range_names: List[str]) -> bool:
+        """Clear several ranges in one values:batchClear request"""
+        try:
+            self._make_request("/values:batchClear", method='POST', data={'ranges': range_names})
+            for range_name in range_names:
+                self._invalidate(range_name)
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi xóa dữ liệu: {str(e)}")
+    
+    def get_write_queue(self):
+        """Get the process-wide write-behind queue for this sheet"""
+        from components.write_queue import get_write_queue
+        return get_write_queue(self)
+    
+    def _invalidate(self, range_name: str):
+        """Drop the cached reads of the tab a write went to"""
+        self.cache.invalidate(self.sheet_id, range_name.split('!')[0])
+    
+    def _fetch_ranges(self, ranges: List[str]) -> List[List[List[str]]]:
+        """Fetch several A1 ranges with one values:batchGet request"""
+        response = self._make_request("/values:batchGet", params={'ranges': ranges})
+        value_ranges = response.get('valueRanges', [])
+        return [value_ranges[i].get('values', []) if i < len(value_ranges) else [] for i in range(len(ranges))]
+    
+    def _batch_get(self, ranges: List[str], refresh: bool = False) -> List[List[List[str]]]:
+        """Get several A1 ranges through the shared cache, fetching the missing ones in one batchGet"""
+        keys = [(self.sheet_id, range_name) for range_name in ranges]
+        values = self.cache.get_many(
+            keys,
+            lambda missing: self._fetch_ranges([range_name for _, range_name in missing]),
+            refresh=refresh
+        )
+        return [values[key] for key in keys]
+    
+    def fetch_all_values(self, names: Optional[List[str]] = None, refresh: bool = False) -> Dict[str, List[List[str]]]:
+        """Fetch the raw values of the given ranges (default: all of self.ranges)
+        
+        Bounded ranges are read whole. Open-ended ranges are read in windows
+        of window_rows rows until a window comes back empty; each round asks
+        for the next window of every range still going in one batchGet, so
+        a sheet of n rows costs about n / window_rows + 1 requests however
+        many tabs there are. Rows keep their position in the range, so the
+        blank rows the API trims from the end of a window are padded back
+        in when a later window has data.
+        
+        Windows come from the process-wide cache when fresh; refresh=True
+        skips cached entries and re-reads (and re-caches) every window.
+        """
+        rounds = self._paginate(list(self.ranges) if names is None else names)
+        try:
+            batch = next(rounds)
+            while True:
+                batch = rounds.send(self._batch_get(list(batch.values()), refresh))
+        except StopIteration as done:
+            return done.value
+    
+    def read_values(self, name: str) -> List[List[str]]:
+        """Read the raw values of one range in self.ranges, paginating if open-ended"""
+        try:
+            return self.fetch_all_values([name])[name]
+        except Exception as e:
+            print(f"Warning: Could not read range {self.ranges[name]}: {str(e)}")
+            return []
+    
+    def fetch_values_concurrently(self, names: Optional[List[str]] = None, refresh: bool = False,
+                                  timeout: float = SYNC_RANGE_TIMEOUT) -> Tuple[Dict[str, List[List[str]]], Dict[str, str]]:
+        """Fetch each range with its own request on the shared thread pool
+        
+        Used when a batchGet covering every range fails. Wall-clock time is
+        bounded by the slowest range (at most timeout seconds); ranges that
+        fail or time out are left out of the values and reported in the
+        returned errors dict instead of failing the whole sync.
+        """
+        names = list(self.ranges) if names is None else names
+        executor = _get_fetch_executor()
+        futures = {executor.submit(self.fetch_all_values, [name], refresh): name for name in names}
+        done, not_done = wait(futures, timeout=timeout)
+        
+        values, errors = {}, {}
+        for future in done:
+            name = futures[future]
+            try:
+                values[name] = future.result()[name]
+            except Exception as e:
+                errors[name] = str(e)
+        for future in not_done:
+            future.cancel()
+            errors[futures[future]] = f"Quá thời gian chờ ({timeout:.0f} giây)"
+        
+        return values, errors
+    
+    def read_all(self, refresh: bool = False) -> Dict[str, Any]:
+        """Read every range in self.ranges with batched values:batchGet requests
+        
+        Returns a dict keyed like self.ranges holding the output of the
+        matching per-sheet parser (same shapes as the read_* methods).
+        Ranges that could not be read are left out.
+        The raw values are also written to the local store.
+        """
+        values, _ = self.read_all_values(refresh)
+        return self.parse_all(values)
+    
+    def read_all_values(self, refresh: bool = False) -> Tuple[Dict[str, List[List[str]]], Dict[str, str]]:
+        """Fetch the raw values of every range and mirror them to the local store
+        
+        Tries one batched read first and falls back to concurrent per-range
+        reads if it fails. Returns (values, errors) where errors maps the
+        names of ranges that could not be read to a message; raises only if
+        no range could be read at all. The local store is left alone when
+        queued writes may be missing from the values.
+        """
+        started = time.monotonic()
+        try:
+            values, errors = self.fetch_all_values(refresh=refresh), {}
+        except RateLimitExceeded:
+            # Fanning out would only make the queue longer
+            raise
+        except Exception as e:
+            print(f"Warning: batchGet failed, reading ranges separately: {str(e)}")
+            values, errors = self.fetch_values_concurrently(refresh=refresh)
+            if not values:
+                raise Exception(next(iter(errors.values()), str(e)))
+        
+        # Writes are mirrored to the local store when queued, so stale values would undo them
+        if not self.get_write_queue().may_be_stale(started):
+            self.local_store.save_all(values)
+        return values, errors
+    
+    def read_local(self) -> Optional[Dict[str, Any]]:
+        """Read every range from the local store, or None if it was never synced"""
+        values = self.read_local_values()
+        if values is None:
+            return None
+        return self.parse_all(values)
+    
+    def read_local_values(self) -> Optional[Dict[str, List[List[str]]]]:
+        """Load the raw values of every range from the local store"""
+        return self.local_store.load_all(list(self.ranges))
+    
+    def read_character(self) -> Optional[Dict]:
+        """Read character data from sheet"""
+        return self._parse_character(self.read_values('character'))
+    
+    def update_character(self, character) -> bool:
+        """Update character data in sheet"""
+        try:
+            values = self._character_values(character)
+            self.write_range(CHARACTER_WRITE_RANGE, values)
+            self.local_store.put_rows('character', 0, values)
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi cập nhật nhân vật: {str(e)}")
+    
+    def queue_character_update(self, character):
+        """Queue a character update on the write-behind queue"""
+        values = self._character_values(character)
+        self.local_store.put_rows('character', 0, values)
+        return self.get_write_queue().queue_update(CHARACTER_WRITE_RANGE, values, "Cập nhật nhân vật")
+    
+    def read_quests(self) -> List[Dict]:
+        """Read quests data from sheet"""
+        return self._parse_quests(self.read_values('quests'))
+    
+    def update_quest(self, quest) -> bool:
+        """Update a specific quest in sheet"""
+        try:
+            row = self._quest_row(quest)
+            self.write_range(self._quest_range(quest), [row])
+            self.local_store.put_rows('quests', quest.id - 1, [row])
+            return True
+            
+        except Exception as e:
+            raise Exception(f"Lỗi cập nhật nhiệm vụ: {str(e)}")
+    
+    def queue_quest_update(self, quest):
+        """Queue a quest row update on the write-behind queue"""
+        row = self._quest_row(quest)
+        self.local_store.put_rows('quests', quest.id - 1, [row])
+        return self.get_write_queue().queue_update(
+            self._quest_range(quest), [row], f"Cập nhật nhiệm vụ: {quest.title}"
+        )
+    
+    def queue_quest_completions(self, quests, character, messages: List[Dict]):
+        """Queue completed quest rows, the character and their chat messages as one batch
+        
+        The quest rows and the Character range share the next
+        values:batchUpdate and the chat rows go out in one append.
+        """
+        updates = {}
+        for quest in quests:
+            row = self._quest_row(quest)
+            self.local_store.put_rows('quests', quest.id - 1, [row])
+            updates[self._quest_range(quest)] = [row]
+        
+        character_values = self._character_values(character)
+        self.local_store.put_rows('character', 0, character_values)
+        updates[CHARACTER_WRITE_RANGE] = character_values
+        
+        rows = [self._chat_row(message) for message in messages]
+        if rows:
+            first = self.local_store.append_rows('chat', rows)
+            for i, message in enumerate(messages):
+                message['id'] = first + i + 1
+        
+        description = f"Hoàn thành nhiệm vụ: {quests[0].title}" if len(quests) == 1 else f"Hoàn thành {len(quests)} nhiệm vụ"
+        return self.get_write_queue().queue_batch(updates, {CHAT_APPEND_RANGE: rows}, description)
+    
+    def read_achievements(self) -> List[Dict]:
+        """Read achievements data from sheet"""
+        return self._parse_achievements(self.read_values('achievements'))
+    
+    def read_resources(self) -> List[Dict]:
+        """Read resources data from sheet"""
+        return self._parse_resources(self.read_values('resources'))
+    
+    def read_resource_details(self) -> Dict[str, List[Dict]]:
+        """Read resource details data from sheet"""
+        return self._parse_resource_details(self.read_values('resource_details'))
+    
+    def add_resource_detail(self, resource_name: str, detail: Dict) -> bool:
+        """Add a new resource detail"""
+        try:
+            values = self._resource_detail_row(resource_name, detail)
+            self.append_row(RESOURCE_DETAILS_APPEND_RANGE, values)
+            detail['id'] = self.local_store.append_rows('resource_details', [values]) + 1
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi thêm chi tiết: {str(e)}")
+    
+    def read_chat(self) -> List[Dict]:
+        """Read chat messages from sheet"""
+        return self._parse_chat(self.read_values('chat'))
+    
+    def add_chat_message(self, message: Dict) -> bool:
+        """Add a new chat message"""
+        try:
+            row = self._chat_row(message)
+            self.append_row(CHAT_APPEND_RANGE, row)
+            message['id'] = self.local_store.append_rows('chat', [row]) + 1
+            return True
+        except Exception as e:
+            raise Exception(f"Lỗi thêm tin nhắn: {str(e)}")
+    
+    def queue_chat_message(self, message: Dict):
+        """Queue a chat message append on the write-behind queue"""
+        row = self._chat_row(message)
+        message['id'] = self.local_store.append_rows('chat', [row]) + 1
+        return self.get_write_queue().queue_append(CHAT_APPEND_RANGE, row, "Lưu tin nhắn")
+    
+    def read_goals(self) -> Optional[Dict]:
+        """Read goals data from sheet"""
+        return self._parse_goals(self.read_values('goals'))
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+Local SQLite Store for Level Up Application
+Bản sao cục bộ của Google Sheet để đọc ngay khi khởi động, không cần chờ mạng
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from config import DATA_DIR
+
+class LocalStore:
+    """SQLite mirror of the raw values of every sheet range
+    
+    Rows are stored exactly as the Sheets API returns them (lists of cell
+    strings), keyed by range name and 0-based row index, so the same
+    GoogleSheetsManager parsers work on local and remote data.
+    """
+    
+    def __init__(self, sheet_id: str, data_dir: Path = DATA_DIR):
+        safe_id = re.sub(r'[^A-Za-z0-9_-]', '_', sheet_id) or 'default'
+        self.path = Path(data_dir) / f"sheet_{safe_id}.sqlite3"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS sheet_rows (
+                sheet TEXT NOT NULL,
+                row_index INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (sheet, row_index)
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS sheet_meta (
+                sheet TEXT PRIMARY KEY,
+                synced_at TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+    
+    def save_values(self, name: str, values: List[List[str]]):
+        """Replace the stored rows of one range"""
+        self.save_all({name: values})
+    
+    def save_all(self, values_by_name: Dict[str, List[List[str]]]):
+        """Replace the stored rows of several ranges in one transaction"""
+        synced_at = datetime.now().isoformat()
+        with self._lock, self._conn:
+            for name, values in values_by_name.items():
+                self._conn.execute("DELETE FROM sheet_rows WHERE sheet = ?", (name,))
+                self._conn.executemany(
+                    "INSERT INTO sheet_rows (sheet, row_index, data) VALUES (?, ?, ?)",
+                    ((name, i, json.dumps(row, ensure_ascii=False)) for i, row in enumerate(values))
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sheet_meta (sheet, synced_at) VALUES (?, ?)",
+                    (name, synced_at)
+                )
+    
+    def replace_rows(self, name: str, chunks: Iterable[List[List[str]]]):
+        """Replace the stored rows of one range with rows streamed in runs (one transaction)"""
+        synced_at = datetime.now().isoformat()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sheet_rows WHERE sheet = ?", (name,))
+            start = 0
+            for rows in chunks:
+                self._conn.executemany(
+                    "INSERT INTO sheet_rows (sheet, row_index, data) VALUES (?, ?, ?)",
+                    ((name, start + i, json.dumps(row, ensure_ascii=False)) for i, row in enumerate(rows))
+                )
+                start += len(rows)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sheet_meta (sheet, synced_at) VALUES (?, ?)",
+                (name, synced_at)
+            )
+    
+    def put_rows(self, name: str, start_index: int, rows: List[List[str]]):
+        """Overwrite rows starting at start_index (mirrors a local write)"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sheet_rows (sheet, row_index, data) VALUES (?, ?, ?)",
+                ((name, start_index + i, json.dumps(row, ensure_ascii=False)) for i, row in enumerate(rows))
+            )
+    
+    def append_rows(self, name: str, rows: List[List[str]]) -> int:
+        """Append rows after the last stored row (mirrors a local append)
+        
+        Returns the row index of the first appended row, which is where the
+        Sheets append will place it, so callers can give the new record the
+        same id a later sync will parse it with.
+        """
+        with self._lock, self._conn:
+            last = self._conn.execute(
+                "SELECT MAX(row_index) FROM sheet_rows WHERE sheet = ?", (name,)
+            ).fetchone()[0]
+            start = 0 if last is None else last + 1
+            self._conn.executemany(
+                "INSERT INTO sheet_rows (sheet, row_index, data) VALUES (?, ?, ?)",
+                ((name, start + i, json.dumps(row, ensure_ascii=False)) for i, row in enumerate(rows))
+            )
+        return start
+    
+    def load_values(self, name: str) -> List[List[str]]:
+        """Load the stored rows of one range, padding gaps with empty rows"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT row_index, data FROM sheet_rows WHERE sheet = ? ORDER BY row_index", (name,)
+            )
+            values = []
+            for row_index, data in cursor:
+                while len(values) < row_index:
+                    values.append([])
+                values.append(json.loads(data))
+            return values
+    
+    def load_all(self, names: List[str]) -> Optional[Dict[str, List[List[str]]]]:
+        """Load every range in names, or None if nothing has been synced yet"""
+        if not self.last_synced():
+            return None
+        return {name: self.load_values(name) for name in names}
+    
+    def last_synced(self) -> Optional[datetime]:
+        """Get the time of the most recent sync written to the store"""
+        with self._lock:
+            value = self._conn.execute("SELECT MAX(synced_at) FROM sheet_meta").fetchone()[0]
+        return datetime.fromisoformat(value) if value else None
+
+# Process-wide stores, one connection per sheet
+_stores: Dict[str, LocalStore] = {}
+_stores_lock = threading.Lock()
+
+def get_local_store(sheet_id: str) -> LocalStore:
+    """Get the shared local store for a sheet"""
+    with _stores_lock:
+        store = _stores.get(sheet_id)
+        if store is None:
+            store = LocalStore(sheet_id)
+            _stores[sheet_id] = store
+        return store
\ No newline at end of file
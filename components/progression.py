@@ -0,0 +1,189 @@
+"""
+Progression Engine for Level Up Application
+Đường cong cấp độ/EXP (tuyến tính, bậc hai, theo bảng) và cộng thưởng nhiệm vụ hàng loạt
+"""
+
+import math
+import re
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from config import (
+    LEVEL_CURVE, LEVEL_EXP_STEP, LEVEL_EXP_GROWTH, LEVEL_EXP_TABLE,
+    STATS_CONFIG, VALIDATION_RULES
+)
+
+MAX_LEVEL = VALIDATION_RULES['character']['level']['max_value']
+STAT_LIMITS = VALIDATION_RULES['character']['stats']
+
+# Stat rewards such as "PHY +1" or "MEN +2, WILL +1"
+STAT_REWARD = re.compile(r"\b([A-Z]{2,4})\s*([+-]\d+)")
+
+class ProgressionCurve(ABC):
+    """Cumulative EXP thresholds of a leveling curve
+    
+    Character.exp is the total EXP ever earned and exp_to_next the total
+    needed for the next level, so a curve is a list of cumulative
+    thresholds: thresholds[i] is the EXP that reaches level i + 1. The list
+    is built once, up to MAX_LEVEL + 1, from level_cost(); level_for_exp()
+    bisects it and exp_for_level() indexes it. Subclasses with a closed
+    form answer both in O(1).
+    """
+    
+    def __init__(self, max_level: int = MAX_LEVEL):
+        self.max_level = max_level
+        self.thresholds: List[int] = [0]
+        for level in range(1, max_level + 1):
+            self.thresholds.append(self.thresholds[-1] + self.level_cost(level))
+    
+    @abstractmethod
+    def level_cost(self, level: int) -> int:
+        """EXP needed to go from level to level + 1"""
+    
+    def exp_for_level(self, level: int) -> int:
+        """Total EXP needed to reach level (0 for level 1)"""
+        return self.thresholds[max(1, min(level, self.max_level + 1)) - 1]
+    
+    def level_for_exp(self, exp: int) -> int:
+        """Level reached with a total of exp EXP"""
+        return max(1, min(bisect_right(self.thresholds, exp), self.max_level))
+
+class LinearCurve(ProgressionCurve):
+    """Every level costs step EXP"""
+    
+    def __init__(self, step: int = LEVEL_EXP_STEP, max_level: int = MAX_LEVEL):
+        self.step = max(1, step)
+        super().__init__(max_level)
+    
+    def level_cost(self, level: int) -> int:
+        return self.step
+    
+    def exp_for_level(self, level: int) -> int:
+        return (max(1, min(level, self.max_level + 1)) - 1) * self.step
+    
+    def level_for_exp(self, exp: int) -> int:
+        return max(1, min(exp // self.step + 1, self.max_level))
+
+class QuadraticCurve(ProgressionCurve):
+    """Each level costs growth EXP more than the one before, starting at base"""
+    
+    def __init__(self, base: int = LEVEL_EXP_STEP, growth: int = LEVEL_EXP_GROWTH, max_level: int = MAX_LEVEL):
+        self.base = max(1, base)
+        self.growth = max(0, growth)
+        super().__init__(max_level)
+    
+    def level_cost(self, level: int) -> int:
+        return self.base + self.growth * (level - 1)
+    
+    def _total(self, levels: int) -> int:
+        """EXP to gain levels levels from level 1"""
+        return self.base * levels + self.growth * levels * (levels - 1) // 2
+    
+    def exp_for_level(self, level: int) -> int:
+        return self._total(max(1, min(level, self.max_level + 1)) - 1)
+    
+    def level_for_exp(self, exp: int) -> int:
+        if exp <= 0:
+            return 1
+        if not self.growth:
+            return max(1, min(exp // self.base + 1, self.max_level))
+        # Largest n with growth*n^2 + (2*base - growth)*n <= 2*exp, then fix rounding
+        b = 2 * self.base - self.growth
+        n = (math.isqrt(b * b + 8 * self.growth * exp) - b) // (2 * self.growth)
+        while self._total(n + 1) <= exp:
+            n += 1
+        while n > 0 and self._total(n) > exp:
+            n -= 1
+        return max(1, min(n + 1, self.max_level))
+
+class TableCurve(ProgressionCurve):
+    """Thresholds from a table of total EXP for levels 2, 3, ...; past the table each level costs the last step"""
+    
+    def __init__(self, table: List[int] = LEVEL_EXP_TABLE, max_level: int = MAX_LEVEL):
+        self.table = sorted(table)
+        super().__init__(max_level)
+    
+    def level_cost(self, level: int) -> int:
+        if level <= len(self.table):
+            return self.table[level - 1] - (self.table[level - 2] if level >= 2 else 0)
+        if len(self.table) >= 2:
+            return max(1, self.table[-1] - self.table[-2])
+        return max(1, self.table[0] if self.table else LEVEL_EXP_STEP)
+
+CURVES = {
+    'linear': LinearCurve,
+    'quadratic': QuadraticCurve,
+    'table': TableCurve
+}
+
+@dataclass
+class Progress:
+    """What a batch of quest rewards changed (stats holds the points actually applied)"""
+    exp: int = 0
+    level_before: int = 1
+    level_after: int = 1
+    stats: Dict[str, int] = field(default_factory=dict)
+    
+    @property
+    def levels(self) -> int:
+        return self.level_after - self.level_before
+
+def parse_stat_reward(reward: str) -> Dict[str, int]:
+    """Parse a quest stat reward such as "PHY +1" into {stat: points}"""
+    points: Dict[str, int] = {}
+    for stat, value in STAT_REWARD.findall(reward or ''):
+        if stat in STATS_CONFIG:
+            points[stat] = points.get(stat, 0) + int(value)
+    return points
+
+def apply_rewards(character, quests: Iterable, curve: Optional[ProgressionCurve] = None) -> Progress:
+    """Add the EXP and stat rewards of quests to a character in one step
+    
+    The character's own level and exp_to_next (as stored in the sheet) are
+    the anchor, even when they are not on the curve: like the old level-up
+    loop, only the levels after the stored threshold follow the curve's
+    per-level costs. The curve is shifted by the gap between the stored
+    threshold and its own, so the new level is still one lookup however
+    many quests or levels are involved. Levels never go down, and stats
+    stay within the character validation limits.
+    """
+    curve = curve or get_progression_curve()
+    progress = Progress(level_before=character.level)
+    rewards: Dict[str, int] = {}
+    for quest in quests:
+        progress.exp += quest.reward_exp
+        for stat, points in parse_stat_reward(quest.reward_stat).items():
+            rewards[stat] = rewards.get(stat, 0) + points
+    
+    character.exp += progress.exp
+    for stat, points in rewards.items():
+        before = character.stats.get(stat, STAT_LIMITS['min_value'])
+        after = max(STAT_LIMITS['min_value'], min(STAT_LIMITS['max_value'], before + points))
+        character.stats[stat] = after
+        if after != before:
+            progress.stats[stat] = after - before
+    
+    if character.level < curve.max_level and character.exp >= character.exp_to_next:
+        offset = character.exp_to_next - curve.exp_for_level(character.level + 1)
+        character.level = max(character.level + 1, curve.level_for_exp(character.exp - offset))
+        character.exp_to_next = curve.exp_for_level(character.level + 1) + offset
+    if character.level >= curve.max_level:
+        # No next level: keep the bar full instead of past 100%
+        character.exp_to_next = max(character.exp_to_next, character.exp)
+    progress.level_after = character.level
+    return progress
+
+# Process-wide curve from config
+_shared_curve: Optional[ProgressionCurve] = None
+_shared_curve_lock = threading.Lock()
+
+def get_progression_curve() -> ProgressionCurve:
+    """Get the leveling curve chosen by LEVEL_CURVE"""
+    global _shared_curve
+    with _shared_curve_lock:
+        if _shared_curve is None:
+            _shared_curve = CURVES.get(LEVEL_CURVE, LinearCurve)()
+        return _shared_curve
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+Quest Store for Level Up Application
+Danh sách nhiệm vụ kèm chỉ mục theo id, trạng thái, độ ưu tiên, danh mục và chỉ số yêu cầu
+"""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from components.data_models import Quest
+from components.delta_sync import patch_sorted
+from utils.helpers import parse_deadline
+
+# Quest attributes with a value -> quests index
+INDEXED_FIELDS = ('status', 'priority', 'category', 'required_stat')
+
+# Quests without a parseable deadline sort after every dated one
+NO_DEADLINE = date.max
+
+class QuestStore(Sequence):
+    """Quests in id order, indexed by id and by the value of each indexed field
+    
+    Reads work like a list (len, iteration, indexing, slicing). Changes go
+    through replace(), patch() and update() so the indexes stay in step;
+    lookups by id and by field value are dict accesses instead of scans.
+    
+    These are the only quest indexes: Aggregates reads its quest counts
+    from count(), and the quest list window filters through values() and
+    select(), the same interface as ListIndex.
+    """
+    
+    def __init__(self, quests: Iterable[Quest] = ()):
+        self._quests: List[Quest] = []
+        self._by_id: Dict[int, Quest] = {}
+        self._by_field: Dict[str, Dict[str, Dict[int, Quest]]] = {}
+        # priority -> (day the order was computed for, open quests by deadline)
+        self._open_by_deadline: Dict[str, Tuple[date, List[Quest]]] = {}
+        # Quest ids in list order and select() results, dropped on every change
+        self._ids: Optional[List[int]] = None
+        self._selections: Dict[Tuple, List[int]] = {}
+        self.replace(quests)
+    
+    def __len__(self) -> int:
+        return len(self._quests)
+    
+    def __getitem__(self, pos):
+        return self._quests[pos]
+    
+    def __iter__(self):
+        return iter(self._quests)
+    
+    def __repr__(self) -> str:
+        return f"QuestStore({len(self._quests)} quests)"
+    
+    def _index(self, quest: Quest):
+        self._by_id[quest.id] = quest
+        for name in INDEXED_FIELDS:
+            self._by_field[name].setdefault(getattr(quest, name), {})[quest.id] = quest
+        self._changed(quest)
+    
+    def _unindex(self, quest: Quest):
+        self._by_id.pop(quest.id, None)
+        for name in INDEXED_FIELDS:
+            bucket = self._by_field[name].get(getattr(quest, name))
+            if bucket is not None:
+                bucket.pop(quest.id, None)
+                if not bucket:
+                    del self._by_field[name][getattr(quest, name)]
+        self._changed(quest)
+    
+    def _changed(self, quest: Quest):
+        self._open_by_deadline.pop(quest.priority, None)
+        self._ids = None
+        self._selections = {}
+    
+    def replace(self, quests: Iterable[Quest]):
+        """Replace every quest and rebuild the indexes"""
+        self._quests = sorted(quests, key=lambda quest: quest.id)
+        self._by_id = {}
+        self._by_field = {name: {} for name in INDEXED_FIELDS}
+        self._open_by_deadline = {}
+        self._ids = None
+        self._selections = {}
+        for quest in self._quests:
+            self._index(quest)
+    
+    def patch(self, changes: Dict[int, Optional[Quest]]) -> List[Quest]:
+        """Apply delta sync changes (id -> quest, or None when deleted); returns the replaced quests"""
+        removed = patch_sorted(self._quests, changes, lambda quest: quest.id)
+        for quest in removed:
+            self._unindex(quest)
+        for quest in changes.values():
+            if quest:
+                self._index(quest)
+        return removed
+    
+    def update(self, quest: Quest, **values):
+        """Change fields of a stored quest, e.g. update(quest, status='completed')"""
+        self._unindex(quest)
+        for name, value in values.items():
+            setattr(quest, name, value)
+        self._index(quest)
+    
+    def get(self, quest_id: int) -> Optional[Quest]:
+        """Get a quest by id"""
+        return self._by_id.get(quest_id)
+    
+    def count(self, field: str, value: str) -> int:
+        """Count the quests whose indexed field equals value"""
+        return len(self._by_field[field].get(value, {}))
+    
+    def values(self, field: str) -> List[str]:
+        """Get the distinct values of an indexed field"""
+        return sorted(self._by_field[field], key=str)
+    
+    def select(self, filters: Optional[Dict[str, Any]] = None) -> "Sequence[int]":
+        """Get the positions of the quests matching every field=value filter (None means any), in id order"""
+        active = tuple(sorted((name, value) for name, value in (filters or {}).items() if value is not None))
+        if not active:
+            return range(len(self._quests))
+        
+        selection = self._selections.get(active)
+        if selection is None:
+            if self._ids is None:
+                self._ids = [quest.id for quest in self._quests]
+            selection = [bisect_left(self._ids, quest.id) for quest in self.where(**dict(active))]
+            self._selections[active] = selection
+        return selection
+    
+    def where(self, **filters) -> List[Quest]:
+        """Get the quests matching every indexed field=value filter, in id order"""
+        if not filters:
+            return list(self._quests)
+        buckets = sorted((self._by_field[name].get(value, {}) for name, value in filters.items()), key=len)
+        matches = [quest for quest_id, quest in buckets[0].items() if all(quest_id in bucket for bucket in buckets[1:])]
+        return sorted(matches, key=lambda quest: quest.id)
+    
+    def top_open(self, priority: str = 'high', limit: int = 2) -> List[Quest]:
+        """Get the open quests of a priority, earliest deadline first
+        
+        The ordering is kept per priority until a quest of that priority
+        changes or the day changes (relative deadlines such as 'Ngày mai'
+        move with it), so repeated reads cost a slice.
+        """
+        today = date.today()
+        cached = self._open_by_deadline.get(priority)
+        if cached is None or cached[0] != today:
+            candidates = self._by_field['priority'].get(priority, {}).values()
+            ordered = sorted(
+                (quest for quest in candidates if quest.status != 'completed'),
+                key=lambda quest: (parse_deadline(quest.deadline) or NO_DEADLINE, quest.id)
+            )
+            cached = (today, ordered)
+            self._open_by_deadline[priority] = cached
+        return cached[1][:limit]
\ No newline at end of file
@@ -1,982 +1,1505 @@
-"""
-Render Functions for Level Up Application
-Các hàm render UI components và pages
-"""
-
-import streamlit as st
-import time
-from datetime import datetime
-from components.ui_components import *
-from components.data_models import *
-from utils.helpers import *
-
-# Main Render Functions
-def render_dashboard():
-    """Render dashboard page"""
-    if not st.session_state.connection_status['connected'] and st.session_state.connection_status['tested']:
-        render_empty_state(
-            "☁️", 
-            "Chưa kết nối Google Sheets",
-            "Kết nối với Google Sheets để bắt đầu hành trình RPG Self-Development của bạn. Tất cả dữ liệu sẽ được đồng bộ tự động.",
-            "Kết nối ngay",
-            lambda: setattr(st.session_state, 'show_settings', True) or st.rerun()
-        )
-        return
-    
-    if not st.session_state.connection_status['connected'] and not st.session_state.connection_status['tested']:
-        render_empty_state(
-            "🗄️",
-            "Khởi tạo kết nối",
-            "Vui lòng thiết lập kết nối Google Sheets để sử dụng ứng dụng.",
-            "Cài đặt kết nối",
-            lambda: setattr(st.session_state, 'show_settings', True) or st.rerun()
-        )
-        return
-    
-    # Welcome section
-    st.markdown(f"""
-    <div style="text-align: center; padding: 2rem 0;">
-        <h2 style="color: white; margin-bottom: 0.5rem;">
-            Chào mừng trở lại, {st.session_state.character.name or 'Hero'}! 👋
-        </h2>
-        <p style="color: #9CA3AF;">Hãy cùng chinh phục những thử thách hôm nay</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Character Summary
-    st.markdown('<div class="card gradient-card">', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([1, 2])
-    
-    with col1:
-        render_avatar(st.session_state.character.avatar, 80)
-    
-    with col2:
-        st.markdown(f"""
-        <h3 style="color: white; margin: 0;">{st.session_state.character.name or 'Hero'}</h3>
-        <div style="color: #8B5CF6; font-size: 0.9rem; margin-bottom: 0.5rem;">
-            Level {st.session_state.character.level} • RPG Developer
-        </div>
-        """, unsafe_allow_html=True)
-        
-        if st.session_state.character.birth_year:
-            st.markdown(f'<div style="color: #9CA3AF; font-size: 0.8rem; margin-bottom: 1rem;">{st.session_state.character.get_age_display()}</div>', unsafe_allow_html=True)
-        
-        render_progress_bar(st.session_state.character.exp, st.session_state.character.exp_to_next)
-    
-    # Stats
-    st.markdown("### Chỉ số nhân vật")
-    stat_cols = st.columns(5)
-    stat_icons = {'WILL': '❤️', 'PHY': '⚔️', 'MEN': '🧠', 'AWR': '👁️', 'EXE': '⚡'}
-    stat_colors = {'WILL': 'red', 'PHY': 'orange', 'MEN': 'blue', 'AWR': 'purple', 'EXE': 'yellow'}
-    
-    for i, (stat, value) in enumerate(st.session_state.character.stats.items()):
-        with stat_cols[i]:
-            render_stat_box(stat_icons[stat], stat, value, stat_colors[stat])
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Priority Quests
-    high_priority_quests = [q for q in st.session_state.quests if q.priority == 'high' and q.status != 'completed']
-    
-    if high_priority_quests:
-        st.markdown("### 🎯 Nhiệm vụ ưu tiên")
-        
-        for quest in high_priority_quests[:2]:  # Show top 2
-            st.markdown('<div class="quest-card">', unsafe_allow_html=True)
-            
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.markdown(f"""
-                <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
-                    <div style="width: 8px; height: 8px; background: {quest.get_priority_color()}; border-radius: 50%;"></div>
-                    <h4 style="color: white; margin: 0; font-size: 1.1rem;">{quest.title}</h4>
-                </div>
-                <p style="color: #D1D5DB; font-size: 0.9rem; margin-bottom: 1rem;">{quest.description}</p>
-                <div style="display: flex; gap: 1rem; font-size: 0.8rem;">
-                    <span>Độ khó: {quest.get_difficulty_stars()}</span>
-                    <span style="color: #F97316;">⏰ {quest.deadline}</span>
-                    <span style="color: #22C55E;">+{quest.reward_exp} EXP</span>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                if st.button("✅ Hoàn thành", key=f"complete_{quest.id}", help="Hoàn thành nhiệm vụ"):
-                    complete_quest(quest.id)
-                    st.rerun()
-            
-            st.markdown('</div>', unsafe_allow_html=True)
-    
-    elif len(st.session_state.quests) == 0:
-        render_empty_state(
-            "🎯",
-            "Chưa có nhiệm vụ nào",
-            "Thêm nhiệm vụ trong Google Sheets (tab Quests) để bắt đầu cuộc phiêu lưu RPG của bạn.",
-            "Xem hướng dẫn",
-            lambda: setattr(st.session_state, 'active_tab', 'quests') or st.rerun()
-        )
-    else:
-        render_empty_state(
-            "✅",
-            "Hoàn thành tuyệt vời!",
-            "Bạn đã hoàn thành tất cả nhiệm vụ ưu tiên. Thêm nhiệm vụ mới để tiếp tục phát triển.",
-            "Xem tất cả nhiệm vụ",
-            lambda: setattr(st.session_state, 'active_tab', 'quests') or st.rerun()
-        )
-    
-    # Stats overview
-    st.markdown("### 📊 Thống kê tổng quan")
-    stat_col1, stat_col2 = st.columns(2)
-    
-    completed_quests = len([q for q in st.session_state.quests if q.status == 'completed'])
-    unlocked_achievements = len([a for a in st.session_state.achievements if a.unlocked])
-    
-    with stat_col1:
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, rgba(59, 130, 246, 0.2), rgba(29, 78, 216, 0.2)); 
-                    border: 1px solid rgba(59, 130, 246, 0.2); border-radius: 1rem; padding: 1.5rem; text-align: center;">
-            <div style="font-size: 2rem; font-weight: bold; color: white; margin-bottom: 0.25rem;">{completed_quests}</div>
-            <div style="color: #93C5FD; font-size: 0.9rem;">Nhiệm vụ hoàn thành</div>
-            <div style="color: #60A5FA; font-size: 0.75rem;">Tổng cộng</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with stat_col2:
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, rgba(139, 92, 246, 0.2), rgba(109, 40, 217, 0.2)); 
-                    border: 1px solid rgba(139, 92, 246, 0.2); border-radius: 1rem; padding: 1.5rem; text-align: center;">
-            <div style="font-size: 2rem; font-weight: bold; color: white; margin-bottom: 0.25rem;">{unlocked_achievements}</div>
-            <div style="color: #C4B5FD; font-size: 0.9rem;">Danh hiệu đạt được</div>
-            <div style="color: #A78BFA; font-size: 0.75rem;">Tổng cộng</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-def render_character():
-    """Render character page"""
-    st.markdown("### 👤 Thông tin nhân vật")
-    
-    # Character card
-    st.markdown('<div class="card gradient-card">', unsafe_allow_html=True)
-    
-    # Avatar and basic info
-    col1, col2 = st.columns([1, 2])
-    
-    with col1:
-        render_avatar(st.session_state.character.avatar, 120)
-        if st.button("✏️ Chỉnh sửa", key="edit_character", help="Chỉnh sửa thông tin nhân vật"):
-            st.session_state.show_character_modal = True
-            st.rerun()
-    
-    with col2:
-        st.markdown(f"""
-        <h2 style="color: white; margin: 0 0 0.5rem 0;">{st.session_state.character.name or 'Hero'}</h2>
-        <div style="color: #8B5CF6; font-size: 1.1rem; margin-bottom: 0.5rem;">Level {st.session_state.character.level} RPG Developer</div>
-        """, unsafe_allow_html=True)
-        
-        if st.session_state.character.birth_year:
-            st.markdown(f'<div style="color: #9CA3AF; margin-bottom: 1rem;">{st.session_state.character.get_age_display()}</div>', unsafe_allow_html=True)
-        
-        st.markdown("**Kinh nghiệm**")
-        render_progress_bar(st.session_state.character.exp, st.session_state.character.exp_to_next)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Stats
-    st.markdown("### 📊 Chỉ số chi tiết")
-    stat_cols = st.columns(5)
-    stat_icons = {'WILL': '❤️', 'PHY': '⚔️', 'MEN': '🧠', 'AWR': '👁️', 'EXE': '⚡'}
-    stat_colors = {'WILL': 'red', 'PHY': 'orange', 'MEN': 'blue', 'AWR': 'purple', 'EXE': 'yellow'}
-    
-    for i, (stat, value) in enumerate(st.session_state.character.stats.items()):
-        with stat_cols[i]:
-            render_stat_box(stat_icons[stat], stat, value, stat_colors[stat])
-    
-    # Recent achievements
-    recent_achievements = [a for a in st.session_state.achievements if a.unlocked][-4:]
-    if recent_achievements:
-        st.markdown("### 🏆 Danh hiệu gần đây")
-        
-        ach_cols = st.columns(min(4, len(recent_achievements)))
-        for i, achievement in enumerate(recent_achievements):
-            with ach_cols[i]:
-                st.markdown(f"""
-                <div style="background: rgba(75, 85, 99, 0.5); border-radius: 1rem; padding: 1rem; text-align: center; border: 1px solid rgba(75, 85, 99, 0.3);">
-                    <div style="font-size: 2rem; margin-bottom: 0.5rem;">{achievement.icon}</div>
-                    <div style="color: {achievement.get_tier_color()}; font-size: 0.9rem; font-weight: bold; margin-bottom: 0.25rem;">
-                        {achievement.title}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-    
-    # Personal info
-    st.markdown("### 📋 Thông tin cá nhân")
-    st.markdown('<div class="card">', unsafe_allow_html=True)
-    
-    info_data = [
-        ("Tên nhân vật:", st.session_state.character.name or "Chưa đặt tên"),
-        ("Năm sinh:", str(st.session_state.character.birth_year) if st.session_state.character.birth_year else "Chưa cập nhật"),
-        ("Tuổi hiện tại:", st.session_state.character.get_age_display() or "Chưa xác định"),
-        ("Tổng EXP kiếm được:", str(st.session_state.character.exp)),
-        ("Nhiệm vụ hoàn thành:", f"{len([q for q in st.session_state.quests if q.status == 'completed'])}/{len(st.session_state.quests)}"),
-        ("Tỷ lệ hoàn thành:", f"{(len([q for q in st.session_state.quests if q.status == 'completed']) / len(st.session_state.quests) * 100) if st.session_state.quests else 0:.0f}%"),
-        ("Danh hiệu đạt được:", f"{len([a for a in st.session_state.achievements if a.unlocked])}/{len(st.session_state.achievements)}")
-    ]
-    
-    for label, value in info_data:
-        col1, col2 = st.columns([1, 1])
-        with col1:
-            st.markdown(f'<span style="color: #9CA3AF;">{label}</span>', unsafe_allow_html=True)
-        with col2:
-            st.markdown(f'<span style="color: white; font-weight: bold;">{value}</span>', unsafe_allow_html=True)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-
-def render_quests():
-    """Render quests page"""
-    # Header
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        st.markdown("### ⚔️ Nhiệm vụ")
-        pending_quests = len([q for q in st.session_state.quests if q.status != 'completed'])
-        st.markdown(f'<p style="color: #9CA3AF; font-size: 0.9rem;">{pending_quests} nhiệm vụ đang chờ</p>', unsafe_allow_html=True)
-    
-    with col2:
-        if st.button("🔄 Đồng bộ", key="sync_quests", help="Đồng bộ với Google Sheets"):
-            if st.session_state.sheets_manager:
-                sync_from_sheets()
-                st.rerun()
-    
-    if len(st.session_state.quests) == 0:
-        render_empty_state(
-            "⚔️",
-            "Chưa có nhiệm vụ nào",
-            "Thêm nhiệm vụ trong Google Sheets tab 'Quests' với cấu trúc: Title | Description | RequiredStat | Difficulty | Deadline | RewardEXP | RewardStat | Status | Category | Priority",
-            "Mở cài đặt",
-            lambda: setattr(st.session_state, 'show_settings', True) or st.rerun()
-        )
-        
-        st.markdown("""
-        <div style="background: rgba(75, 85, 99, 0.5); border-radius: 1rem; padding: 1rem; margin-top: 1rem;">
-            <div style="color: #9CA3AF; font-size: 0.8rem;">
-                <strong>Ví dụ:</strong> "Tập thể dục | Chạy bộ 30 phút | PHY | 3 | Hôm nay | 50 | PHY +1 | todo | health | high"
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        return
-    
-    # Quest list
-    for quest in st.session_state.quests:
-        st.markdown(f'<div class="quest-card {quest.status}">', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns([4, 1])
-        
-        with col1:
-            # Quest header
-            st.markdown(f"""
-            <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 0.75rem;">
-                <div style="width: 12px; height: 12px; background: {quest.get_priority_color()}; border-radius: 50%; flex-shrink: 0;"></div>
-                <h3 style="color: white; margin: 0; font-size: 1.2rem; flex: 1;">{quest.title}</h3>
-            </div>
-            <p style="color: #D1D5DB; margin-bottom: 1rem; line-height: 1.4;">{quest.description}</p>
-            """, unsafe_allow_html=True)
-            
-            # Quest details
-            detail_col1, detail_col2 = st.columns(2)
-            
-            with detail_col1:
-                st.markdown(f"""
-                <div style="display: flex; gap: 1rem; font-size: 0.85rem;">
-                    <span>Độ khó: {quest.get_difficulty_stars()}</span>
-                    <span style="color: #F97316;">⏰ {quest.deadline}</span>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with detail_col2:
-                st.markdown(f"""
-                <div style="display: flex; gap: 1rem; font-size: 0.85rem;">
-                    <span style="color: #60A5FA;">Yêu cầu: {quest.required_stat}</span>
-                    <span style="color: #A78BFA;">{quest.category.title()}</span>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Reward info
-            st.markdown(f"""
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-top: 1rem; padding-top: 1rem; border-top: 1px solid rgba(75, 85, 99, 0.5);">
-                <span style="color: #9CA3AF; font-size: 0.85rem;">Phần thưởng:</span>
-                <div>
-                    <span style="color: #22C55E; font-weight: bold;">+{quest.reward_exp} EXP</span>
-                    {f'<span style="color: #9CA3AF; font-size: 0.8rem; margin-left: 0.5rem;">{quest.reward_stat}</span>' if quest.reward_stat else ''}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            if quest.status != 'completed':
-                if st.button("✅ Hoàn thành", key=f"complete_quest_{quest.id}", help="Hoàn thành nhiệm vụ"):
-                    complete_quest(quest.id)
-                    st.rerun()
-            else:
-                st.markdown('<div style="color: #22C55E; text-align: center; font-weight: bold;">✅ Hoàn thành</div>', unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-
-def render_resources():
-    """Render resources page"""
-    st.markdown("### 💎 Nguồn vốn phát triển")
-    st.markdown('<p style="color: #9CA3AF; font-size: 0.9rem; margin-bottom: 2rem;">4 khía cạnh cốt lõi cho sự phát triển toàn diện</p>', unsafe_allow_html=True)
-    
-    for resource in st.session_state.resources:
-        st.markdown('<div class="resource-card">', unsafe_allow_html=True)
-        
-        # Resource header
-        col1, col2, col3 = st.columns([1, 3, 1])
-        
-        with col1:
-            st.markdown(f"""
-            <div style="width: 60px; height: 60px; background: linear-gradient(135deg, {resource.color.replace('from-', '').replace(' to-', ', ')}); 
-                        border-radius: 1rem; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">
-                {resource.icon}
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            total_value = calculate_resource_total(st.session_state.resource_details.get(resource.name, []))
-            st.markdown(f"""
-            <h3 style="color: white; margin: 0 0 0.25rem 0;">{resource.name}</h3>
-            <p style="color: #D1D5DB; font-size: 0.9rem; margin: 0 0 0.5rem 0;">{resource.description}</p>
-            """, unsafe_allow_html=True)
-            
-            if total_value > 0:
-                st.markdown(f'<p style="color: {resource.text_color.replace("text-", "")}; font-weight: bold; margin: 0;">Tổng giá trị: {format_currency(total_value)} VND</p>', unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div style="text-align: center;">
-                <div style="color: white; font-size: 1.2rem; font-weight: bold;">Lv.{resource.level}</div>
-                <div style="color: {resource.text_color.replace("text-", "")}; font-size: 0.75rem;">Cấp độ</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Progress bar
-        st.markdown("**Tiến độ đến level tiếp theo**")
-        render_progress_bar(resource.progress, 100)
-        
-        # Resource details
-        details = st.session_state.resource_details.get(resource.name, [])
-        active_details = [d for d in details if d['status'] == 'active']
-        
-        st.markdown(f"**Chi tiết ({len(active_details)})**")
-        
-        if not active_details:
-            st.markdown("""
-            <div style="text-align: center; padding: 1rem; color: #6B7280;">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">Chưa có chi tiết nào</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            if st.button(f"➕ Thêm chi tiết đầu tiên", key=f"add_first_{resource.name}"):
-                st.session_state.selected_resource = resource.name
-                st.session_state.show_resource_modal = True
-                st.rerun()
-        else:
-            # Show details
-            for detail in active_details[:3]:  # Show first 3
-                col1, col2, col3 = st.columns([1, 4, 1])
-                
-                with col1:
-                    type_icons = {'asset': '💰', 'loan': '📋', 'investment': '📈', 'income': '💸', 'expense': '💳'}
-                    st.markdown(f'<div style="font-size: 1.2rem; text-align: center;">{type_icons.get(detail["type"], "💰")}</div>', unsafe_allow_html=True)
-                
-                with col2:
-                    type_colors = {'asset': '#22C55E', 'loan': '#F97316', 'investment': '#3B82F6', 'income': '#10B981', 'expense': '#EF4444'}
-                    st.markdown(f"""
-                    <div style="color: white; font-weight: bold; margin-bottom: 0.25rem;">{detail['name']}</div>
-                    <div style="display: flex; gap: 0.5rem; font-size: 0.8rem;">
-                        <span style="color: {type_colors.get(detail['type'], '#22C55E')};">{format_currency(detail['amount'])} VND</span>
-                        <span style="color: #6B7280;">•</span>
-                        <span style="color: #9CA3AF; text-transform: capitalize;">{detail['type']}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col3:
-                    if st.button("✏️", key=f"edit_{detail['id']}", help="Chỉnh sửa"):
-                        st.session_state.selected_resource = resource.name
-                        st.session_state.resource_form = detail.copy()
-                        st.session_state.show_resource_modal = True
-                        st.rerun()
-            
-            if len(active_details) > 3:
-                st.markdown(f'<div style="color: #9CA3AF; font-size: 0.8rem; text-align: center;">...và {len(active_details) - 3} chi tiết khác</div>', unsafe_allow_html=True)
-            
-            if st.button(f"➕ Thêm chi tiết", key=f"add_{resource.name}"):
-                st.session_state.selected_resource = resource.name
-                st.session_state.show_resource_modal = True
-                st.rerun()
-        
-        # Resource info footer
-        if resource.next_milestone:
-            st.markdown(f'<div style="color: {resource.text_color.replace("text-", "")}; font-size: 0.8rem; text-align: center; margin-top: 1rem; background: rgba(75, 85, 99, 0.5); padding: 0.5rem; border-radius: 0.5rem;">Mốc tiếp: {resource.next_milestone}</div>', unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Usage guide
-    st.markdown("### 📋 Hướng dẫn cập nhật")
-    st.markdown("""
-    <div style="background: rgba(75, 85, 99, 0.5); border-radius: 1rem; padding: 1.5rem; margin-top: 1rem;">
-        <p style="color: #D1D5DB; margin-bottom: 1rem;">Dữ liệu chi tiết nguồn vốn được lưu trong Google Sheets tab 'ResourceDetails':</p>
-        <div style="background: rgba(0, 0, 0, 0.3); border-radius: 0.5rem; padding: 1rem; font-family: monospace; font-size: 0.8rem;">
-            <div style="color: #E5E7EB;">ResourceName | DetailName | Amount | Type | Notes | Date | Status</div>
-            <div style="color: #9CA3AF; margin-top: 0.5rem;">Tài chính | Bản thân | 50000000 | asset | Tiền tiết kiệm | 24/06/2025 | active</div>
-            <div style="color: #9CA3AF;">Tài chính | Ba | 35000000 | asset | Hỗ trợ gia đình | 24/06/2025 | active</div>
-        </div>
-        <div style="color: #9CA3AF; font-size: 0.8rem; margin-top: 1rem;">
-            <strong>Types:</strong> asset (tài sản), loan (khoản vay), investment (đầu tư), income (thu nhập), expense (chi phí)
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-def render_achievements():
-    """Render achievements page"""
-    st.markdown("### 🏆 Danh hiệu & Thành tựu")
-    
-    unlocked_count = len([a for a in st.session_state.achievements if a.unlocked])
-    total_count = len(st.session_state.achievements)
-    
-    st.markdown(f'<p style="color: #9CA3AF; font-size: 0.9rem; margin-bottom: 2rem;">{unlocked_count}/{total_count} đã mở khóa</p>', unsafe_allow_html=True)
-    
-    if len(st.session_state.achievements) == 0:
-        render_empty_state(
-            "🏆",
-            "Chưa có danh hiệu nào",
-            "Thêm danh hiệu trong Google Sheets tab 'Achievements' với cấu trúc: Title | Description | Icon | Tier | Unlocked | UnlockedDate | Progress | Condition | Category",
-            "Cài đặt Google Sheets",
-            lambda: setattr(st.session_state, 'show_settings', True) or st.rerun()
-        )
-        
-        st.markdown("""
-        <div style="background: rgba(75, 85, 99, 0.5); border-radius: 1rem; padding: 1rem; margin-top: 1rem;">
-            <div style="color: #9CA3AF; font-size: 0.8rem;">
-                <strong>Ví dụ:</strong> "First Steps | Hoàn thành nhiệm vụ đầu tiên | 🎯 | bronze | TRUE | 20/06/2025 | 100 | Complete 1 quest | general"
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        return
-    
-    # Achievement stats
-    st.markdown("### 📊 Thống kê theo hạng")
-    stat_cols = st.columns(4)
-    tiers = ['bronze', 'silver', 'gold', 'legendary']
-    tier_colors = {'bronze': '#D97706', 'silver': '#6B7280', 'gold': '#F59E0B', 'legendary': '#8B5CF6'}
-    
-    for i, tier in enumerate(tiers):
-        count = len([a for a in st.session_state.achievements if a.tier == tier and a.unlocked])
-        with stat_cols[i]:
-            st.markdown(f"""
-            <div style="background: rgba(75, 85, 99, 0.5); border-radius: 1rem; padding: 1rem; text-align: center; border: 1px solid rgba(75, 85, 99, 0.5);">
-                <div style="color: {tier_colors[tier]}; font-size: 1.5rem; font-weight: bold; margin-bottom: 0.25rem;">{count}</div>
-                <div style="color: #9CA3AF; font-size: 0.75rem; text-transform: capitalize;">{tier}</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # Achievement list
-    st.markdown("### 🎖️ Danh sách danh hiệu")
-    
-    for achievement in st.session_state.achievements:
-        render_achievement_card(achievement)
-
-def render_settings():
-    """Render settings page"""
-    st.markdown("### ⚙️ Cài đặt")
-    st.markdown('<p style="color: #9CA3AF; font-size: 0.9rem; margin-bottom: 2rem;">Kết nối và đồng bộ với Google Sheets</p>', unsafe_allow_html=True)
-    
-    # Connection status
-    st.markdown("#### 📊 Trạng thái kết nối")
-    
-    if st.session_state.connection_status['last_sync']:
-        last_sync = st.session_state.connection_status['last_sync']
-        st.markdown(f'<p style="color: #9CA3AF; font-size: 0.85rem;">Đồng bộ lần cuối: {last_sync.strftime("%d/%m/%Y %H:%M:%S")}</p>', unsafe_allow_html=True)
-    
-    # Action buttons
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("🔗 Kiểm tra kết nối", key="test_connection", 
-                    disabled=st.session_state.loading or not st.session_state.settings['sheet_id'] or not st.session_state.settings['api_key']):
-            test_connection()
-            st.rerun()
-    
-    with col2:
-        if st.button("🔄 Đồng bộ ngay", key="sync_now", 
-                    disabled=st.session_state.syncing or not st.session_state.connection_status['connected']):
-            sync_from_sheets()
-            st.rerun()
-    
-    with col3:
-        if st.button("💾 Lưu cài đặt", key="save_settings"):
-            save_settings()
-            st.rerun()
-    
-    st.divider()
-    
-    # Google Sheets configuration
-    st.markdown("#### 🔗 Cấu hình Google Sheets")
-    
-    with st.form("settings_form"):
-        sheet_id = st.text_input(
-            "Google Sheet ID *",
-            value=st.session_state.settings['sheet_id'],
-            placeholder="1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms",
-            help="Lấy từ URL: docs.google.com/spreadsheets/d/[SHEET_ID]/edit"
-        )
-        
-        api_key = st.text_input(
-            "Google Sheets API Key *",
-            value=st.session_state.settings['api_key'],
-            type="password",
-            placeholder="AIzaSyD...",
-            help="Tạo API Key tại Google Cloud Console"
-        )
-        
-        auto_sync = st.checkbox(
-            "Tự động đồng bộ",
-            value=st.session_state.settings['auto_sync'],
-            help="Đồng bộ định kỳ với Google Sheets"
-        )
-        
-        if auto_sync:
-            sync_interval = st.selectbox(
-                "Tần suất đồng bộ",
-                options=[1, 5, 15, 30, 60],
-                index=[1, 5, 15, 30, 60].index(st.session_state.settings['sync_interval']),
-                format_func=lambda x: f"Mỗi {x} phút" if x < 60 else f"Mỗi {x//60} giờ"
-            )
-        else:
-            sync_interval = st.session_state.settings['sync_interval']
-        
-        if st.form_submit_button("💾 Lưu cài đặt", use_container_width=True):
-            st.session_state.settings.update({
-                'sheet_id': sheet_id,
-                'api_key': api_key,
-                'auto_sync': auto_sync,
-                'sync_interval': sync_interval
-            })
-            save_settings()
-            
-            if sheet_id and api_key:
-                test_connection()
-            
-            st.rerun()
-    
-    st.divider()
-    
-    # Setup guide
-    st.markdown("#### 📋 Hướng dẫn thiết lập")
-    
-    with st.expander("1. Tạo Google Sheet mới"):
-        st.markdown("""
-        - Tạo Google Sheet mới
-        - Tạo các sheet tabs: **Character**, **Quests**, **Achievements**, **Goals**, **Resources**, **ResourceDetails**, **Chat**
-        - Đặt quyền "Anyone with the link can view" hoặc "edit"
-        """)
-    
-    with st.expander("2. Lấy API Key"):
-        st.markdown("""
-        - Truy cập [Google Cloud Console](https://console.cloud.google.com)
-        - Tạo project mới hoặc chọn project có sẵn
-        - Bật Google Sheets API
-        - Tạo API Key trong mục Credentials
-        """)
-    
-    with st.expander("3. Cấu trúc dữ liệu"):
-        st.markdown("""
-        **Sheet "Quests" (A2:J):**
-        ```
-        Title | Description | RequiredStat | Difficulty | Deadline | RewardEXP | RewardStat | Status | Category | Priority
-        ```
-        
-        **Sheet "Achievements" (A2:I):**
-        ```
-        Title | Description | Icon | Tier | Unlocked | UnlockedDate | Progress | Condition | Category
-        ```
-        
-        **Sheet "ResourceDetails" (A2:G):**
-        ```
-        ResourceName | DetailName | Amount | Type | Notes | Date | Status
-        ```
-        
-        **Sheet "Character" (A1:B):**
-        ```
-        name | Hero
-        avatar | https://example.com/avatar.jpg
-        birthYear | 1995
-        level | 5
-        exp | 750
-        expToNext | 1000
-        stats | {"WILL":15,"PHY":12,"MEN":14,"AWR":13,"EXE":16}
-        ```
-        """)
-
-# Modal render functions
-def render_character_modal():
-    """Render character edit modal"""
-    if not st.session_state.show_character_modal:
-        return
-    
-    with st.container():
-        st.markdown("### ✏️ Chỉnh sửa nhân vật")
-        
-        with st.form("character_form"):
-            name = st.text_input(
-                "Tên nhân vật *",
-                value=st.session_state.character.name,
-                placeholder="Nhập tên nhân vật...",
-                max_chars=50
-            )
-            
-            avatar = st.text_input(
-                "Avatar URL",
-                value=st.session_state.character.avatar,
-                placeholder="https://example.com/avatar.jpg hoặc emoji 🧙‍♂️",
-                help="Nhập URL ảnh hoặc emoji"
-            )
-            
-            birth_year = st.number_input(
-                "Năm sinh",
-                min_value=1900,
-                max_value=datetime.now().year,
-                value=st.session_state.character.birth_year or datetime.now().year - 25,
-                help="Tùy chọn - để trống nếu không muốn hiển thị tuổi"
-            )
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                if st.form_submit_button("💾 Lưu thay đổi", use_container_width=True):
-                    if not name.strip():
-                        st.error("Vui lòng nhập tên nhân vật")
-                    else:
-                        # Update character
-                        st.session_state.character.name = name
-                        st.session_state.character.avatar = avatar
-                        st.session_state.character.birth_year = birth_year if birth_year != datetime.now().year - 25 else None
-                        
-                        # Update to sheets if connected
-                        if st.session_state.sheets_manager and st.session_state.connection_status['connected']:
-                            try:
-                                st.session_state.sheets_manager.update_character(st.session_state.character)
-                                st.session_state.success_message = "Cập nhật nhân vật thành công!"
-                            except Exception as e:
-                                st.session_state.error_message = f"Lỗi cập nhật: {str(e)}"
-                        
-                        st.session_state.show_character_modal = False
-                        st.rerun()
-            
-            with col2:
-                if st.form_submit_button("❌ Hủy", use_container_width=True):
-                    st.session_state.show_character_modal = False
-                    st.rerun()
-
-def render_resource_modal():
-    """Render resource detail modal"""
-    if not st.session_state.show_resource_modal or not st.session_state.selected_resource:
-        return
-    
-    with st.container():
-        st.markdown(f"### {'✏️ Chỉnh sửa' if 'id' in st.session_state.get('resource_form', {}) else '➕ Thêm'} chi tiết")
-        st.markdown(f"**{st.session_state.selected_resource}**")
-        
-        with st.form("resource_form"):
-            form_data = st.session_state.get('resource_form', {})
-            
-            name = st.text_input(
-                "Tên chi tiết *",
-                value=form_data.get('name', ''),
-                placeholder="VD: Bản thân, Ba, Mượn mẹ..."
-            )
-            
-            amount = st.number_input(
-                "Số tiền (VND) *",
-                min_value=0.0,
-                value=float(form_data.get('amount', 0)),
-                format="%.0f",
-                step=1000000.0
-            )
-            
-            type_options = ["asset", "loan", "investment", "income", "expense"]
-            type_labels = ["💰 Tài sản", "📋 Khoản vay", "📈 Đầu tư", "💸 Thu nhập", "💳 Chi phí"]
-            
-            type_selected = st.selectbox(
-                "Loại *",
-                options=type_options,
-                index=type_options.index(form_data.get('type', 'asset')),
-                format_func=lambda x: type_labels[type_options.index(x)]
-            )
-            
-            notes = st.text_area(
-                "Ghi chú",
-                value=form_data.get('notes', ''),
-                placeholder="Mô tả chi tiết về nguồn vốn này...",
-                height=100
-            )
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                if st.form_submit_button("💾 Lưu", use_container_width=True):
-                    if not name or not amount:
-                        st.error("Vui lòng điền đầy đủ thông tin bắt buộc")
-                    else:
-                        # Create new detail
-                        new_detail = {
-                            'id': int(time.time()),
-                            'name': name,
-                            'amount': amount,
-                            'type': type_selected,
-                            'notes': notes,
-                            'date': datetime.now().strftime('%d/%m/%Y'),
-                            'status': 'active'
-                        }
-                        
-                        # Update local state
-                        if st.session_state.selected_resource not in st.session_state.resource_details:
-                            st.session_state.resource_details[st.session_state.selected_resource] = []
-                        
-                        st.session_state.resource_details[st.session_state.selected_resource].append(new_detail)
-                        
-                        # Update to sheets if connected
-                        if st.session_state.sheets_manager and st.session_state.connection_status['connected']:
-                            try:
-                                st.session_state.sheets_manager.add_resource_detail(st.session_state.selected_resource, new_detail)
-                                st.session_state.success_message = "Thêm chi tiết thành công!"
-                            except Exception as e:
-                                st.session_state.error_message = f"Lỗi thêm chi tiết: {str(e)}"
-                        
-                        st.session_state.show_resource_modal = False
-                        st.session_state.selected_resource = None
-                        if 'resource_form' in st.session_state:
-                            del st.session_state.resource_form
-                        st.rerun()
-            
-            with col2:
-                if st.form_submit_button("❌ Hủy", use_container_width=True):
-                    st.session_state.show_resource_modal = False
-                    st.session_state.selected_resource = None
-                    if 'resource_form' in st.session_state:
-                        del st.session_state.resource_form
-                    st.rerun()
-
-def render_chat_modal():
-    """Render chat modal"""
-    if not st.session_state.show_chat:
-        return
-    
-    with st.container():
-        st.markdown("### 💬 Ghi chú & Suy nghĩ")
-        st.markdown('<p style="color: #9CA3AF; font-size: 0.9rem;">Không gian riêng tư của bạn</p>', unsafe_allow_html=True)
-        
-        # Chat messages
-        if st.session_state.chat_messages:
-            st.markdown('<div class="chat-container">', unsafe_allow_html=True)
-            
-            for message in st.session_state.chat_messages[-10:]:  # Show last 10 messages
-                message_class = "achievement" if message['type'] == 'achievement' else ""
-                icon = "🎉" if message['type'] == 'achievement' else "⏰" if message['type'] == 'reminder' else "💭"
-                
-                st.markdown(f"""
-                <div class="chat-message {message_class}">
-                    <div style="display: flex; align-items: start; gap: 0.75rem;">
-                        <span style="font-size: 1.2rem;">{icon}</span>
-                        <div style="flex: 1;">
-                            <div style="color: white; line-height: 1.4;">{message['text']}</div>
-                            <div style="color: #9CA3AF; font-size: 0.75rem; margin-top: 0.5rem;">{message['timestamp']}</div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown('</div>', unsafe_allow_html=True)
-        else:
-            st.markdown("""
-            <div style="text-align: center; padding: 2rem; color: #9CA3AF;">
-                <div style="font-size: 3rem; margin-bottom: 1rem;">💬</div>
-                <p>Chưa có ghi chú nào</p>
-                <p style="font-size: 0.9rem;">Hãy chia sẻ suy nghĩ của bạn</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Chat input
-        with st.form("chat_form"):
-            message_text = st.text_area(
-                "Chia sẻ suy nghĩ của bạn...",
-                placeholder="Nhập ghi chú, suy nghĩ, hoặc cảm xúc của bạn...",
-                height=100,
-                label_visibility="collapsed"
-            )
-            
-            col1, col2 = st.columns([3, 1])
-            
-            with col2:
-                if st.form_submit_button("📤 Gửi", use_container_width=True):
-                    if message_text.strip():
-                        new_message = {
-                            'id': int(time.time()),
-                            'text': message_text,
-                            'timestamp': datetime.now().strftime("%H:%M"),
-                            'type': 'note',
-                            'date': datetime.now().strftime("%d/%m/%Y"),
-                            'author': 'user'
-                        }
-                        
-                        st.session_state.chat_messages.append(new_message)
-                        
-                        # Update to sheets if connected
-                        if st.session_state.sheets_manager and st.session_state.connection_status['connected']:
-                            try:
-                                st.session_state.sheets_manager.add_chat_message(new_message)
-                                st.session_state.success_message = "Ghi chú đã được lưu!"
-                            except Exception as e:
-                                st.session_state.error_message = f"Lỗi lưu ghi chú: {str(e)}"
-                        
-                        st.rerun()
-            
-            with col1:
-                if st.form_submit_button("❌ Đóng", use_container_width=True):
-                    st.session_state.show_chat = False
-                    st.rerun()
-
-# Global sync function
-def sync_from_sheets():
-    """Sync data from Google Sheets"""
-    if not st.session_state.sheets_manager:
-        return
-    
-    try:
-        st.session_state.syncing = True
-        st.session_state.error_message = None
-        
-        # Sync character data
-        character_data = st.session_state.sheets_manager.read_character()
-        if character_data:
-            st.session_state.character.update_from_dict(character_data)
-        
-        # Sync quests
-        quests_data = st.session_state.sheets_manager.read_quests()
-        st.session_state.quests = [Quest.from_dict(q) for q in quests_data]
-        
-        # Sync achievements
-        achievements_data = st.session_state.sheets_manager.read_achievements()
-        st.session_state.achievements = [Achievement.from_dict(a) for a in achievements_data]
-        
-        # Sync resources
-        resources_data = st.session_state.sheets_manager.read_resources()
-        if resources_data:
-            for i, resource in enumerate(st.session_state.resources):
-                if i < len(resources_data):
-                    resource.update_from_dict(resources_data[i])
-        
-        # Sync resource details
-        st.session_state.resource_details = st.session_state.sheets_manager.read_resource_details()
-        
-        # Sync chat messages
-        st.session_state.chat_messages = st.session_state.sheets_manager.read_chat()
-        
-        # Sync goals
-        goals_data = st.session_state.sheets_manager.read_goals()
-        if goals_data:
-            st.session_state.goals = goals_data
-        
-        st.session_state.connection_status['last_sync'] = datetime.now()
-        st.session_state.success_message = 'Đồng bộ thành công!'
-        
-    except Exception as e:
-        st.session_state.error_message = f'Lỗi đồng bộ: {str(e)}'
-        st.session_state.connection_status['connected'] = False
-    finally:
-        st.session_state.syncing = False
-
-def complete_quest(quest_id):
-    """Complete a quest and update character"""
-    quest = next((q for q in st.session_state.quests if q.id == quest_id), None)
-    if not quest or quest.status == 'completed':
-        return
-    
-    # Update quest status
-    quest.status = 'completed'
-    
-    # Update character EXP
-    st.session_state.character.exp += quest.reward_exp
-    
-    # Level up check
-    while st.session_state.character.exp >= st.session_state.character.exp_to_next:
-        st.session_state.character.level += 1
-        st.session_state.character.exp_to_next += 100
-    
-    # Add achievement message
-    new_message = {
-        'id': int(time.time()),
-        'text': f'🎉 Hoàn thành: {quest.title} (+{quest.reward_exp} EXP)',
-        'timestamp': datetime.now().strftime("%H:%M"),
-        'type': 'achievement',
-        'date': datetime.now().strftime("%d/%m/%Y"),
-        'author': 'user'
-    }
-    st.session_state.chat_messages.append(new_message)
-    
-    # Update sheets if connected
-    if st.session_state.sheets_manager and st.session_state.connection_status['connected']:
-        try:
-            st.session_state.sheets_manager.update_quest(quest)
-            st.session_state.sheets_manager.update_character(st.session_state.character)
-            st.session_state.sheets_manager.add_chat_message(new_message)
-        except Exception as e:
-            st.session_state.error_message = f'Lỗi cập nhật: {str(e)}'
-    
-    st.session_state.success_message = f'Hoàn thành nhiệm vụ: {quest.title}!'
-
-def test_connection():
-    """Test connection to Google Sheets"""
-    if not st.session_state.settings['sheet_id'] or not st.session_state.settings['api_key']:
-        st.session_state.error_message = 'Vui lòng nhập đầy đủ Sheet ID và API Key'
-        return False
-    
-    try:
-        st.session_state.loading = True
-        st.session_state.error_message = None
-        
-        # Initialize Google Sheets manager
-        from components.google_sheets import GoogleSheetsManager
-        st.session_state.sheets_manager = GoogleSheetsManager(
-            st.session_state.settings['sheet_id'],
-            st.session_state.settings['api_key']
-        )
-        
-        # Test connection
-        if st.session_state.sheets_manager.test_connection():
-            st.session_state.connection_status['connected'] = True
-            st.session_state.connection_status['tested'] = True
-            st.session_state.success_message = 'Kết nối thành công!'
-            
-            # Auto-sync after successful connection
-            sync_from_sheets()
-            return True
-        else:
-            raise Exception("Không thể kết nối")
-            
-    except Exception as e:
-        st.session_state.connection_status['connected'] = False
-        st.session_state.connection_status['tested'] = True
-        st.session_state.error_message = f'Lỗi kết nối: {str(e)}'
-        return False
-    finally:
-        st.session_state.loading = False
-
-def save_settings():
-    """Save settings to local file"""
-    try:
-        from utils.helpers import save_json_file
-        save_json_file(st.session_state.settings, "levelup_settings.json")
-        st.session_state.success_message = "Cài đặt đã được lưu!"
-    except Exception as e:
-        st.session_state.error_message = f"Lỗi lưu cài đặt: {str(e)}"
\ No newline at end of file
+"""
+Render Functions for Level Up Application
+Các hàm render UI components và pages
+"""
+
+import streamlit as st
+import time
+from datetime import datetime
+from config import SYNC_POLL_INTERVAL, WRITE_ACK_POLL_INTERVAL, BULK_PARSE_MIN_ROWS, RESOURCE_TYPES, STATS_CONFIG
+from components.ui_components import *
+from components.data_models import *
+from components.delta_sync import patch_sorted, patch_unordered, patch_grouped
+from components.quest_store import QuestStore
+from components.event_log import Event, EventKind, get_event_log, name_code
+from components.progression import apply_rewards
+from utils.settings_store import get_settings_store
+from utils.helpers import *
+
+# Main Render Functions
+def render_dashboard():
+    """Render dashboard page"""
+    if not st.session_state.connection_status['connected'] and st.session_state.connection_status['tested']:
+        render_empty_state(
+            "☁️", 
+            "Chưa kết nối Google Sheets",
+            "Kết nối với Google Sheets để bắt đầu hành trình RPG Self-Development của bạn. Tất cả dữ liệu sẽ được đồng bộ tự động.",
+            "Kết nối ngay",
+            lambda: setattr(st.session_state, 'show_settings', True) or st.rerun()
+        )
+        return
+    
+    if not st.session_state.connection_status['connected'] and not st.session_state.connection_status['tested']:
+        render_empty_state(
+            "🗄️",
+            "Khởi tạo kết nối",
+            "Vui lòng thiết lập kết nối Google Sheets để sử dụng ứng dụng.",
+            "Cài đặt kết nối",
+            lambda: setattr(st.session_state, 'show_settings', True) or st.rerun()
+        )
+        return
+    
+    # Welcome section
+    st.markdown(f"""
+    <div style="text-align: center; padding: 2rem 0;">
+        <h2 style="color: white; margin-bottom: 0.5rem;">
+            Chào mừng trở lại, {st.session_state.character.name or 'Hero'}! 👋
+        </h2>
+        <p style="color: #9CA3AF;">Hãy cùng chinh phục những thử thách hôm nay</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Character Summary
+    st.markdown('<div class="card gradient-card">', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        render_avatar(st.session_state.character.avatar, 80)
+    
+    with col2:
+        st.markdown(f"""
+        <h3 style="color: white; margin: 0;">{st.session_state.character.name or 'Hero'}</h3>
+        <div style="color: #8B5CF6; font-size: 0.9rem; margin-bottom: 0.5rem;">
+            Level {st.session_state.character.level} • RPG Developer
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.session_state.character.birth_year:
+            st.markdown(f'<div style="color: #9CA3AF; font-size: 0.8rem; margin-bottom: 1rem;">{st.session_state.character.get_age_display()}</div>', unsafe_allow_html=True)
+        
+        render_progress_bar(st.session_state.character.exp, st.session_state.character.exp_to_next)
+    
+    # Stats
+    st.markdown("### Chỉ số nhân vật")
+    stat_cols = st.columns(5)
+    stat_icons = {'WILL': '❤️', 'PHY': '⚔️', 'MEN': '🧠', 'AWR': '👁️', 'EXE': '⚡'}
+    stat_colors = {'WILL': 'red', 'PHY': 'orange', 'MEN': 'blue', 'AWR': 'purple', 'EXE': 'yellow'}
+    
+    for i, (stat, value) in enumerate(st.session_state.character.stats.items()):
+        with stat_cols[i]:
+            render_stat_box(stat_icons[stat], stat, value, stat_colors[stat])
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Priority Quests
+    high_priority_quests = st.session_state.quests.top_open('high', 2)
+    
+    if high_priority_quests:
+        st.markdown("### 🎯 Nhiệm vụ ưu tiên")
+        
+        for quest in high_priority_quests:
+            st.markdown('<div class="quest-card">', unsafe_allow_html=True)
+            
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                st.markdown(f"""
+                <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">
+                    <div style="width: 8px; height: 8px; background: {quest.get_priority_color()}; border-radius: 50%;"></div>
+                    <h4 style="color: white; margin: 0; font-size: 1.1rem;">{quest.title}</h4>
+                </div>
+                <p style="color: #D1D5DB; font-size: 0.9rem; margin-bottom: 1rem;">{quest.description}</p>
+                <div style="display: flex; gap: 1rem; font-size: 0.8rem;">
+                    <span>Độ khó: {quest.get_difficulty_stars()}</span>
+                    <span style="color: #F97316;">⏰ {quest.deadline}</span>
+                    <span style="color: #22C55E;">+{quest.reward_exp} EXP</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                if st.button("✅ Hoàn thành", key=f"complete_{quest.id}", help="Hoàn thành nhiệm vụ"):
+                    complete_quest(quest.id)
+                    st.rerun()
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+    
+    elif len(st.session_state.quests) == 0:
+        render_empty_state(
+            "🎯",
+            "Chưa có nhiệm vụ nào",
+            "Thêm nhiệm vụ trong Google Sheets (tab Quests) để bắt đầu cuộc phiêu lưu RPG của bạn.",
+            "Xem hướng dẫn",
+            lambda: setattr(st.session_state, 'active_tab', 'quests') or st.rerun()
+        )
+    else:
+        render_empty_state(
+            "✅",
+            "Hoàn thành tuyệt vời!",
+            "Bạn đã hoàn thành tất cả nhiệm vụ ưu tiên. Thêm nhiệm vụ mới để tiếp tục phát triển.",
+            "Xem tất cả nhiệm vụ",
+            lambda: setattr(st.session_state, 'active_tab', 'quests') or st.rerun()
+        )
+    
+    # Stats overview
+    st.markdown("### 📊 Thống kê tổng quan")
+    stat_col1, stat_col2 = st.columns(2)
+    
+    completed_quests = st.session_state.aggregates.completed_quests
+    unlocked_achievements = st.session_state.aggregates.unlocked_achievements
+    
+    with stat_col1:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, rgba(59, 130, 246, 0.2), rgba(29, 78, 216, 0.2)); 
+                    border: 1px solid rgba(59, 130, 246, 0.2); border-radius: 1rem; padding: 1.5rem; text-align: center;">
+            <div style="font-size: 2rem; font-weight: bold; color: white; margin-bottom: 0.25rem;">{completed_quests}</div>
+            <div style="color: #93C5FD; font-size: 0.9rem;">Nhiệm vụ hoàn thành</div>
+            <div style="color: #60A5FA; font-size: 0.75rem;">Tổng cộng</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with stat_col2:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, rgba(139, 92, 246, 0.2), rgba(109, 40, 217, 0.2)); 
+                    border: 1px solid rgba(139, 92, 246, 0.2); border-radius: 1rem; padding: 1.5rem; text-align: center;">
+            <div style="font-size: 2rem; font-weight: bold; color: white; margin-bottom: 0.25rem;">{unlocked_achievements}</div>
+            <div style="color: #C4B5FD; font-size: 0.9rem;">Danh hiệu đạt được</div>
+            <div style="color: #A78BFA; font-size: 0.75rem;">Tổng cộng</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_character():
+    """Render character page"""
+    st.markdown("### 👤 Thông tin nhân vật")
+    
+    # Character card
+    st.markdown('<div class="card gradient-card">', unsafe_allow_html=True)
+    
+    # Avatar and basic info
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        render_avatar(st.session_state.character.avatar, 120)
+        if st.button("✏️ Chỉnh sửa", key="edit_character", help="Chỉnh sửa thông tin nhân vật"):
+            st.session_state.show_character_modal = True
+            st.rerun()
+    
+    with col2:
+        st.markdown(f"""
+        <h2 style="color: white; margin: 0 0 0.5rem 0;">{st.session_state.character.name or 'Hero'}</h2>
+        <div style="color: #8B5CF6; font-size: 1.1rem; margin-bottom: 0.5rem;">Level {st.session_state.character.level} RPG Developer</div>
+        """, unsafe_allow_html=True)
+        
+        if st.session_state.character.birth_year:
+            st.markdown(f'<div style="color: #9CA3AF; margin-bottom: 1rem;">{st.session_state.character.get_age_display()}</div>', unsafe_allow_html=True)
+        
+        st.markdown("**Kinh nghiệm**")
+        render_progress_bar(st.session_state.character.exp, st.session_state.character.exp_to_next)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Stats
+    st.markdown("### 📊 Chỉ số chi tiết")
+    stat_cols = st.columns(5)
+    stat_icons = {'WILL': '❤️', 'PHY': '⚔️', 'MEN': '🧠', 'AWR': '👁️', 'EXE': '⚡'}
+    stat_colors = {'WILL': 'red', 'PHY': 'orange', 'MEN': 'blue', 'AWR': 'purple', 'EXE': 'yellow'}
+    
+    for i, (stat, value) in enumerate(st.session_state.character.stats.items()):
+        with stat_cols[i]:
+            render_stat_box(stat_icons[stat], stat, value, stat_colors[stat])
+    
+    # Recent achievements
+    index = get_list_index('achievements', st.session_state.achievements, ACHIEVEMENT_INDEX_FIELDS)
+    recent_achievements = [st.session_state.achievements[pos] for pos in index.select({'state': 'unlocked'})[-4:]]
+    if recent_achievements:
+        st.markdown("### 🏆 Danh hiệu gần đây")
+        
+        ach_cols = st.columns(min(4, len(recent_achievements)))
+        for i, achievement in enumerate(recent_achievements):
+            with ach_cols[i]:
+                st.markdown(f"""
+                <div style="background: rgba(75, 85, 99, 0.5); border-radius: 1rem; padding: 1rem; text-align: center; border: 1px solid rgba(75, 85, 99, 0.3);">
+                    <div style="font-size: 2rem; margin-bottom: 0.5rem;">{achievement.icon}</div>
+                    <div style="color: {achievement.get_tier_color()}; font-size: 0.9rem; font-weight: bold; margin-bottom: 0.25rem;">
+                        {achievement.title}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    # Personal info
+    st.markdown("### 📋 Thông tin cá nhân")
+    st.markdown('<div class="card">', unsafe_allow_html=True)
+    
+    aggregates = st.session_state.aggregates
+    info_data = [
+        ("Tên nhân vật:", st.session_state.character.name or "Chưa đặt tên"),
+        ("Năm sinh:", str(st.session_state.character.birth_year) if st.session_state.character.birth_year else "Chưa cập nhật"),
+        ("Tuổi hiện tại:", st.session_state.character.get_age_display() or "Chưa xác định"),
+        ("Tổng EXP kiếm được:", str(st.session_state.character.exp)),
+        ("Nhiệm vụ hoàn thành:", f"{aggregates.completed_quests}/{aggregates.quest_total}"),
+        ("Tỷ lệ hoàn thành:", f"{aggregates.completion_rate:.0f}%"),
+        ("Danh hiệu đạt được:", f"{aggregates.unlocked_achievements}/{aggregates.achievement_total}")
+    ]
+    
+    for label, value in info_data:
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.markdown(f'<span style="color: #9CA3AF;">{label}</span>', unsafe_allow_html=True)
+        with col2:
+            st.markdown(f'<span style="color: white; font-weight: bold;">{value}</span>', unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def render_quests():
+    """Render quests page"""
+    # Header
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("### ⚔️ Nhiệm vụ")
+    
+    with col2:
+        if st.button("🔄 Đồng bộ", key="sync_quests", help="Đồng bộ với Google Sheets"):
+            if st.session_state.sheets_manager:
+                sync_from_sheets(force=True)
+                st.rerun()
+    
+    if len(st.session_state.quests) == 0:
+        render_empty_state(
+            "⚔️",
+            "Chưa có nhiệm vụ nào",
+            "Thêm nhiệm vụ trong Google Sheets tab 'Quests' với cấu trúc: Title | Description | RequiredStat | Difficulty | Deadline | RewardEXP | RewardStat | Status | Category | Priority",
+            "Mở cài đặt",
+            lambda: setattr(st.session_state, 'show_settings', True) or st.rerun()
+        )
+        
+        st.markdown("""
+        <div style="background: rgba(75, 85, 99, 0.5); border-radius: 1rem; padding: 1rem; margin-top: 1rem;">
+            <div style="color: #9CA3AF; font-size: 0.8rem;">
+                <strong>Ví dụ:</strong> "Tập thể dục | Chạy bộ 30 phút | PHY | 3 | Hôm nay | 50 | PHY +1 | todo | health | high"
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        return
+    
+    render_quest_list()
+
+# Resource detail fields indexed per resource; only active details are shown
+DETAIL_INDEX_FIELDS = {
+    'status': lambda detail: detail['status'],
+    'type': lambda detail: detail['type']
+}
+DETAILS_PAGE_SIZE = 3
+
+@st.fragment
+def render_quest_list():
+    """Render the quest cards; completing a quest reruns only this fragment"""
+    pending_quests = st.session_state.aggregates.pending_quests
+    st.markdown(f'<p style="color: #9CA3AF; font-size: 0.9rem;">{pending_quests} nhiệm vụ đang chờ</p>', unsafe_allow_html=True)
+    
+    # The quest store is its own index
+    render_list_window(
+        'quests',
+        st.session_state.quests,
+        render_quest_cards,
+        index=st.session_state.quests,
+        filter_labels={'status': 'Trạng thái', 'priority': 'Ưu tiên', 'category': 'Danh mục'}
+    )
+    
+    selected = len(st.session_state.selected_quests)
+    if selected:
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.button(f"✅ Hoàn thành {selected} nhiệm vụ đã chọn", key="complete_selected_quests",
+                      on_click=complete_selected_quests, use_container_width=True)
+        with col2:
+            st.button("✖️ Bỏ chọn", key="clear_quest_selection", on_click=clear_quest_selection,
+                      use_container_width=True)
+    
+    # The page-level write status is not rerun with this fragment
+    saving = len([t for t in st.session_state.pending_writes if not t.done()])
+    if saving:
+        st.markdown(f'<div style="color: #9CA3AF; font-size: 0.8rem; text-align: center;">⏳ Đang lưu {saving} thay đổi...</div>', unsafe_allow_html=True)
+
+def render_quest_cards(quests):
+    """Render a page of quest cards
+    
+    All cards go into one markdown element, with a compact column of
+    complete buttons (one per open quest) beside it and a single
+    selection widget for bulk completion below.
+    """
+    cards = ''.join(quest_card_html(quest) for quest in quests)
+    titles = {quest.id: quest.title for quest in quests if quest.status != 'completed'}
+    if not titles:
+        st.markdown(cards, unsafe_allow_html=True)
+        return
+    
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        st.markdown(cards, unsafe_allow_html=True)
+    with col2:
+        for quest_id, title in titles.items():
+            st.button(f"✅ {title}", key=f"complete_quest_{quest_id}", help="Hoàn thành nhiệm vụ",
+                      on_click=complete_quest, args=(quest_id,), use_container_width=True)
+    
+    # The widget shows the page's part of the selection, which may span pages
+    page_ids = list(titles)
+    st.session_state.quest_page_selection = [quest_id for quest_id in page_ids if quest_id in st.session_state.selected_quests]
+    st.multiselect(
+        "Chọn nhiệm vụ để hoàn thành",
+        page_ids,
+        key="quest_page_selection",
+        format_func=lambda quest_id: titles[quest_id],
+        on_change=select_page_quests,
+        args=(page_ids,),
+        placeholder="Chọn nhiệm vụ trên trang này"
+    )
+
+def render_resources():
+    """Render resources page"""
+    st.markdown("### 💎 Nguồn vốn phát triển")
+    st.markdown('<p style="color: #9CA3AF; font-size: 0.9rem; margin-bottom: 2rem;">4 khía cạnh cốt lõi cho sự phát triển toàn diện</p>', unsafe_allow_html=True)
+    
+    for resource in st.session_state.resources:
+        render_resource_card(resource.name)
+    
+    # Usage guide
+    st.markdown("### 📋 Hướng dẫn cập nhật")
+    st.markdown("""
+    <div style="background: rgba(75, 85, 99, 0.5); border-radius: 1rem; padding: 1.5rem; margin-top: 1rem;">
+        <p style="color: #D1D5DB; margin-bottom: 1rem;">Dữ liệu chi tiết nguồn vốn được lưu trong Google Sheets tab 'ResourceDetails':</p>
+        <div style="background: rgba(0, 0, 0, 0.3); border-radius: 0.5rem; padding: 1rem; font-family: monospace; font-size: 0.8rem;">
+            <div style="color: #E5E7EB;">ResourceName | DetailName | Amount | Type | Notes | Date | Status</div>
+            <div style="color: #9CA3AF; margin-top: 0.5rem;">Tài chính | Bản thân | 50000000 | asset | Tiền tiết kiệm | 24/06/2025 | active</div>
+            <div style="color: #9CA3AF;">Tài chính | Ba | 35000000 | asset | Hỗ trợ gia đình | 24/06/2025 | active</div>
+        </div>
+        <div style="color: #9CA3AF; font-size: 0.8rem; margin-top: 1rem;">
+            <strong>Types:</strong> asset (tài sản), loan (khoản vay), investment (đầu tư), income (thu nhập), expense (chi phí)
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+@st.fragment
+def render_resource_card(resource_name):
+    """Render one resource card as its own fragment"""
+    resource = next((r for r in st.session_state.resources if r.name == resource_name), None)
+    if not resource:
+        return
+    
+    st.markdown('<div class="resource-card">', unsafe_allow_html=True)
+    
+    # Resource header
+    col1, col2, col3 = st.columns([1, 3, 1])
+    
+    with col1:
+        st.markdown(f"""
+        <div style="width: 60px; height: 60px; background: linear-gradient(135deg, {resource.color.replace('from-', '').replace(' to-', ', ')}); 
+                    border-radius: 1rem; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">
+            {resource.icon}
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        total_value = st.session_state.aggregates.resource_total(resource.name)
+        st.markdown(f"""
+        <h3 style="color: white; margin: 0 0 0.25rem 0;">{resource.name}</h3>
+        <p style="color: #D1D5DB; font-size: 0.9rem; margin: 0 0 0.5rem 0;">{resource.description}</p>
+        """, unsafe_allow_html=True)
+        
+        if total_value > 0:
+            st.markdown(f'<p style="color: {resource.text_color.replace("text-", "")}; font-weight: bold; margin: 0;">Tổng giá trị: {format_currency(total_value)} VND</p>', unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div style="text-align: center;">
+            <div style="color: white; font-size: 1.2rem; font-weight: bold;">Lv.{resource.level}</div>
+            <div style="color: {resource.text_color.replace("text-", "")}; font-size: 0.75rem;">Cấp độ</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Progress bar
+    st.markdown("**Tiến độ đến level tiếp theo**")
+    render_progress_bar(resource.progress, 100)
+    
+    # Resource details
+    details = st.session_state.resource_details.get(resource.name, [])
+    details_key = f"resource_details_{resource.name}"
+    index = get_list_index(details_key, details, DETAIL_INDEX_FIELDS, 'resource_details')
+    active_count = index.count('status', 'active')
+    
+    st.markdown(f"**Chi tiết ({active_count})**")
+    
+    if not active_count:
+        st.markdown("""
+        <div style="text-align: center; padding: 1rem; color: #6B7280;">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">Chưa có chi tiết nào</div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button(f"➕ Thêm chi tiết đầu tiên", key=f"add_first_{resource.name}"):
+            open_resource_modal(resource.name)
+    else:
+        render_list_window(
+            details_key,
+            details,
+            lambda page: render_resource_details(resource.name, page),
+            fields=DETAIL_INDEX_FIELDS,
+            where={'status': 'active'},
+            page_size=DETAILS_PAGE_SIZE,
+            version_key='resource_details'
+        )
+        
+        if st.button(f"➕ Thêm chi tiết", key=f"add_{resource.name}"):
+            open_resource_modal(resource.name)
+    
+    # Resource info footer
+    if resource.next_milestone:
+        st.markdown(f'<div style="color: {resource.text_color.replace("text-", "")}; font-size: 0.8rem; text-align: center; margin-top: 1rem; background: rgba(75, 85, 99, 0.5); padding: 0.5rem; border-radius: 0.5rem;">Mốc tiếp: {resource.next_milestone}</div>', unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+def render_resource_details(resource_name, details):
+    """Render a page of resource detail rows"""
+    type_icons = {'asset': '💰', 'loan': '📋', 'investment': '📈', 'income': '💸', 'expense': '💳'}
+    type_colors = {'asset': '#22C55E', 'loan': '#F97316', 'investment': '#3B82F6', 'income': '#10B981', 'expense': '#EF4444'}
+    
+    for detail in details:
+        col1, col2, col3 = st.columns([1, 4, 1])
+        
+        with col1:
+            st.markdown(f'<div style="font-size: 1.2rem; text-align: center;">{type_icons.get(detail["type"], "💰")}</div>', unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown(f"""
+            <div style="color: white; font-weight: bold; margin-bottom: 0.25rem;">{detail['name']}</div>
+            <div style="display: flex; gap: 0.5rem; font-size: 0.8rem;">
+                <span style="color: {type_colors.get(detail['type'], '#22C55E')};">{format_currency(detail['amount'])} VND</span>
+                <span style="color: #6B7280;">•</span>
+                <span style="color: #9CA3AF; text-transform: capitalize;">{detail['type']}</span>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            if st.button("✏️", key=f"edit_{detail['id']}", help="Chỉnh sửa"):
+                open_resource_modal(resource_name, detail)
+
+def open_resource_modal(resource_name, detail=None):
+    """Open the resource modal, which lives outside the card fragments"""
+    st.session_state.selected_resource = resource_name
+    if detail is not None:
+        st.session_state.resource_form = detail.copy()
+    st.session_state.show_resource_modal = True
+    st.rerun(scope="app")
+
+# Achievement fields offered as filters on the achievements page
+ACHIEVEMENT_INDEX_FIELDS = {
+    'tier': lambda achievement: achievement.tier,
+    'state': lambda achievement: 'unlocked' if achievement.unlocked else 'locked',
+    'category': lambda achievement: achievement.category
+}
+
+def render_achievements():
+    """Render achievements page"""
+    st.markdown("### 🏆 Danh hiệu & Thành tựu")
+    
+    unlocked_count = st.session_state.aggregates.unlocked_achievements
+    total_count = st.session_state.aggregates.achievement_total
+    
+    st.markdown(f'<p style="color: #9CA3AF; font-size: 0.9rem; margin-bottom: 2rem;">{unlocked_count}/{total_count} đã mở khóa</p>', unsafe_allow_html=True)
+    
+    if len(st.session_state.achievements) == 0:
+        render_empty_state(
+            "🏆",
+            "Chưa có danh hiệu nào",
+            "Thêm danh hiệu trong Google Sheets tab 'Achievements' với cấu trúc: Title | Description | Icon | Tier | Unlocked | UnlockedDate | Progress | Condition | Category",
+            "Cài đặt Google Sheets",
+            lambda: setattr(st.session_state, 'show_settings', True) or st.rerun()
+        )
+        
+        st.markdown("""
+        <div style="background: rgba(75, 85, 99, 0.5); border-radius: 1rem; padding: 1rem; margin-top: 1rem;">
+            <div style="color: #9CA3AF; font-size: 0.8rem;">
+                <strong>Ví dụ:</strong> "First Steps | Hoàn thành nhiệm vụ đầu tiên | 🎯 | bronze | TRUE | 20/06/2025 | 100 | Complete 1 quest | general"
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        return
+    
+    # Achievement stats
+    st.markdown("### 📊 Thống kê theo hạng")
+    stat_cols = st.columns(4)
+    tiers = ['bronze', 'silver', 'gold', 'legendary']
+    tier_colors = {'bronze': '#D97706', 'silver': '#6B7280', 'gold': '#F59E0B', 'legendary': '#8B5CF6'}
+    
+    for i, tier in enumerate(tiers):
+        count = st.session_state.aggregates.unlocked_by_tier[tier]
+        with stat_cols[i]:
+            st.markdown(f"""
+            <div style="background: rgba(75, 85, 99, 0.5); border-radius: 1rem; padding: 1rem; text-align: center; border: 1px solid rgba(75, 85, 99, 0.5);">
+                <div style="color: {tier_colors[tier]}; font-size: 1.5rem; font-weight: bold; margin-bottom: 0.25rem;">{count}</div>
+                <div style="color: #9CA3AF; font-size: 0.75rem; text-transform: capitalize;">{tier}</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Achievement list
+    st.markdown("### 🎖️ Danh sách danh hiệu")
+    
+    render_list_window(
+        'achievements',
+        st.session_state.achievements,
+        render_achievement_cards,
+        fields=ACHIEVEMENT_INDEX_FIELDS,
+        filter_labels={'tier': 'Cấp bậc', 'state': 'Trạng thái', 'category': 'Danh mục'}
+    )
+
+def render_achievement_cards(achievements):
+    """Render a page of achievement cards"""
+    for achievement in achievements:
+        render_achievement_card(achievement)
+
+# Backup interval choices, in hours
+BACKUP_INTERVALS = [6, 12, 24, 72, 168]
+
+def render_backup_settings():
+    """Render the backup list with backup and restore actions"""
+    st.markdown("#### 🗄️ Sao lưu")
+    
+    manager = st.session_state.sheets_manager
+    if not manager:
+        st.markdown('<p style="color: #9CA3AF; font-size: 0.85rem;">Kết nối Google Sheets để sao lưu dữ liệu</p>', unsafe_allow_html=True)
+        return
+    
+    from components.backup import get_backup_engine
+    engine = get_backup_engine(manager.sheet_id)
+    if engine.last_error:
+        st.markdown(f'<p style="color: #EF4444; font-size: 0.85rem;">⚠️ Sao lưu tự động thất bại: {engine.last_error}</p>', unsafe_allow_html=True)
+    
+    if st.button("📦 Sao lưu ngay", key="backup_now", disabled=st.session_state.loading):
+        try:
+            values = manager.read_local_values()
+            manifest = engine.snapshot(values) if values else None
+            if manifest:
+                st.session_state.success_message = f"Đã sao lưu ({manifest['new_chunks']} khối mới, {manifest['new_bytes'] / 1024:.0f} KB)"
+            elif values:
+                st.session_state.success_message = "Dữ liệu không đổi kể từ bản sao lưu trước"
+            else:
+                st.session_state.error_message = "Chưa có dữ liệu đồng bộ để sao lưu"
+        except Exception as e:
+            st.session_state.error_message = f"Lỗi sao lưu: {str(e)}"
+        st.rerun()
+    
+    snapshots = engine.list_snapshots()
+    if not snapshots:
+        st.markdown('<p style="color: #9CA3AF; font-size: 0.85rem;">Chưa có bản sao lưu nào</p>', unsafe_allow_html=True)
+        return
+    
+    labels = {
+        snapshot['id']: f"{datetime.fromisoformat(snapshot['created_at']).strftime('%d/%m/%Y %H:%M')} · {sum(entry['rows'] for entry in snapshot['ranges'].values())} dòng"
+        for snapshot in snapshots
+    }
+    snapshot_id = st.selectbox("Bản sao lưu", options=list(labels), format_func=labels.get, key="backup_snapshot")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("↩️ Khôi phục cục bộ", key="restore_local", disabled=st.session_state.loading,
+                     help="Lần đồng bộ tiếp theo sẽ thay bằng dữ liệu trên Google Sheets"):
+            restore_from_backup(snapshot_id)
+            st.rerun()
+    with col2:
+        if st.button("☁️ Khôi phục lên Google Sheets", key="restore_sheets",
+                     disabled=st.session_state.loading or not st.session_state.connection_status['connected'],
+                     help="Ghi đè dữ liệu hiện có trên Google Sheets bằng bản sao lưu"):
+            st.session_state.confirm_restore = snapshot_id
+            st.rerun()
+    
+    # Overwriting the sheet cannot be undone, so ask once more
+    if st.session_state.confirm_restore == snapshot_id:
+        st.markdown(f'<p style="color: #F59E0B; font-size: 0.85rem;">⚠️ Dữ liệu trên Google Sheets sẽ bị ghi đè bằng bản sao lưu {labels[snapshot_id]}. Các thay đổi chưa lưu lên Google Sheets sẽ bị hủy.</p>', unsafe_allow_html=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("✅ Xác nhận ghi đè", key="restore_sheets_confirm", disabled=st.session_state.loading):
+                st.session_state.confirm_restore = None
+                restore_from_backup(snapshot_id, to_sheets=True)
+                st.rerun()
+        with col2:
+            if st.button("✖️ Hủy", key="restore_sheets_cancel"):
+                st.session_state.confirm_restore = None
+                st.rerun()
+
+def render_settings():
+    """Render settings page"""
+    st.markdown("### ⚙️ Cài đặt")
+    st.markdown('<p style="color: #9CA3AF; font-size: 0.9rem; margin-bottom: 2rem;">Kết nối và đồng bộ với Google Sheets</p>', unsafe_allow_html=True)
+    
+    # Connection status
+    st.markdown("#### 📊 Trạng thái kết nối")
+    
+    if st.session_state.connection_status['last_sync']:
+        last_sync = st.session_state.connection_status['last_sync']
+        st.markdown(f'<p style="color: #9CA3AF; font-size: 0.85rem;">Đồng bộ lần cuối: {last_sync.strftime("%d/%m/%Y %H:%M:%S")}</p>', unsafe_allow_html=True)
+    
+    for sheet_name, error in st.session_state.connection_status.get('sheet_errors', {}).items():
+        st.markdown(f'<p style="color: #EF4444; font-size: 0.85rem;">⚠️ {sheet_name}: {error}</p>', unsafe_allow_html=True)
+    
+    if st.session_state.sheets_manager:
+        limiter_stats = st.session_state.sheets_manager.rate_limiter.get_stats()
+        if limiter_stats['delayed_requests'] or limiter_stats['shed_requests']:
+            st.markdown(f'<p style="color: #F59E0B; font-size: 0.85rem;">Giới hạn API: {limiter_stats["delayed_requests"]} yêu cầu phải chờ (trung bình {limiter_stats["average_wait"]:.1f} giây), {limiter_stats["shed_requests"]} yêu cầu bị từ chối</p>', unsafe_allow_html=True)
+        
+        cache_stats = st.session_state.sheets_manager.cache.get_stats()
+        if cache_stats['hits']:
+            st.markdown(f'<p style="color: #9CA3AF; font-size: 0.85rem;">Bộ nhớ đệm: {cache_stats["hit_rate"]:.0%} lượt đọc dùng lại dữ liệu ({cache_stats["entries"]} vùng đang lưu)</p>', unsafe_allow_html=True)
+    
+    # Action buttons
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("🔗 Kiểm tra kết nối", key="test_connection", 
+                    disabled=st.session_state.loading or not st.session_state.settings['sheet_id'] or not st.session_state.settings['api_key']):
+            test_connection()
+            st.rerun()
+    
+    with col2:
+        if st.button("🔄 Đồng bộ ngay", key="sync_now", 
+                    disabled=st.session_state.syncing or not st.session_state.connection_status['connected']):
+            sync_from_sheets(force=True)
+            st.rerun()
+    
+    with col3:
+        if st.button("💾 Lưu cài đặt", key="save_settings"):
+            save_settings()
+            st.rerun()
+    
+    st.divider()
+    
+    # Google Sheets configuration
+    st.markdown("#### 🔗 Cấu hình Google Sheets")
+    
+    with st.form("settings_form"):
+        sheet_id = st.text_input(
+            "Google Sheet ID *",
+            value=st.session_state.settings['sheet_id'],
+            placeholder="1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms",
+            help="Lấy từ URL: docs.google.com/spreadsheets/d/[SHEET_ID]/edit"
+        )
+        
+        api_key = st.text_input(
+            "Google Sheets API Key *",
+            value=st.session_state.settings['api_key'],
+            type="password",
+            placeholder="AIzaSyD...",
+            help="Tạo API Key tại Google Cloud Console"
+        )
+        
+        auto_sync = st.checkbox(
+            "Tự động đồng bộ",
+            value=st.session_state.settings['auto_sync'],
+            help="Đồng bộ định kỳ với Google Sheets"
+        )
+        
+        if auto_sync:
+            sync_interval = st.selectbox(
+                "Tần suất đồng bộ",
+                options=[1, 5, 15, 30, 60],
+                index=[1, 5, 15, 30, 60].index(st.session_state.settings['sync_interval']),
+                format_func=lambda x: f"Mỗi {x} phút" if x < 60 else f"Mỗi {x//60} giờ"
+            )
+        else:
+            sync_interval = st.session_state.settings['sync_interval']
+        
+        delta_sync = st.checkbox(
+            "Đồng bộ tăng dần",
+            value=st.session_state.settings.get('delta_sync', True),
+            help="Chỉ cập nhật những dòng đã thay đổi kể từ lần đồng bộ trước"
+        )
+        
+        backup_enabled = st.checkbox(
+            "Tự động sao lưu",
+            value=st.session_state.settings.get('backup_enabled', True),
+            help="Sao lưu dữ liệu đã đồng bộ vào thư mục backups theo định kỳ"
+        )
+        
+        backup_interval = st.session_state.settings.get('backup_interval', 24)
+        backup_interval = st.selectbox(
+            "Tần suất sao lưu",
+            options=BACKUP_INTERVALS,
+            index=BACKUP_INTERVALS.index(backup_interval if backup_interval in BACKUP_INTERVALS else 24),
+            format_func=lambda x: f"Mỗi {x} giờ" if x < 24 else f"Mỗi {x//24} ngày"
+        )
+        
+        if st.form_submit_button("💾 Lưu cài đặt", use_container_width=True):
+            st.session_state.settings.update({
+                'sheet_id': sheet_id,
+                'api_key': api_key,
+                'auto_sync': auto_sync,
+                'sync_interval': sync_interval,
+                'delta_sync': delta_sync,
+                'backup_enabled': backup_enabled,
+                'backup_interval': backup_interval
+            })
+            save_settings()
+            
+            if sheet_id and api_key:
+                test_connection()
+            
+            st.rerun()
+    
+    st.divider()
+    
+    render_backup_settings()
+    
+    st.divider()
+    
+    # Setup guide
+    st.markdown("#### 📋 Hướng dẫn thiết lập")
+    
+    with st.expander("1. Tạo Google Sheet mới"):
+        st.markdown("""
+        - Tạo Google Sheet mới
+        - Tạo các sheet tabs: **Character**, **Quests**, **Achievements**, **Goals**, **Resources**, **ResourceDetails**, **Chat**
+        - Đặt quyền "Anyone with the link can view" hoặc "edit"
+        """)
+    
+    with st.expander("2. Lấy API Key"):
+        st.markdown("""
+        - Truy cập [Google Cloud Console](https://console.cloud.google.com)
+        - Tạo project mới hoặc chọn project có sẵn
+        - Bật Google Sheets API
+        - Tạo API Key trong mục Credentials
+        """)
+    
+    with st.expander("3. Cấu trúc dữ liệu"):
+        st.markdown("""
+        **Sheet "Quests" (A2:J):**
+        ```
+        Title | Description | RequiredStat | Difficulty | Deadline | RewardEXP | RewardStat | Status | Category | Priority
+        ```
+        
+        **Sheet "Achievements" (A2:I):**
+        ```
+        Title | Description | Icon | Tier | Unlocked | UnlockedDate | Progress | Condition | Category
+        ```
+        
+        **Sheet "ResourceDetails" (A2:G):**
+        ```
+        ResourceName | DetailName | Amount | Type | Notes | Date | Status
+        ```
+        
+        **Sheet "Character" (A1:B):**
+        ```
+        name | Hero
+        avatar | https://example.com/avatar.jpg
+        birthYear | 1995
+        level | 5
+        exp | 750
+        expToNext | 1000
+        stats | {"WILL":15,"PHY":12,"MEN":14,"AWR":13,"EXE":16}
+        ```
+        """)
+
+# Modal render functions
+def render_character_modal():
+    """Render character edit modal"""
+    if not st.session_state.show_character_modal:
+        return
+    
+    with st.container():
+        st.markdown("### ✏️ Chỉnh sửa nhân vật")
+        
+        with st.form("character_form"):
+            name = st.text_input(
+                "Tên nhân vật *",
+                value=st.session_state.character.name,
+                placeholder="Nhập tên nhân vật...",
+                max_chars=50
+            )
+            
+            avatar = st.text_input(
+                "Avatar URL",
+                value=st.session_state.character.avatar,
+                placeholder="https://example.com/avatar.jpg hoặc emoji 🧙‍♂️",
+                help="Nhập URL ảnh hoặc emoji"
+            )
+            
+            birth_year = st.number_input(
+                "Năm sinh",
+                min_value=1900,
+                max_value=datetime.now().year,
+                value=st.session_state.character.birth_year or datetime.now().year - 25,
+                help="Tùy chọn - để trống nếu không muốn hiển thị tuổi"
+            )
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                if st.form_submit_button("💾 Lưu thay đổi", use_container_width=True):
+                    if not name.strip():
+                        st.error("Vui lòng nhập tên nhân vật")
+                    else:
+                        # Update character
+                        st.session_state.character.name = name
+                        st.session_state.character.avatar = avatar
+                        st.session_state.character.birth_year = birth_year if birth_year != datetime.now().year - 25 else None
+                        
+                        # Update to sheets if connected
+                        if st.session_state.sheets_manager and st.session_state.connection_status['connected']:
+                            try:
+                                st.session_state.sheets_manager.update_character(st.session_state.character)
+                                st.session_state.success_message = "Cập nhật nhân vật thành công!"
+                            except Exception as e:
+                                st.session_state.error_message = f"Lỗi cập nhật: {str(e)}"
+                        
+                        st.session_state.show_character_modal = False
+                        st.rerun()
+            
+            with col2:
+                if st.form_submit_button("❌ Hủy", use_container_width=True):
+                    st.session_state.show_character_modal = False
+                    st.rerun()
+
+def render_resource_modal():
+    """Render resource detail modal"""
+    if not st.session_state.show_resource_modal or not st.session_state.selected_resource:
+        return
+    
+    with st.container():
+        st.markdown(f"### {'✏️ Chỉnh sửa' if 'id' in st.session_state.get('resource_form', {}) else '➕ Thêm'} chi tiết")
+        st.markdown(f"**{st.session_state.selected_resource}**")
+        
+        with st.form("resource_form"):
+            form_data = st.session_state.get('resource_form', {})
+            
+            name = st.text_input(
+                "Tên chi tiết *",
+                value=form_data.get('name', ''),
+                placeholder="VD: Bản thân, Ba, Mượn mẹ..."
+            )
+            
+            amount = st.number_input(
+                "Số tiền (VND) *",
+                min_value=0.0,
+                value=float(form_data.get('amount', 0)),
+                format="%.0f",
+                step=1000000.0
+            )
+            
+            type_options = ["asset", "loan", "investment", "income", "expense"]
+            type_labels = ["💰 Tài sản", "📋 Khoản vay", "📈 Đầu tư", "💸 Thu nhập", "💳 Chi phí"]
+            
+            type_selected = st.selectbox(
+                "Loại *",
+                options=type_options,
+                index=type_options.index(form_data.get('type', 'asset')),
+                format_func=lambda x: type_labels[type_options.index(x)]
+            )
+            
+            notes = st.text_area(
+                "Ghi chú",
+                value=form_data.get('notes', ''),
+                placeholder="Mô tả chi tiết về nguồn vốn này...",
+                height=100
+            )
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                if st.form_submit_button("💾 Lưu", use_container_width=True):
+                    if not name or not amount:
+                        st.error("Vui lòng điền đầy đủ thông tin bắt buộc")
+                    else:
+                        # Create new detail
+                        new_detail = {
+                            'id': int(time.time()),
+                            'name': name,
+                            'amount': amount,
+                            'type': type_selected,
+                            'notes': notes,
+                            'date': datetime.now().strftime('%d/%m/%Y'),
+                            'status': 'active'
+                        }
+                        
+                        # Update local state
+                        if st.session_state.selected_resource not in st.session_state.resource_details:
+                            st.session_state.resource_details[st.session_state.selected_resource] = []
+                        
+                        st.session_state.resource_details[st.session_state.selected_resource].append(new_detail)
+                        st.session_state.aggregates.add_resource_detail(st.session_state.selected_resource, new_detail)
+                        touch_lists('resource_details')
+                        record_events([Event(
+                            time.time(), EventKind.DETAIL_ADDED,
+                            code=RESOURCE_TYPES.index(type_selected) if type_selected in RESOURCE_TYPES else 0,
+                            ref=name_code(st.session_state.selected_resource),
+                            amount=float(amount)
+                        )])
+                        
+                        # Update to sheets if connected
+                        if st.session_state.sheets_manager and st.session_state.connection_status['connected']:
+                            try:
+                                st.session_state.sheets_manager.add_resource_detail(st.session_state.selected_resource, new_detail)
+                                st.session_state.success_message = "Thêm chi tiết thành công!"
+                            except Exception as e:
+                                st.session_state.error_message = f"Lỗi thêm chi tiết: {str(e)}"
+                        
+                        st.session_state.show_resource_modal = False
+                        st.session_state.selected_resource = None
+                        if 'resource_form' in st.session_state:
+                            del st.session_state.resource_form
+                        st.rerun()
+            
+            with col2:
+                if st.form_submit_button("❌ Hủy", use_container_width=True):
+                    st.session_state.show_resource_modal = False
+                    st.session_state.selected_resource = None
+                    if 'resource_form' in st.session_state:
+                        del st.session_state.resource_form
+                    st.rerun()
+
+def render_chat_modal():
+    """Render chat modal"""
+    if not st.session_state.show_chat:
+        return
+    
+    with st.container():
+        render_chat_panel()
+
+CHAT_PAGE_SIZE = 10
+
+@st.fragment
+def render_chat_panel():
+    """Render the chat messages and input; sending a note reruns only this fragment"""
+    st.markdown("### 💬 Ghi chú & Suy nghĩ")
+    st.markdown('<p style="color: #9CA3AF; font-size: 0.9rem;">Không gian riêng tư của bạn</p>', unsafe_allow_html=True)
+    
+    # Chat messages, newest page first
+    if st.session_state.chat_messages:
+        render_list_window('chat', st.session_state.chat_messages, render_chat_messages,
+                           page_size=CHAT_PAGE_SIZE, from_end=True)
+    else:
+        st.markdown("""
+        <div style="text-align: center; padding: 2rem; color: #9CA3AF;">
+            <div style="font-size: 3rem; margin-bottom: 1rem;">💬</div>
+            <p>Chưa có ghi chú nào</p>
+            <p style="font-size: 0.9rem;">Hãy chia sẻ suy nghĩ của bạn</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Chat input
+    with st.form("chat_form"):
+        message_text = st.text_area(
+            "Chia sẻ suy nghĩ của bạn...",
+            placeholder="Nhập ghi chú, suy nghĩ, hoặc cảm xúc của bạn...",
+            height=100,
+            label_visibility="collapsed"
+        )
+        
+        col1, col2 = st.columns([3, 1])
+        
+        with col2:
+            if st.form_submit_button("📤 Gửi", use_container_width=True):
+                if message_text.strip():
+                    new_message = {
+                        'id': int(time.time()),
+                        'text': message_text,
+                        'timestamp': datetime.now().strftime("%H:%M"),
+                        'type': 'note',
+                        'date': datetime.now().strftime("%d/%m/%Y"),
+                        'author': 'user'
+                    }
+                    
+                    st.session_state.chat_messages.append(new_message)
+                    
+                    # Update to sheets if connected
+                    if st.session_state.sheets_manager and st.session_state.connection_status['connected']:
+                        try:
+                            st.session_state.sheets_manager.add_chat_message(new_message)
+                            st.session_state.success_message = "Ghi chú đã được lưu!"
+                        except Exception as e:
+                            st.session_state.error_message = f"Lỗi lưu ghi chú: {str(e)}"
+                    
+                    st.rerun(scope="fragment")
+        
+        with col1:
+            if st.form_submit_button("❌ Đóng", use_container_width=True):
+                st.session_state.show_chat = False
+                st.rerun(scope="app")
+
+def render_chat_messages(messages):
+    """Render a page of chat messages"""
+    st.markdown('<div class="chat-container">', unsafe_allow_html=True)
+    
+    for message in messages:
+        message_class = "achievement" if message['type'] == 'achievement' else ""
+        icon = "🎉" if message['type'] == 'achievement' else "⏰" if message['type'] == 'reminder' else "💭"
+        
+        st.markdown(f"""
+        <div class="chat-message {message_class}">
+            <div style="display: flex; align-items: start; gap: 0.75rem;">
+                <span style="font-size: 1.2rem;">{icon}</span>
+                <div style="flex: 1;">
+                    <div style="color: white; line-height: 1.4;">{message['text']}</div>
+                    <div style="color: #9CA3AF; font-size: 0.75rem; margin-top: 0.5rem;">{message['timestamp']}</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# Global sync function
+def sync_from_sheets(force: bool = False):
+    """Sync data from Google Sheets (force skips the shared cache)"""
+    if not st.session_state.sheets_manager:
+        return
+    
+    try:
+        st.session_state.syncing = True
+        st.session_state.error_message = None
+        
+        # Store queued writes first so the read includes them
+        manager = st.session_state.sheets_manager
+        manager.get_write_queue().flush()
+        started = time.monotonic()
+        
+        # Fetch every sheet in one batchGet round trip (per sheet if that fails)
+        values, sheet_errors = manager.read_all_values(refresh=force)
+        if manager.get_write_queue().may_be_stale(started):
+            st.session_state.error_message = 'Còn thay đổi chưa lưu lên Google Sheets, hãy đồng bộ lại sau ít phút'
+            return
+        apply_sync_values(values)
+        backup_synced_values(values)
+        
+        # Older background snapshots must not overwrite this fresh data
+        scheduler = get_sync_scheduler_for_session()
+        if scheduler:
+            st.session_state.sync_version = scheduler.version
+        
+        st.session_state.connection_status['last_sync'] = datetime.now()
+        if record_sheet_errors(sheet_errors):
+            st.session_state.error_message = f'Đồng bộ chưa đầy đủ, lỗi ở: {", ".join(st.session_state.connection_status["sheet_errors"])}'
+        else:
+            st.session_state.success_message = 'Đồng bộ thành công!'
+        
+    except Exception as e:
+        st.session_state.error_message = f'Lỗi đồng bộ: {str(e)}'
+        st.session_state.connection_status['connected'] = False
+    finally:
+        st.session_state.syncing = False
+
+def record_sheet_errors(sheet_errors) -> bool:
+    """Store per-sheet read errors (keyed by tab name) in the connection status"""
+    manager = st.session_state.sheets_manager
+    st.session_state.connection_status['sheet_errors'] = {
+        manager.sheet_name(name): error for name, error in sheet_errors.items()
+    }
+    return bool(sheet_errors)
+
+# Large list ranges that delta sync patches row by row
+DELTA_RANGES = ('quests', 'achievements', 'resource_details', 'chat')
+
+# List ranges whose models a full parse builds column-wise once they are long
+BULK_RANGES = ('quests', 'achievements')
+
+def parse_full_range(manager, name, values):
+    """Parse a whole range, column by column when it is long enough to pay off"""
+    if name in BULK_RANGES and len(values) >= BULK_PARSE_MIN_ROWS:
+        return manager.parse_bulk(name, values)
+    return manager.parse_range(name, values)
+
+def apply_sync_values(values):
+    """Apply raw sheet values to session state
+    
+    With delta sync on, the list ranges are diffed against the row
+    fingerprints of the previous sync and only inserted, updated and
+    deleted rows are parsed and patched into the existing lists. Ranges
+    without a baseline yet, and the small ranges, are parsed in full.
+    Ranges missing from values (failed reads) are left untouched.
+    """
+    manager = st.session_state.sheets_manager
+    fingerprints = st.session_state.row_fingerprints
+    
+    if not st.session_state.settings.get('delta_sync', True):
+        fingerprints.reset()
+        apply_sync_data({name: parse_full_range(manager, name, rows) for name, rows in values.items()})
+        return
+    
+    full_ranges = [name for name in values if name not in DELTA_RANGES or not fingerprints.has(name)]
+    apply_sync_data({name: parse_full_range(manager, name, values[name]) for name in full_ranges})
+    
+    for name in DELTA_RANGES:
+        if name not in values:
+            continue
+        rows = values[name]
+        if name in full_ranges:
+            fingerprints.remember(name, rows)
+            continue
+        
+        delta = fingerprints.diff(name, rows)
+        if delta.is_empty():
+            continue
+        
+        changes = manager.parse_rows(name, rows, delta.changed())
+        changes.update({i + 1: None for i in delta.deleted})
+        apply_row_changes(name, changes)
+
+def apply_row_changes(name, changes):
+    """Patch one list range in session state (changes maps id to parsed row or None)"""
+    touch_lists(name)
+    aggregates = st.session_state.aggregates
+    
+    if name == 'quests':
+        st.session_state.quests.patch({i: Quest.from_dict(q) if q else None for i, q in changes.items()})
+    elif name == 'achievements':
+        achievements = {i: Achievement.from_dict(a) if a else None for i, a in changes.items()}
+        for achievement in patch_sorted(st.session_state.achievements, achievements, lambda achievement: achievement.id):
+            aggregates.remove_achievement(achievement)
+        for achievement in achievements.values():
+            if achievement:
+                aggregates.add_achievement(achievement)
+    elif name == 'resource_details':
+        for resource_name, detail in patch_grouped(st.session_state.resource_details, changes, lambda detail: detail['id']):
+            aggregates.remove_resource_detail(resource_name, detail)
+        for change in changes.values():
+            if change:
+                aggregates.add_resource_detail(*change)
+    elif name == 'chat':
+        patch_unordered(st.session_state.chat_messages, changes, lambda message: message['id'])
+        st.session_state.chat_messages.sort(key=lambda x: (x['date'], x['timestamp']))
+
+def apply_sync_data(data):
+    """Copy parsed sheet data into session state (only the ranges present in data; quest and achievement lists may hold dicts or models)"""
+    # Sync character data
+    character_data = data.get('character')
+    if character_data:
+        st.session_state.character.update_from_dict(character_data)
+    
+    # Sync quests
+    if 'quests' in data:
+        st.session_state.quests = QuestStore(q if isinstance(q, Quest) else Quest.from_dict(q) for q in data['quests'])
+        st.session_state.aggregates.set_quests(st.session_state.quests)
+    
+    # Sync achievements
+    if 'achievements' in data:
+        st.session_state.achievements = [a if isinstance(a, Achievement) else Achievement.from_dict(a) for a in data['achievements']]
+        st.session_state.aggregates.rebuild_achievements(st.session_state.achievements)
+    
+    # Sync resources
+    resources_data = data.get('resources')
+    if resources_data:
+        for i, resource in enumerate(st.session_state.resources):
+            if i < len(resources_data):
+                resource.update_from_dict(resources_data[i])
+    
+    # Sync resource details
+    if 'resource_details' in data:
+        st.session_state.resource_details = data['resource_details']
+        st.session_state.aggregates.rebuild_resource_details(st.session_state.resource_details)
+    
+    # Sync chat messages
+    if 'chat' in data:
+        st.session_state.chat_messages = data['chat']
+    
+    # Sync goals
+    goals_data = data.get('goals')
+    if goals_data:
+        st.session_state.goals = goals_data
+    
+    touch_lists(*[name for name in DELTA_RANGES if name in data])
+
+def get_sync_scheduler_for_session():
+    """Get the background scheduler for this session's sheet, if auto-sync is on"""
+    if not (st.session_state.settings['auto_sync'] and
+            st.session_state.sheets_manager and
+            st.session_state.connection_status['connected']):
+        return None
+    
+    from components.sync_scheduler import get_sync_scheduler
+    return get_sync_scheduler(st.session_state.sheets_manager, st.session_state.settings['sync_interval'],
+                              st.session_state.sync_session)
+
+def hydrate_from_local_store() -> bool:
+    """Fill session state from the local SQLite mirror without touching the network"""
+    st.session_state.local_data_loaded = False
+    if not st.session_state.settings['sheet_id'] or not st.session_state.settings['api_key']:
+        return False
+    
+    try:
+        from components.google_sheets import GoogleSheetsManager
+        manager = GoogleSheetsManager(
+            st.session_state.settings['sheet_id'],
+            st.session_state.settings['api_key']
+        )
+        values = manager.read_local_values()
+    except Exception as e:
+        print(f"Warning: Could not read local store: {str(e)}")
+        return False
+    
+    if not values:
+        return False
+    
+    st.session_state.sheets_manager = manager
+    apply_sync_values(values)
+    st.session_state.connection_status['last_sync'] = manager.local_store.last_synced()
+    st.session_state.local_data_loaded = True
+    return True
+
+def start_background_refresh():
+    """Reconcile the local store with Google Sheets without blocking the page"""
+    scheduler = get_sync_scheduler_for_session()
+    if scheduler:
+        scheduler.request_sync()
+        return
+    
+    from components.sync_scheduler import BackgroundRefresh
+    st.session_state.background_refresh = BackgroundRefresh(st.session_state.sheets_manager)
+
+def sync_is_stale(started) -> bool:
+    """Check if a background read started at started (time.monotonic()) may miss this sheet's queued writes"""
+    return st.session_state.sheets_manager.get_write_queue().may_be_stale(started)
+
+def apply_scheduled_sync() -> bool:
+    """Apply the newest background snapshot to this session, if any
+    
+    A snapshot read before a queued write was stored would roll the write
+    back in the UI, so it is skipped and a new read is started instead
+    (both readers flush the queue first).
+    """
+    refresh = st.session_state.background_refresh
+    if refresh and refresh.done():
+        st.session_state.background_refresh = None
+        if refresh.error:
+            st.session_state.error_message = f'Lỗi đồng bộ: {refresh.error}'
+        elif sync_is_stale(refresh.started):
+            start_background_refresh()
+            return False
+        else:
+            apply_sync_values(refresh.data)
+            backup_synced_values(refresh.data)
+            record_sheet_errors(refresh.sheet_errors)
+            st.session_state.connection_status['last_sync'] = refresh.finished_at
+        return True
+    
+    scheduler = get_sync_scheduler_for_session()
+    if not scheduler:
+        return False
+    
+    update = scheduler.get_update(st.session_state.sync_version)
+    if not update:
+        return False
+    
+    version, values, sheet_errors, last_sync, started = update
+    if sync_is_stale(started):
+        st.session_state.sync_version = version
+        scheduler.request_sync()
+        return False
+    
+    # The snapshot holds raw values shared by every session; parsing builds fresh objects
+    apply_sync_values(values)
+    backup_synced_values(values)
+    record_sheet_errors(sheet_errors)
+    st.session_state.sync_version = version
+    st.session_state.connection_status['last_sync'] = last_sync
+    return True
+
+def backup_synced_values(values):
+    """Start a background backup of freshly synced raw values when one is due"""
+    settings = st.session_state.settings
+    if not settings.get('backup_enabled', True) or not settings['sheet_id']:
+        return
+    
+    from components.backup import get_backup_engine
+    get_backup_engine(settings['sheet_id']).schedule(values, settings.get('backup_interval', 24))
+
+def restore_from_backup(snapshot_id, to_sheets=False):
+    """Restore a backup into the local store (and into Google Sheets with to_sheets), then reload it"""
+    manager = st.session_state.sheets_manager
+    if not manager:
+        return
+    
+    from components.backup import get_backup_engine
+    engine = get_backup_engine(manager.sheet_id)
+    try:
+        st.session_state.loading = True
+        if to_sheets:
+            engine.restore_to_sheets(snapshot_id, manager)
+        engine.restore_to_local_store(snapshot_id, manager.local_store)
+        
+        # Row fingerprints describe the data from before the restore
+        st.session_state.row_fingerprints.reset()
+        apply_sync_values(manager.read_local_values())
+        st.session_state.success_message = 'Đã khôi phục lên Google Sheets!' if to_sheets else 'Đã khôi phục dữ liệu cục bộ!'
+    except Exception as e:
+        st.session_state.error_message = f'Lỗi khôi phục: {str(e)}'
+    finally:
+        st.session_state.loading = False
+
+@st.fragment(run_every=SYNC_POLL_INTERVAL)
+def render_sync_watcher():
+    """Poll the background scheduler and rerun the page when new data arrives"""
+    refresh = st.session_state.background_refresh
+    if refresh and refresh.done():
+        st.rerun()
+    
+    scheduler = get_sync_scheduler_for_session()
+    if scheduler and scheduler.get_update(st.session_state.sync_version):
+        st.rerun()
+
+# Stat -> code stored in STAT_DELTA events
+STAT_CODES = {stat: i for i, stat in enumerate(STATS_CONFIG)}
+
+def record_events(events):
+    """Append events to this sheet's event log; a failed write only prints a warning"""
+    try:
+        get_event_log(st.session_state.settings['sheet_id']).append_many(events)
+    except Exception as e:
+        print(f"Warning: Could not write event log: {str(e)}")
+
+def complete_quest(quest_id):
+    """Complete a quest and update character"""
+    complete_quests([quest_id])
+
+def complete_quests(quest_ids):
+    """Complete several quests at once
+    
+    Rewards are added in one pass, so the level is worked out once, and
+    the sheet gets one queued batch: the quest rows and the character in
+    a single batchUpdate and every chat message in a single append.
+    """
+    store = st.session_state.quests
+    quests = []
+    for quest_id in dict.fromkeys(quest_ids):
+        quest = store.get(quest_id)
+        if quest and quest.status != 'completed':
+            quests.append(quest)
+    if not quests:
+        return
+    
+    # Update quest status; the store's indexes feed the counts and the list filters
+    for quest in quests:
+        store.update(quest, status=QuestStatus.COMPLETED)
+    
+    # Completed quests can no longer be selected
+    st.session_state.selected_quests.difference_update(quest.id for quest in quests)
+    
+    # Update character EXP, level and stats
+    character = st.session_state.character
+    progress = apply_rewards(character, quests)
+    
+    now = time.time()
+    events = [Event(now, EventKind.QUEST_COMPLETED, ref=quest.id, value=quest.reward_exp) for quest in quests]
+    events.append(Event(now, EventKind.EXP_DELTA, ref=character.level, value=progress.exp))
+    if progress.levels:
+        events.append(Event(now, EventKind.LEVEL_UP, ref=character.level, value=progress.levels))
+    events.extend(
+        Event(now, EventKind.STAT_DELTA, code=STAT_CODES[stat], value=points)
+        for stat, points in progress.stats.items()
+    )
+    record_events(events)
+    
+    # Add achievement messages
+    timestamp = datetime.now().strftime("%H:%M")
+    today = datetime.now().strftime("%d/%m/%Y")
+    new_messages = [{
+        'id': int(now) + i,
+        'text': f'🎉 Hoàn thành: {quest.title} (+{quest.reward_exp} EXP)',
+        'timestamp': timestamp,
+        'type': 'achievement',
+        'date': today,
+        'author': 'user'
+    } for i, quest in enumerate(quests)]
+    st.session_state.chat_messages.extend(new_messages)
+    
+    # Queue sheet writes; they are batched and sent in the background
+    if st.session_state.sheets_manager and st.session_state.connection_status['connected']:
+        manager = st.session_state.sheets_manager
+        st.session_state.pending_writes.append(manager.queue_quest_completions(quests, character, new_messages))
+    
+    if len(quests) == 1:
+        st.session_state.success_message = f'Hoàn thành nhiệm vụ: {quests[0].title}!'
+    else:
+        st.session_state.success_message = f'Hoàn thành {len(quests)} nhiệm vụ (+{progress.exp} EXP)!'
+
+def select_page_quests(page_ids):
+    """Replace the page's part of the bulk completion selection"""
+    selected = st.session_state.selected_quests
+    selected.difference_update(page_ids)
+    selected.update(st.session_state.quest_page_selection)
+
+def clear_quest_selection():
+    """Empty the bulk completion selection"""
+    st.session_state.selected_quests = set()
+
+def complete_selected_quests():
+    """Complete every selected quest in one batch"""
+    quest_ids = sorted(st.session_state.selected_quests)
+    clear_quest_selection()
+    complete_quests(quest_ids)
+
+def collect_write_acks():
+    """Report queued sheet writes that have been acknowledged"""
+    pending = st.session_state.pending_writes
+    if not pending:
+        return
+    
+    done = [t for t in pending if t.done()]
+    if not done:
+        return
+    
+    st.session_state.pending_writes = [t for t in pending if not t.done()]
+    failed = [t for t in done if t.error]
+    if failed:
+        st.session_state.error_message = f'Lỗi cập nhật: {failed[0].error}'
+    elif not st.session_state.pending_writes:
+        st.session_state.success_message = 'Đã lưu thay đổi lên Google Sheets!'
+
+@st.fragment(run_every=WRITE_ACK_POLL_INTERVAL)
+def render_write_status():
+    """Show queued writes and rerun the page once they are all acknowledged"""
+    pending = [t for t in st.session_state.pending_writes if not t.done()]
+    if pending:
+        st.markdown(f'<div style="color: #9CA3AF; font-size: 0.8rem; text-align: center;">⏳ Đang lưu {len(pending)} thay đổi...</div>', unsafe_allow_html=True)
+    else:
+        st.rerun()
+
+def test_connection():
+    """Test connection to Google Sheets"""
+    if not st.session_state.settings['sheet_id'] or not st.session_state.settings['api_key']:
+        st.session_state.error_message = 'Vui lòng nhập đầy đủ Sheet ID và API Key'
+        return False
+    
+    try:
+        st.session_state.loading = True
+        st.session_state.error_message = None
+        
+        # Initialize Google Sheets manager
+        from components.google_sheets import GoogleSheetsManager
+        previous = st.session_state.sheets_manager
+        if not previous or previous.sheet_id != st.session_state.settings['sheet_id']:
+            # Row fingerprints only describe the sheet they were taken from
+            st.session_state.row_fingerprints.reset()
+        st.session_state.sheets_manager = GoogleSheetsManager(
+            st.session_state.settings['sheet_id'],
+            st.session_state.settings['api_key']
+        )
+        
+        # Test connection
+        if st.session_state.sheets_manager.test_connection():
+            st.session_state.connection_status['connected'] = True
+            st.session_state.connection_status['tested'] = True
+            st.session_state.success_message = 'Kết nối thành công!'
+            
+            # Auto-sync after successful connection; with a local copy
+            # already on screen, refresh it in the background instead
+            if st.session_state.local_data_loaded:
+                st.session_state.local_data_loaded = False
+                start_background_refresh()
+            else:
+                sync_from_sheets()
+            return True
+        else:
+            raise Exception("Không thể kết nối")
+            
+    except Exception as e:
+        st.session_state.connection_status['connected'] = False
+        st.session_state.connection_status['tested'] = True
+        st.session_state.error_message = f'Lỗi kết nối: {str(e)}'
+        return False
+    finally:
+        st.session_state.loading = False
+
+def save_settings():
+    """Save settings to local file"""
+    try:
+        st.session_state.settings_version = get_settings_store().save(st.session_state.settings)
+        st.session_state.success_message = "Cài đặt đã được lưu!"
+    except Exception as e:
+        st.session_state.error_message = str(e)
\ No newline at end of file
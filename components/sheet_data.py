@@ -0,0 +1,386 @@
+"""
+Sheet Data Layout for Level Up Application
+Cấu trúc các vùng dữ liệu trong Google Sheet: đọc dòng thành dữ liệu và tạo dòng để ghi
+"""
+
+import json
+import re
+from datetime import datetime
+from typing import Dict, Generator, List, Optional, Any, Tuple
+
+from config import READ_WINDOW_ROWS, SHEET_RANGES
+from components.data_models import QuestStatus, QuestPriority, AchievementTier, ResourceType, ChatMessageType
+
+# Write targets
+CHARACTER_WRITE_RANGE = 'Character!A1:B7'
+CHAT_APPEND_RANGE = 'Chat!A:E'
+RESOURCE_DETAILS_APPEND_RANGE = 'ResourceDetails!A:G'
+
+# A1 range such as 'Quests!A2:K1000', or open-ended like 'Quests!A2:K'
+A1_RANGE = re.compile(r"^(?P<sheet>[^!]+)!(?P<start_col>[A-Z]+)(?P<start_row>\d+):(?P<end_col>[A-Z]+)(?P<end_row>\d*)$")
+
+class SheetDataMixin:
+    """Range layout, row parsers and row builders shared by the sheet clients
+    
+    Nothing here does I/O, so GoogleSheetsManager and
+    AsyncGoogleSheetsManager parse and build rows the same way.
+    """
+    
+    def _init_sheet_data(self, window_rows: int = READ_WINDOW_ROWS):
+        """Set up the ranges and parser tables (call from __init__)"""
+        # Sheet ranges; open-ended ones are paginated in windows of window_rows
+        self.ranges = dict(SHEET_RANGES)
+        self.window_rows = max(1, window_rows)
+        
+        # Row parsers for each range, used by read_all to dispatch batchGet results
+        self._parsers = {
+            'character': self._parse_character,
+            'quests': self._parse_quests,
+            'achievements': self._parse_achievements,
+            'goals': self._parse_goals,
+            'resources': self._parse_resources,
+            'resource_details': self._parse_resource_details,
+            'chat': self._parse_chat
+        }
+        
+        # Single-row parsers for the list ranges, used by delta sync
+        self._row_parsers = {
+            'quests': self._parse_quest_row,
+            'achievements': self._parse_achievement_row,
+            'resource_details': self._parse_resource_detail_row,
+            'chat': self._parse_chat_row
+        }
+    
+    def _window_range(self, range_name: str, offset: int) -> Optional[str]:
+        """Get the window of an open-ended range starting offset rows in, or None if it is bounded"""
+        match = A1_RANGE.match(range_name)
+        if not match or match.group('end_row'):
+            return None
+        first = int(match.group('start_row')) + offset
+        last = first + self.window_rows - 1
+        return f"{match.group('sheet')}!{match.group('start_col')}{first}:{match.group('end_col')}{last}"
+    
+    def parse_all(self, values_by_name: Dict[str, List[List[str]]]) -> Dict[str, Any]:
+        """Run each range's raw values through its per-sheet parser"""
+        return {name: self.parse_range(name, values) for name, values in values_by_name.items() if name in self._parsers}
+    
+    def parse_range(self, name: str, values: List[List[str]]) -> Any:
+        """Run one range's raw values through its per-sheet parser"""
+        return self._parsers[name](values)
+    
+    def parse_bulk(self, name: str, values: List[List[str]]) -> Any:
+        """Parse a whole list range column by column into models
+        
+        Same rules as the row parsers, but built for long ranges: quests,
+        achievements and chat give model lists, resource details give
+        {resource name: [ResourceDetail]}. Imports pandas on first use.
+        """
+        from components.sheet_schema import SHEET_SCHEMAS
+        return SHEET_SCHEMAS[name].parse(values)
+    
+    def parse_rows(self, name: str, values: List[List[str]], indices: List[int]) -> Dict[int, Any]:
+        """Parse only the given row indices of a list range, keyed by record id"""
+        parse_row = self._row_parsers[name]
+        return {i + 1: parse_row(i, values[i]) for i in indices}
+    
+    def _paginate(self, names: List[str]) -> Generator[Dict[str, str], List[List[List[str]]], Dict[str, List[List[str]]]]:
+        """Plan a windowed read of names, one batchGet round at a time
+        
+        Yields each round as {name: A1 range} and expects the values of
+        those ranges, in order, to be sent back; returns the raw values by
+        name. Bounded ranges go in the first round only, open-ended ones
+        continue until a window comes back empty.
+        """
+        values: Dict[str, List[List[str]]] = {name: [] for name in names}
+        
+        # The first round also carries the bounded ranges
+        batch = {name: self._window_range(self.ranges[name], 0) or self.ranges[name] for name in names}
+        bounded = {name for name, range_name in batch.items() if range_name == self.ranges[name]}
+        
+        offset = 0
+        while batch:
+            results = yield batch
+            next_batch = {}
+            
+            for name, rows in zip(batch, results):
+                if name in bounded:
+                    values[name] = list(rows)
+                elif rows:
+                    # Pad the blank rows trimmed from the end of the previous window
+                    values[name].extend([] for _ in range(offset - len(values[name])))
+                    values[name].extend(rows)
+                    next_batch[name] = self._window_range(self.ranges[name], offset + self.window_rows)
+            
+            batch = next_batch
+            offset += self.window_rows
+        
+        return values
+    
+    def sheet_name(self, name: str) -> str:
+        """Get the tab name of a range in self.ranges (e.g. 'Quests')"""
+        return self.ranges[name].split('!')[0]
+    
+    def _parse_character(self, data: List[List[str]]) -> Optional[Dict]:
+        """Parse character key/value rows"""
+        try:
+            if not data:
+                return None
+            
+            character = {
+                'name': '',
+                'avatar': '',
+                'birth_year': None,
+                'level': 1,
+                'exp': 0,
+                'exp_to_next': 100,
+                'stats': {'WILL': 10, 'PHY': 10, 'MEN': 10, 'AWR': 10, 'EXE': 10}
+            }
+            
+            for row in data:
+                if len(row) >= 2:
+                    key, value = row[0], row[1]
+                    
+                    if key == 'name':
+                        character['name'] = value
+                    elif key == 'avatar':
+                        character['avatar'] = value
+                    elif key == 'birthYear':
+                        try:
+                            character['birth_year'] = int(value) if value else None
+                        except ValueError:
+                            character['birth_year'] = None
+                    elif key in ['level', 'exp', 'expToNext']:
+                        try:
+                            character[key.replace('expToNext', 'exp_to_next')] = int(value)
+                        except ValueError:
+                            pass
+                    elif key == 'stats':
+                        try:
+                            character['stats'] = json.loads(value) if value else character['stats']
+                        except json.JSONDecodeError:
+                            pass
+            
+            return character
+        
+        except Exception as e:
+            print(f"Warning: Could not read character data: {str(e)}")
+            return None
+    
+    def _character_values(self, character) -> List[List[str]]:
+        """Build the Character!A1:B7 key/value rows"""
+        return [
+            ['name', character.name],
+            ['avatar', character.avatar],
+            ['birthYear', str(character.birth_year) if character.birth_year else ''],
+            ['level', str(character.level)],
+            ['exp', str(character.exp)],
+            ['expToNext', str(character.exp_to_next)],
+            ['stats', json.dumps(character.stats)]
+        ]
+    
+    def _parse_quests(self, data: List[List[str]]) -> List[Dict]:
+        """Parse quest rows"""
+        try:
+            quests = []
+            
+            for i, row in enumerate(data):
+                if len(row) > 0 and row[0]:  # Skip empty rows
+                    quests.append(self._parse_quest_row(i, row))
+            
+            return quests
+        
+        except Exception as e:
+            print(f"Warning: Could not read quests: {str(e)}")
+            return []
+    
+    def _parse_quest_row(self, i: int, row: List[str]) -> Dict:
+        """Parse one quest row (i is the 0-based row index in the range)"""
+        return {
+            'id': i + 1,
+            'title': row[0] if len(row) > 0 else '',
+            'description': row[1] if len(row) > 1 else '',
+            'required_stat': row[2] if len(row) > 2 else 'WILL',
+            'difficulty': max(1, min(5, int(row[3]) if len(row) > 3 and row[3].isdigit() else 1)),
+            'deadline': row[4] if len(row) > 4 else '',
+            'reward_exp': int(row[5]) if len(row) > 5 and row[5].isdigit() else 0,
+            'reward_stat': row[6] if len(row) > 6 else '',
+            'status': QuestStatus.coerce(row[7] if len(row) > 7 else '', 'todo'),
+            'category': row[8] if len(row) > 8 else 'general',
+            'priority': QuestPriority.coerce(row[9] if len(row) > 9 else '', 'medium')
+        }
+    
+    def _quest_row(self, quest) -> List[str]:
+        """Build the sheet row for a quest"""
+        return [
+            quest.title, quest.description, quest.required_stat,
+            str(quest.difficulty), quest.deadline, str(quest.reward_exp),
+            quest.reward_stat, quest.status, quest.category, quest.priority
+        ]
+    
+    def _quest_range(self, quest) -> str:
+        """Get the A1 range of a quest's row (ids are 1-based, data starts at row 2)"""
+        return f"Quests!A{quest.id + 1}:J{quest.id + 1}"
+    
+    def _parse_achievements(self, data: List[List[str]]) -> List[Dict]:
+        """Parse achievement rows"""
+        try:
+            achievements = []
+            
+            for i, row in enumerate(data):
+                if len(row) > 0 and row[0]:  # Skip empty rows
+                    achievements.append(self._parse_achievement_row(i, row))
+            
+            return achievements
+        
+        except Exception as e:
+            print(f"Warning: Could not read achievements: {str(e)}")
+            return []
+    
+    def _parse_achievement_row(self, i: int, row: List[str]) -> Dict:
+        """Parse one achievement row"""
+        return {
+            'id': i + 1,
+            'title': row[0] if len(row) > 0 else '',
+            'description': row[1] if len(row) > 1 else '',
+            'icon': row[2] if len(row) > 2 else '🏆',
+            'tier': AchievementTier.coerce(row[3] if len(row) > 3 else '', 'bronze'),
+            'unlocked': row[4] in ['TRUE', 'true', True] if len(row) > 4 else False,
+            'unlocked_date': row[5] if len(row) > 5 else '',
+            'progress': max(0, min(100, int(row[6]) if len(row) > 6 and row[6].isdigit() else 0)),
+            'condition': row[7] if len(row) > 7 else '',
+            'category': row[8] if len(row) > 8 else 'general'
+        }
+    
+    def _parse_resources(self, data: List[List[str]]) -> List[Dict]:
+        """Parse resource rows"""
+        try:
+            resources = []
+            
+            for row in data:
+                if len(row) > 0 and row[0]:
+                    resource = {
+                        'name': row[0],
+                        'level': max(1, int(row[1]) if len(row) > 1 and row[1].isdigit() else 1),
+                        'progress': max(0, min(100, int(row[2]) if len(row) > 2 and row[2].isdigit() else 0)),
+                        'next_milestone': row[3] if len(row) > 3 else '',
+                        'related_quests': int(row[4]) if len(row) > 4 and row[4].isdigit() else 0
+                    }
+                    resources.append(resource)
+            
+            return resources
+        
+        except Exception as e:
+            print(f"Warning: Could not read resources: {str(e)}")
+            return []
+    
+    def _parse_resource_details(self, data: List[List[str]]) -> Dict[str, List[Dict]]:
+        """Parse resource detail rows grouped by resource name"""
+        try:
+            details = {}
+            
+            for i, row in enumerate(data):
+                if len(row) > 0 and row[0]:
+                    resource_name, detail = self._parse_resource_detail_row(i, row)
+                    if resource_name not in details:
+                        details[resource_name] = []
+                    details[resource_name].append(detail)
+            
+            return details
+        
+        except Exception as e:
+            print(f"Warning: Could not read resource details: {str(e)}")
+            return {}
+    
+    def _parse_resource_detail_row(self, i: int, row: List[str]) -> Tuple[str, Dict]:
+        """Parse one resource detail row into (resource name, detail)"""
+        return row[0], {
+            'id': i + 1,
+            'name': row[1] if len(row) > 1 else '',
+            'amount': float(row[2]) if len(row) > 2 and row[2].replace('.', '').isdigit() else 0,
+            'type': ResourceType.coerce(row[3] if len(row) > 3 else '', 'asset'),
+            'notes': row[4] if len(row) > 4 else '',
+            'date': row[5] if len(row) > 5 else datetime.now().strftime('%d/%m/%Y'),
+            'status': row[6] if len(row) > 6 else 'active'
+        }
+    
+    def _resource_detail_row(self, resource_name: str, detail: Dict) -> List[str]:
+        """Build the sheet row for a resource detail"""
+        return [
+            resource_name,
+            detail['name'],
+            str(detail['amount']),
+            detail['type'],
+            detail['notes'],
+            detail['date'],
+            detail['status']
+        ]
+    
+    def _parse_chat(self, data: List[List[str]]) -> List[Dict]:
+        """Parse chat message rows"""
+        try:
+            messages = []
+            
+            for i, row in enumerate(data):
+                if len(row) > 0 and row[0]:
+                    messages.append(self._parse_chat_row(i, row))
+            
+            # Sort by date and time
+            messages.sort(key=lambda x: (x['date'], x['timestamp']))
+            return messages
+        
+        except Exception as e:
+            print(f"Warning: Could not read chat: {str(e)}")
+            return []
+    
+    def _parse_chat_row(self, i: int, row: List[str]) -> Dict:
+        """Parse one chat message row"""
+        return {
+            'id': i + 1,
+            'text': row[0],
+            'timestamp': row[1] if len(row) > 1 else '',
+            'type': ChatMessageType.coerce(row[2] if len(row) > 2 else '', 'note'),
+            'date': row[3] if len(row) > 3 else '',
+            'author': row[4] if len(row) > 4 else 'user'
+        }
+    
+    def _chat_row(self, message: Dict) -> List[str]:
+        """Build the sheet row for a chat message"""
+        return [
+            message['text'],
+            message['timestamp'],
+            message['type'],
+            message['date'],
+            message['author']
+        ]
+    
+    def _parse_goals(self, data: List[List[str]]) -> Optional[Dict]:
+        """Parse goal rows"""
+        try:
+            goals = {
+                'mission': '',
+                'yearly': [],
+                'quarterly': [],
+                'monthly': []
+            }
+            
+            for row in data:
+                if len(row) >= 2:
+                    goal_type = row[0]
+                    title = row[1]
+                    
+                    if goal_type == 'mission' and title:
+                        goals['mission'] = title
+                    elif goal_type in ['yearly', 'quarterly', 'monthly'] and title:
+                        goal = {
+                            'title': title,
+                            'progress': max(0, min(100, int(row[2]) if len(row) > 2 and row[2].isdigit() else 0)),
+                            'deadline': row[3] if len(row) > 3 else '',
+                            'category': row[4] if len(row) > 4 else 'general'
+                        }
+                        goals[goal_type].append(goal)
+            
+            return goals
+        
+        except Exception as e:
+            print(f"Warning: Could not read goals: {str(e)}")
+            return None
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+Sheet Schemas for Level Up Application
+Phân tích hàng loạt các vùng danh sách theo cột (pandas) thay vì từng dòng một
+"""
+
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import QUEST_STATUSES, QUEST_PRIORITIES, ACHIEVEMENT_TIERS, RESOURCE_TYPES, CHAT_MESSAGE_TYPES
+from components.data_models import Quest, Achievement, ResourceDetail, ChatMessage
+
+@dataclass(frozen=True)
+class Column:
+    """How one sheet column becomes one record field
+    
+    kind is 'text', 'int', 'float', 'bool' or 'choice'. Missing and
+    invalid cells take the default (a callable default is called once per
+    parse); numbers are clamped to low/high when given.
+    """
+    name: str
+    kind: str = 'text'
+    default: Any = ''
+    choices: Tuple[str, ...] = ()
+    low: Optional[float] = None
+    high: Optional[float] = None
+
+class SheetSchema:
+    """Column layout of a list range, parsed column by column
+    
+    The raw values matrix is padded once into a DataFrame, rows with an
+    empty first cell are dropped, and every column is converted in bulk
+    with the same rules as the SheetDataMixin row parsers: digit-only
+    numbers, clamped ranges, TRUE/true booleans and closed vocabularies
+    falling back to their default. Record ids are the 1-based row
+    positions, as in the row parsers. pandas is imported on first use.
+    """
+    
+    def __init__(self, model: type, columns: List[Column],
+                 group_by: Optional[str] = None, sort_by: Tuple[str, ...] = ()):
+        self.model = model
+        self.columns = columns
+        # Leading sheet column holding a group key that is not a model field
+        self.group_by = group_by
+        self.sort_by = sort_by
+    
+    @property
+    def width(self) -> int:
+        return len(self.columns) + (1 if self.group_by else 0)
+    
+    def frame(self, values: List[List[str]]):
+        """Convert raw sheet values to a DataFrame with one typed column per model field"""
+        import pandas as pd
+        
+        # Short rows are padded with None, extra cells beyond the schema dropped
+        raw = pd.DataFrame(values, dtype=object).reindex(columns=range(self.width))
+        first = raw[0]
+        raw = raw[first.notna() & (first != '')]
+        
+        data = {'id': (raw.index + 1).astype('int64')}
+        offset = 1 if self.group_by else 0
+        for position, column in enumerate(self.columns, start=offset):
+            data[column.name] = self._convert(raw[position], column)
+        if self.group_by:
+            data[self.group_by] = raw[0]
+        
+        frame = pd.DataFrame(data, index=raw.index)
+        if self.sort_by:
+            frame = frame.sort_values(list(self.sort_by), kind='stable')
+        return frame.reset_index(drop=True)
+    
+    def _convert(self, series, column: Column):
+        """Convert one raw column (strings, None where the row was short)"""
+        import pandas as pd
+        
+        default = column.default() if callable(column.default) else column.default
+        if column.kind == 'text':
+            return series.fillna(default)
+        if column.kind == 'choice':
+            return series.where(series.isin(column.choices), default)
+        if column.kind == 'bool':
+            return series.isin(['TRUE', 'true'])
+        
+        text = series.fillna('').astype(str)
+        # isdigit() as in the row parsers; decimals may also contain dots
+        valid = (text if column.kind == 'int' else text.str.replace('.', '', regex=False)).str.isdigit()
+        numbers = pd.to_numeric(text.where(valid), errors='coerce').fillna(default)
+        if column.low is not None or column.high is not None:
+            numbers = numbers.clip(lower=column.low, upper=column.high)
+        return numbers.astype('int64' if column.kind == 'int' else 'float64')
+    
+    def to_records(self, frame) -> Any:
+        """Build model instances from a parsed frame (grouped by key when the schema has one)"""
+        names = [f.name for f in fields(self.model)]
+        columns = [frame[name].tolist() for name in names]
+        records = [self.model(*values) for values in zip(*columns)]
+        if not self.group_by:
+            return records
+        
+        groups: Dict[str, List[Any]] = {}
+        for key, record in zip(frame[self.group_by].tolist(), records):
+            groups.setdefault(key, []).append(record)
+        return groups
+    
+    def parse(self, values: List[List[str]]) -> Any:
+        """Parse raw values into model instances"""
+        return self.to_records(self.frame(values))
+
+def _today() -> str:
+    return datetime.now().strftime('%d/%m/%Y')
+
+# List range name -> schema, mirroring the SheetDataMixin row parsers
+SHEET_SCHEMAS: Dict[str, SheetSchema] = {
+    'quests': SheetSchema(Quest, [
+        Column('title'),
+        Column('description'),
+        Column('required_stat', default='WILL'),
+        Column('difficulty', 'int', 1, low=1, high=5),
+        Column('deadline'),
+        Column('reward_exp', 'int', 0),
+        Column('reward_stat'),
+        Column('status', 'choice', 'todo', tuple(QUEST_STATUSES)),
+        Column('category', default='general'),
+        Column('priority', 'choice', 'medium', tuple(QUEST_PRIORITIES))
+    ]),
+    'achievements': SheetSchema(Achievement, [
+        Column('title'),
+        Column('description'),
+        Column('icon', default='🏆'),
+        Column('tier', 'choice', 'bronze', tuple(ACHIEVEMENT_TIERS)),
+        Column('unlocked', 'bool', False),
+        Column('unlocked_date'),
+        Column('progress', 'int', 0, low=0, high=100),
+        Column('condition'),
+        Column('category', default='general')
+    ]),
+    'resource_details': SheetSchema(ResourceDetail, [
+        Column('name'),
+        Column('amount', 'float', 0.0),
+        Column('type', 'choice', 'asset', tuple(RESOURCE_TYPES)),
+        Column('notes'),
+        Column('date', default=_today),
+        Column('status', default='active')
+    ], group_by='resource'),
+    'chat': SheetSchema(ChatMessage, [
+        Column('text'),
+        Column('timestamp'),
+        Column('type', 'choice', 'note', tuple(CHAT_MESSAGE_TYPES)),
+        Column('date'),
+        Column('author', default='user')
+    ], sort_by=('date', 'timestamp'))
+}
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+Background Sync Scheduler for Level Up Application
+Đồng bộ Google Sheets định kỳ trên luồng nền, dùng chung cho mọi phiên
+"""
+
+import itertools
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from config import SYNC_IDLE_TIMEOUT
+
+# Shared by every scheduler, so a session's sync_version stays valid when a scheduler is replaced
+_versions = itertools.count(1)
+
+class SyncScheduler:
+    """Periodically pulls a sheet with read_all_values() on a daemon thread
+    
+    Streamlit sessions cannot be touched from another thread, so the
+    scheduler only keeps the latest snapshot of raw values together with
+    a process-wide version number. Each session compares the version
+    with the one it last applied and parses (or delta-patches) the
+    snapshot into its own session state.
+    
+    Queued writes for the sheet are flushed before each read, and the
+    time.monotonic() at which the read started is kept with the snapshot,
+    so sessions can tell if a write was stored after it (see
+    WriteBehindQueue.may_be_stale).
+    
+    Every session using the sheet asks for its own interval; the
+    scheduler runs at the shortest one asked for by a session seen within
+    SYNC_IDLE_TIMEOUT.
+    """
+    
+    def __init__(self, manager, interval_minutes: int):
+        self.manager = manager
+        self.interval = max(1, interval_minutes) * 60
+        # session -> (interval in seconds, time.monotonic() of its last request)
+        self._intervals: Dict[str, Tuple[int, float]] = {}
+        
+        self.version = 0
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self.started = 0.0
+        self.sheet_errors: Dict[str, str] = {}
+        self.last_sync: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.last_access = time.monotonic()
+        
+        self._sync_requested = False
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"levelup-sync-{manager.sheet_id[:8]}",
+            daemon=True
+        )
+    
+    def start(self):
+        """Start the background thread, which syncs immediately"""
+        self._thread.start()
+    
+    def stop(self):
+        """Stop the background thread"""
+        self._stop.set()
+        self._wake.set()
+    
+    def is_alive(self) -> bool:
+        """Check if the background thread is still running"""
+        return self._thread.is_alive() and not self._stop.is_set()
+    
+    def set_interval(self, interval_minutes: int, session: str = ''):
+        """Record a session's sync interval, waking the thread if the shortest one changed"""
+        now = time.monotonic()
+        with self._lock:
+            self._intervals[session] = (max(1, interval_minutes) * 60, now)
+            # Sessions that went away no longer hold the interval down
+            for key, (_, seen) in list(self._intervals.items()):
+                if now - seen > SYNC_IDLE_TIMEOUT:
+                    del self._intervals[key]
+            interval = min(seconds for seconds, _ in self._intervals.values())
+        if interval != self.interval:
+            self.interval = interval
+            self._wake.set()
+    
+    def request_sync(self):
+        """Ask for a sync as soon as possible"""
+        self._sync_requested = True
+        self._wake.set()
+    
+    def touch(self):
+        """Mark the scheduler as used by a session"""
+        self.last_access = time.monotonic()
+    
+    def _run(self):
+        """Thread loop: sleep until the interval elapses or a sync is requested"""
+        last_run = None
+        while not self._stop.is_set():
+            if last_run is not None:
+                self._wake.wait(max(0.0, last_run + self.interval - time.monotonic()))
+                if self._stop.is_set():
+                    break
+            self._wake.clear()
+            
+            # Nobody has looked at this sheet for a while
+            if time.monotonic() - self.last_access > max(SYNC_IDLE_TIMEOUT, 2 * self.interval):
+                break
+            
+            if self._sync_requested or last_run is None or time.monotonic() >= last_run + self.interval:
+                self._sync_requested = False
+                self.sync_once()
+                last_run = time.monotonic()
+        
+        self._stop.set()
+        _unregister(self)
+    
+    def sync_once(self):
+        """Fetch all ranges and publish them as a new snapshot"""
+        try:
+            self.manager.get_write_queue().flush()
+            started = time.monotonic()
+            # This thread is what keeps the shared cache fresh, so bypass it
+            data, sheet_errors = self.manager.read_all_values(refresh=True)
+        except Exception as e:
+            with self._lock:
+                self.last_error = str(e)
+            return
+        
+        with self._lock:
+            self.snapshot = data
+            self.started = started
+            self.sheet_errors = sheet_errors
+            self.version = next(_versions)
+            self.last_sync = datetime.now()
+            self.last_error = None
+    
+    def get_update(self, since_version: int) -> Optional[Tuple[int, Dict[str, Any], Dict[str, str], datetime, float]]:
+        """Get (version, snapshot, sheet_errors, last_sync, started) if newer than since_version"""
+        with self._lock:
+            if self.snapshot is None or self.version <= since_version:
+                return None
+            return self.version, self.snapshot, self.sheet_errors, self.last_sync, self.started
+
+class BackgroundRefresh:
+    """One-off read_all_values() on a worker thread, used to reconcile the local store"""
+    
+    def __init__(self, manager):
+        self.data: Optional[Dict[str, Any]] = None
+        self.sheet_errors: Dict[str, str] = {}
+        self.error: Optional[str] = None
+        self.finished_at: Optional[datetime] = None
+        self.started = 0.0
+        self._done = threading.Event()
+        threading.Thread(target=self._run, args=(manager,), name="levelup-refresh", daemon=True).start()
+    
+    def _run(self, manager):
+        try:
+            manager.get_write_queue().flush()
+            self.started = time.monotonic()
+            self.data, self.sheet_errors = manager.read_all_values()
+        except Exception as e:
+            self.error = str(e)
+        self.finished_at = datetime.now()
+        self._done.set()
+    
+    def done(self) -> bool:
+        """Check if the refresh has finished"""
+        return self._done.is_set()
+
+# Process-wide registry, one scheduler per sheet
+_schedulers: Dict[Tuple[str, str], SyncScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+def get_sync_scheduler(manager, interval_minutes: int, session: str = '') -> SyncScheduler:
+    """Get the running scheduler for the manager's sheet, starting one if needed
+    
+    session identifies the caller, so sessions asking for different
+    intervals do not overwrite each other (the shortest one wins).
+    """
+    key = (manager.sheet_id, manager.api_key)
+    with _schedulers_lock:
+        scheduler = _schedulers.get(key)
+        if scheduler is None or not scheduler.is_alive():
+            scheduler = SyncScheduler(manager, interval_minutes)
+            _schedulers[key] = scheduler
+            scheduler.start()
+    scheduler.set_interval(interval_minutes, session)
+    scheduler.touch()
+    return scheduler
+
+def _unregister(scheduler: SyncScheduler):
+    """Remove a stopped scheduler from the registry"""
+    key = (scheduler.manager.sheet_id, scheduler.manager.api_key)
+    with _schedulers_lock:
+        if _schedulers.get(key) is scheduler:
+            del _schedulers[key]
\ No newline at end of file
@@ -0,0 +1,325 @@
+"""
+Write-Behind Queue for Level Up Application
+Gom các thao tác ghi Google Sheets và gửi theo lô trên luồng nền
+"""
+
+import atexit
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
+
+from config import WRITE_FLUSH_INTERVAL, WRITE_BATCH_SIZE, WRITE_MAX_ATTEMPTS, WRITE_IDLE_TIMEOUT
+from utils.retry_policy import UnconfirmedWriteError
+
+_ticket_ids = itertools.count(1)
+
+class WriteTicket:
+    """Acknowledgement for a queued write, resolved once the batch is stored
+    
+    A ticket covering several writes (parts) resolves when the last of
+    them has been stored, or as soon as one of them fails for good, and
+    keeps the first error.
+    """
+    
+    def __init__(self, description: str = "", parts: int = 1):
+        self.id = next(_ticket_ids)
+        self.description = description
+        self.error: Optional[str] = None
+        self._parts = parts
+        self._done = threading.Event()
+    
+    def done(self) -> bool:
+        """Check if the write has been sent (successfully or not)"""
+        return self._done.is_set()
+    
+    def succeeded(self) -> bool:
+        """Check if the write is durably stored in the sheet"""
+        return self._done.is_set() and self.error is None
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the write to be sent; returns True if it succeeded"""
+        self._done.wait(timeout)
+        return self.succeeded()
+    
+    def _resolve(self, error: Optional[str] = None):
+        # Only the flushing thread resolves tickets
+        self.error = self.error or error
+        self._parts -= 1
+        if self._parts <= 0 or error is not None:
+            self._done.set()
+
+class WriteBehindQueue:
+    """Coalesces pending writes for one sheet and flushes them in batches
+    
+    Row updates are keyed by A1 range, so a later update to the same range
+    replaces the pending values (the character row written after every quest
+    is sent once). All pending updates go out in one values:batchUpdate and
+    appends are sent with one values:append per target range. A flush runs
+    every flush_interval seconds, or as soon as max_pending writes are queued.
+    
+    A write that fails goes back to the front of the queue and is resent
+    with the next flush, up to max_attempts times, unless a newer value
+    for its range was queued meanwhile. Appends that may already be in the
+    sheet (UnconfirmedWriteError) are not resent. The flushing thread is
+    started by the first queued write and exits after idle_timeout seconds
+    with nothing queued.
+    """
+    
+    def __init__(self, manager, flush_interval: float = WRITE_FLUSH_INTERVAL, max_pending: int = WRITE_BATCH_SIZE,
+                 max_attempts: int = WRITE_MAX_ATTEMPTS, idle_timeout: float = WRITE_IDLE_TIMEOUT):
+        # Replaced by get_write_queue() with the newest manager of the sheet
+        self.manager = manager
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_attempts = max(1, max_attempts)
+        self.idle_timeout = idle_timeout
+        
+        self._updates: "OrderedDict[str, List[List[str]]]" = OrderedDict()
+        self._update_tickets: Dict[str, List[WriteTicket]] = {}
+        self._appends: "OrderedDict[str, List[List[str]]]" = OrderedDict()
+        self._append_tickets: Dict[str, List[WriteTicket]] = {}
+        # Failed sends in a row per range, for the writes waiting to be resent
+        self._update_attempts: Dict[str, int] = {}
+        self._append_attempts: Dict[str, int] = {}
+        # time.monotonic() of the last write the sheet acknowledged, and whether a flush is sending
+        self.last_ack = 0.0
+        self._sending = False
+        
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def queue_update(self, range_name: str, values: List[List[str]], description: str = "") -> WriteTicket:
+        """Queue an overwrite of range_name, replacing any pending values for it"""
+        ticket = WriteTicket(description)
+        with self._lock:
+            self._updates[range_name] = values
+            self._updates.move_to_end(range_name)
+            self._update_tickets.setdefault(range_name, []).append(ticket)
+            full = self._queued()
+        if full:
+            self._wake.set()
+        return ticket
+    
+    def queue_append(self, range_name: str, row: List[str], description: str = "") -> WriteTicket:
+        """Queue a row to append to range_name"""
+        ticket = WriteTicket(description)
+        with self._lock:
+            self._appends.setdefault(range_name, []).append(row)
+            self._append_tickets.setdefault(range_name, []).append(ticket)
+            full = self._queued()
+        if full:
+            self._wake.set()
+        return ticket
+    
+    def queue_batch(self, updates: Dict[str, List[List[str]]], appends: Dict[str, List[List[str]]],
+                    description: str = "") -> WriteTicket:
+        """Queue range overwrites and appended rows together under one ticket
+        
+        They go out with the next flush: the updates inside its single
+        values:batchUpdate, the rows of each append range in one
+        values:append. Each range is a part of the ticket, since a range
+        that keeps failing is dropped while the others are resent.
+        """
+        appends = {range_name: rows for range_name, rows in appends.items() if rows}
+        ticket = WriteTicket(description, parts=len(updates) + len(appends))
+        if not updates and not appends:
+            ticket._resolve()
+            return ticket
+        
+        with self._lock:
+            for range_name, values in updates.items():
+                self._updates[range_name] = values
+                self._updates.move_to_end(range_name)
+                self._update_tickets.setdefault(range_name, []).append(ticket)
+            for range_name, rows in appends.items():
+                self._appends.setdefault(range_name, []).extend(rows)
+                self._append_tickets.setdefault(range_name, []).append(ticket)
+            full = self._queued()
+        if full:
+            self._wake.set()
+        return ticket
+    
+    def _queued(self) -> bool:
+        """Start the flushing thread if needed; returns True if an early flush is due (lock held)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="levelup-write-queue", daemon=True)
+            self._thread.start()
+        return self._pending_count() >= self.max_pending
+    
+    def discard(self, tabs: Set[str], reason: str) -> int:
+        """Drop the queued writes to the given tabs, failing their tickets with reason
+        
+        Waits for a flush in progress, so nothing taken from the queue
+        before the call is sent after it. Returns the number of writes
+        dropped.
+        """
+        tickets = []
+        dropped = 0
+        with self._flush_lock, self._lock:
+            for range_name in [r for r in self._updates if r.split('!')[0] in tabs]:
+                del self._updates[range_name]
+                self._update_attempts.pop(range_name, None)
+                tickets.extend(self._update_tickets.pop(range_name, []))
+                dropped += 1
+            for range_name in [r for r in self._appends if r.split('!')[0] in tabs]:
+                dropped += len(self._appends.pop(range_name))
+                self._append_attempts.pop(range_name, None)
+                tickets.extend(self._append_tickets.pop(range_name, []))
+        for ticket in tickets:
+            ticket._resolve(reason)
+        return dropped
+    
+    def _pending_count(self) -> int:
+        return len(self._updates) + sum(len(rows) for rows in self._appends.values())
+    
+    def pending_count(self) -> int:
+        """Get the number of writes waiting to be flushed"""
+        with self._lock:
+            return self._pending_count()
+    
+    def may_be_stale(self, started: float) -> bool:
+        """Check if a read of the sheet started at started (time.monotonic()) can miss writes
+        
+        True while writes are queued or being sent, or if one was
+        acknowledged after the read started.
+        """
+        with self._lock:
+            return self._sending or self._pending_count() > 0 or self.last_ack >= started
+    
+    def flush(self) -> bool:
+        """Send everything queued so far; returns True if every write succeeded"""
+        with self._flush_lock:
+            with self._lock:
+                updates, update_tickets = self._updates, self._update_tickets
+                appends, append_tickets = self._appends, self._append_tickets
+                self._updates, self._update_tickets = OrderedDict(), {}
+                self._appends, self._append_tickets = OrderedDict(), {}
+                self._sending = bool(updates or appends)
+            
+            try:
+                return self._send(updates, update_tickets, appends, append_tickets)
+            finally:
+                with self._lock:
+                    self._sending = False
+    
+    def _send(self, updates: "OrderedDict[str, List[List[str]]]", update_tickets: Dict[str, List[WriteTicket]],
+              appends: "OrderedDict[str, List[List[str]]]", append_tickets: Dict[str, List[WriteTicket]]) -> bool:
+        """Send the writes taken from the queue by flush() (flush lock held)"""
+        ok = True
+        
+        if updates:
+            try:
+                self.manager.batch_update(dict(updates))
+                with self._lock:
+                    self.last_ack = time.monotonic()
+                    for range_name in updates:
+                        self._update_attempts.pop(range_name, None)
+                for tickets in update_tickets.values():
+                    for ticket in tickets:
+                        ticket._resolve()
+            except Exception as e:
+                self._requeue_updates(updates, update_tickets, str(e))
+                ok = False
+        
+        for range_name, rows in appends.items():
+            try:
+                self.manager.append_rows(range_name, rows)
+                with self._lock:
+                    self.last_ack = time.monotonic()
+                    self._append_attempts.pop(range_name, None)
+                for ticket in append_tickets[range_name]:
+                    ticket._resolve()
+            except Exception as e:
+                self._requeue_append(range_name, rows, append_tickets[range_name], str(e),
+                                     resend=not isinstance(e, UnconfirmedWriteError))
+                ok = False
+        
+        return ok
+    
+    def _requeue_updates(self, updates: "OrderedDict[str, List[List[str]]]",
+                         update_tickets: Dict[str, List[WriteTicket]], error: str):
+        """Put a failed batchUpdate back in front of the queue, failing ranges out of attempts"""
+        failed = []
+        with self._lock:
+            for range_name in reversed(updates):
+                tickets = update_tickets.get(range_name, [])
+                attempts = self._update_attempts.get(range_name, 0) + 1
+                if attempts >= self.max_attempts:
+                    self._update_attempts.pop(range_name, None)
+                    failed.extend(tickets)
+                    continue
+                self._update_attempts[range_name] = attempts
+                if range_name not in self._updates:
+                    self._updates[range_name] = updates[range_name]
+                    self._updates.move_to_end(range_name, last=False)
+                # A newer value for the range acknowledges the older tickets too
+                self._update_tickets[range_name] = tickets + self._update_tickets.get(range_name, [])
+        for ticket in failed:
+            ticket._resolve(error)
+    
+    def _requeue_append(self, range_name: str, rows: List[List[str]], tickets: List[WriteTicket], error: str,
+                        resend: bool = True):
+        """Put failed appended rows back in front of their range, unless out of attempts or unsafe to resend"""
+        with self._lock:
+            attempts = self._append_attempts.get(range_name, 0) + 1
+            if resend and attempts < self.max_attempts:
+                self._append_attempts[range_name] = attempts
+                self._appends[range_name] = rows + self._appends.get(range_name, [])
+                self._appends.move_to_end(range_name, last=False)
+                self._append_tickets[range_name] = tickets + self._append_tickets.get(range_name, [])
+                return
+            self._append_attempts.pop(range_name, None)
+        for ticket in tickets:
+            ticket._resolve(error)
+    
+    def _run(self):
+        """Thread loop: flush on the interval or when the size threshold is hit, exit once idle"""
+        idle_since = time.monotonic()
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self.pending_count():
+                self.flush()
+                idle_since = time.monotonic()
+                continue
+            if time.monotonic() - idle_since >= self.idle_timeout:
+                with self._lock:
+                    # A write queued since the check keeps the thread going
+                    if not self._pending_count():
+                        self._thread = None
+                        return
+
+# Process-wide queues, one per sheet
+_queues: Dict[str, WriteBehindQueue] = {}
+_queues_lock = threading.Lock()
+
+def get_write_queue(manager) -> WriteBehindQueue:
+    """Get the shared write queue of the manager's sheet; it sends through the newest manager"""
+    with _queues_lock:
+        queue = _queues.get(manager.sheet_id)
+        if queue is None:
+            queue = WriteBehindQueue(manager)
+            _queues[manager.sheet_id] = queue
+        else:
+            queue.manager = manager
+        return queue
+
+def may_be_stale(sheet_id: str, started: float) -> bool:
+    """Check if a read of a sheet started at started can miss writes queued in this process"""
+    with _queues_lock:
+        queue = _queues.get(sheet_id)
+    return queue is not None and queue.may_be_stale(started)
+
+def flush_all():
+    """Send every queued write of every sheet"""
+    with _queues_lock:
+        queues = list(_queues.values())
+    for queue in queues:
+        queue.flush()
+
+# Don't lose queued writes when the server shuts down
+atexit.register(flush_all)
\ No newline at end of file
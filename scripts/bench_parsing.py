@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Parsing Benchmark for Level Up Application
+So sánh tốc độ phân tích từng dòng với phân tích theo cột trên các vùng danh sách lớn
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from config import QUEST_STATUSES, QUEST_PRIORITIES, ACHIEVEMENT_TIERS, RESOURCE_TYPES, CHAT_MESSAGE_TYPES, STATS_CONFIG
+from components.data_models import Quest, Achievement, ResourceDetail, ChatMessage
+from components.sheet_data import SheetDataMixin
+
+def make_values(name: str, rows: int, rng: random.Random) -> List[List[str]]:
+    """Generate raw sheet values with short rows, blanks and invalid cells mixed in"""
+    def number(high: int) -> str:
+        return rng.choice([str(rng.randint(0, high)), '', 'x'])
+    
+    def row() -> List[str]:
+        if name == 'quests':
+            return [f"Nhiệm vụ {rng.randint(1, 10 ** 6)}", "Mô tả", rng.choice(list(STATS_CONFIG)), number(6),
+                    '25/12/2024', number(500), 'PHY +1', rng.choice(QUEST_STATUSES + ['']),
+                    rng.choice(['work', 'health', 'study']), rng.choice(QUEST_PRIORITIES)]
+        if name == 'achievements':
+            return [f"Danh hiệu {rng.randint(1, 10 ** 6)}", "Mô tả", '🏆', rng.choice(ACHIEVEMENT_TIERS),
+                    rng.choice(['TRUE', 'FALSE']), '', number(120), '', rng.choice(['quest', 'stat'])]
+        if name == 'resource_details':
+            return [rng.choice(['Tài chính', 'Sức khỏe', 'Kỹ năng']), 'Khoản', f"{rng.randint(0, 10 ** 6)}.5",
+                    rng.choice(RESOURCE_TYPES), '', '01/01/2024', rng.choice(['active', 'inactive'])]
+        return [f"Tin nhắn {rng.randint(1, 10 ** 6)}", f"{rng.randint(0, 23):02d}:00",
+                rng.choice(CHAT_MESSAGE_TYPES), f"{rng.randint(1, 28):02d}/01/2024", 'user']
+    
+    values = []
+    for _ in range(rows):
+        cells = row()
+        roll = rng.random()
+        if roll < 0.02:
+            cells = []  # blank row
+        elif roll < 0.10:
+            cells = cells[:rng.randint(1, len(cells))]  # trailing cells trimmed by the API
+        values.append(cells)
+    return values
+
+def row_parser(sheets: SheetDataMixin, name: str) -> Callable[[List[List[str]]], object]:
+    """The per-row parse followed by the model conversion sync does today"""
+    if name == 'quests':
+        return lambda values: [Quest.from_dict(q) for q in sheets._parse_quests(values)]
+    if name == 'achievements':
+        return lambda values: [Achievement.from_dict(a) for a in sheets._parse_achievements(values)]
+    if name == 'resource_details':
+        return lambda values: {
+            resource_name: [ResourceDetail.from_dict(d) for d in details]
+            for resource_name, details in sheets._parse_resource_details(values).items()
+        }
+    return lambda values: [ChatMessage.from_dict(m) for m in sheets._parse_chat(values)]
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Best wall time of repeat runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark row-by-row against column-wise sheet parsing")
+    parser.add_argument("--rows", type=int, default=50000, help="rows per range (default: 50000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, best is kept (default: 3)")
+    parser.add_argument("--range", action="append", dest="names",
+                        help="range to benchmark (default: all list ranges); can be repeated")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    sheets = SheetDataMixin()
+    sheets._init_sheet_data()
+    rng = random.Random(args.seed)
+    names = args.names or ['quests', 'achievements', 'resource_details', 'chat']
+    
+    # Import pandas before timing so the first range does not pay for it
+    sheets.parse_bulk(names[0], [])
+    
+    ok = True
+    print(f"{'Vùng':<18}{'Từng dòng':>12}{'Theo cột':>12}{'Nhanh hơn':>11}")
+    for name in names:
+        values = make_values(name, args.rows, rng)
+        parse_rows = row_parser(sheets, name)
+        
+        expected = parse_rows(values)
+        if sheets.parse_bulk(name, values) != expected:
+            print(f"❌ {name}: kết quả phân tích theo cột khác phân tích từng dòng")
+            ok = False
+            continue
+        
+        row_s = best_of(args.repeat, lambda: parse_rows(values))
+        bulk_s = best_of(args.repeat, lambda: sheets.parse_bulk(name, values))
+        print(f"{name:<18}{row_s * 1000:>9.1f} ms{bulk_s * 1000:>9.1f} ms{row_s / bulk_s:>10.1f}x")
+    
+    if ok:
+        print(f"✅ Kết quả giống nhau trên {args.rows} dòng mỗi vùng")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Startup Budget Check for Level Up Application
+Đo thời gian import khi khởi động bằng `python -X importtime` và báo lỗi nếu vượt ngân sách
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must not be imported just to render a page
+FORBIDDEN_MODULES = ['pandas', 'numpy', 'PIL', 'gspread', 'google.oauth2', 'requests', 'httpx']
+
+# Streamlit itself is a fixed cost outside our control
+BASELINE_MODULES = ['streamlit']
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+def measure(modules: List[str]) -> List[Tuple[int, int, str]]:
+    """Import modules in a fresh interpreter; returns [(cumulative_us, depth, name)] in output order"""
+    code = "; ".join(f"import {name}" for name in BASELINE_MODULES + modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            # Each nesting level adds two spaces before the module name
+            depth = (len(match.group(3)) - 1) // 2
+            entries.append((int(match.group(2)), depth, match.group(4)))
+    return entries
+
+def summarize(entries: List[Tuple[int, int, str]]) -> Dict[str, Tuple[int, List[Tuple[int, int, str]]]]:
+    """Group the entries by top-level import: {name: (cumulative_us, entries of its tree)}
+    
+    importtime prints a module after everything it imported, so the lines
+    before each top-level entry belong to that entry's tree.
+    """
+    groups = {}
+    pending: List[Tuple[int, int, str]] = []
+    for entry in entries:
+        pending.append(entry)
+        if entry[1] == 0:
+            groups[entry[2]] = (entry[0], pending)
+            pending = []
+    return groups
+
+def is_baseline(name: str) -> bool:
+    return any(name == module or name.startswith(module + '.') for module in BASELINE_MODULES)
+
+def split_baseline(tree: List[Tuple[int, int, str]]) -> Tuple[int, List[Tuple[int, int, str]]]:
+    """Split an import tree into streamlit's share and the app's own entries
+    
+    Streamlit loads some submodules lazily (streamlit.emojis on
+    set_page_config), so they show up inside the app's tree. Each
+    outermost streamlit.* entry is charged to streamlit together with
+    everything it imported; importtime prints children before their
+    parent, so the tree is walked backwards.
+    """
+    baseline_us = 0
+    own = []
+    skip_depth = None
+    for cumulative, depth, name in reversed(tree):
+        if skip_depth is not None:
+            if depth > skip_depth:
+                continue
+            skip_depth = None
+        if is_baseline(name):
+            baseline_us += cumulative
+            skip_depth = depth
+            continue
+        own.append((cumulative, depth, name))
+    own.reverse()
+    return baseline_us, own
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the import-time budget of the app modules")
+    parser.add_argument("--budget-ms", type=float, default=150.0,
+                        help="maximum import time of the app modules, excluding streamlit and what it loads (default: 150)")
+    parser.add_argument("--module", action="append", dest="modules",
+                        help="module to import (default: main); can be repeated")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest imports to list")
+    args = parser.parse_args()
+    
+    modules = args.modules or ['main']
+    try:
+        entries = measure(modules)
+    except RuntimeError as e:
+        print(f"❌ Không import được: {e}")
+        return 1
+    
+    # Interpreter startup and streamlit, including the parts it loads
+    # lazily under the app, are reported but not budgeted; a module
+    # streamlit already loaded costs the app nothing
+    groups = summarize(entries)
+    baseline_us = sum(groups[name][0] for name in BASELINE_MODULES if name in groups)
+    app_us = 0
+    app_entries = []
+    for name in modules:
+        if name not in groups:
+            continue
+        cumulative, tree = groups[name]
+        lazy_us, own = split_baseline(tree)
+        baseline_us += lazy_us
+        app_us += cumulative - lazy_us
+        # The top-level entry is printed last; list it without streamlit's share
+        app_entries.extend(own[:-1] + [(cumulative - lazy_us, 0, name)])
+    
+    print(f"Streamlit: {baseline_us / 1000:.1f} ms")
+    print(f"Ứng dụng: {app_us / 1000:.1f} ms / ngân sách {args.budget_ms:.0f} ms")
+    
+    slowest = sorted((entry for entry in app_entries if entry[1] <= 1), reverse=True)[:args.top]
+    for cumulative, _, name in slowest:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+    
+    imported = {name for _, _, name in app_entries}
+    forbidden = [name for name in FORBIDDEN_MODULES if name in imported]
+    
+    ok = True
+    if forbidden:
+        print(f"❌ Module nặng bị import khi khởi động: {', '.join(forbidden)}")
+        ok = False
+    if app_us / 1000 > args.budget_ms:
+        print(f"❌ Vượt ngân sách khởi động {app_us / 1000 - args.budget_ms:.1f} ms")
+        ok = False
+    if ok:
+        print("✅ Khởi động trong ngân sách")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+List Index Utilities for Level Up Application
+Chỉ mục và phân trang danh sách dài, lọc theo trường mà không cần quét toàn bộ
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Filters = Dict[str, Any]  # field name -> wanted value (None means any)
+
+class ListIndex:
+    """Positions of a list's records grouped by the value of each indexed field
+    
+    Built once per version of the list (one pass over the records); every
+    filtered view after that is answered from the position lists. Results
+    of each filter combination are kept until the index is rebuilt.
+    """
+    
+    def __init__(self, records: Sequence[Any], fields: Dict[str, Callable[[Any], Any]],
+                 signature: Tuple = ()):
+        self.size = len(records)
+        self.signature = signature
+        self._positions: Dict[str, Dict[Any, List[int]]] = {name: {} for name in fields}
+        self._selections: Dict[Tuple, Sequence[int]] = {}
+        
+        for pos, record in enumerate(records):
+            for name, get_value in fields.items():
+                self._positions[name].setdefault(get_value(record), []).append(pos)
+    
+    def values(self, name: str) -> List[Any]:
+        """Get the distinct values of an indexed field"""
+        return sorted(self._positions.get(name, {}), key=str)
+    
+    def count(self, name: str, value: Any) -> int:
+        """Count the records whose field equals value"""
+        return len(self._positions.get(name, {}).get(value, []))
+    
+    def select(self, filters: Optional[Filters] = None) -> Sequence[int]:
+        """Get the positions of the records matching every filter, in list order"""
+        active = tuple(sorted((name, value) for name, value in (filters or {}).items() if value is not None))
+        if not active:
+            return range(self.size)
+        
+        selection = self._selections.get(active)
+        if selection is None:
+            # Walk the shortest position list and probe the others
+            candidates = sorted((self._positions.get(name, {}).get(value, []) for name, value in active), key=len)
+            others = [set(positions) for positions in candidates[1:]]
+            selection = [pos for pos in candidates[0] if all(pos in other for other in others)]
+            self._selections[active] = selection
+        return selection
+
+@dataclass
+class ListWindow:
+    """One page of a filtered list"""
+    items: List[Any] = field(default_factory=list)
+    start: int = 0
+    total: int = 0
+    cursor: int = 0
+    page_size: int = 0
+    from_end: bool = False
+    
+    @property
+    def end(self) -> int:
+        return self.start + len(self.items)
+    
+    @property
+    def has_before(self) -> bool:
+        """Check if selected items precede this page in list order"""
+        return self.start > 0
+    
+    @property
+    def has_after(self) -> bool:
+        """Check if selected items follow this page in list order"""
+        return self.end < self.total
+
+def get_window(records: Sequence[Any], positions: Sequence[int], cursor: int,
+               page_size: int, from_end: bool = False) -> ListWindow:
+    """Slice one page out of the selected positions
+    
+    cursor is the number of selected items skipped, counted from the start
+    of the list, or from its end with from_end=True (newest items first,
+    as in the chat). Only the items of the page are touched.
+    """
+    total = len(positions)
+    page_size = max(1, page_size)
+    cursor = max(0, min(cursor, max(0, total - 1) // page_size * page_size))
+    
+    if from_end:
+        stop = total - cursor
+        start = max(0, stop - page_size)
+    else:
+        start = cursor
+        stop = min(total, start + page_size)
+    
+    return ListWindow(
+        items=[records[pos] for pos in positions[start:stop]],
+        start=start,
+        total=total,
+        cursor=cursor,
+        page_size=page_size,
+        from_end=from_end
+    )
\ No newline at end of file
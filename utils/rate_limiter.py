@@ -0,0 +1,101 @@
+"""
+Rate Limiting Utilities for Level Up Application
+Giới hạn tần suất gọi Google Sheets API, dùng chung cho toàn bộ tiến trình
+"""
+
+import math
+import threading
+import time
+from typing import Dict, Optional
+
+from config import MAX_REQUESTS_PER_MINUTE, RATE_LIMIT_MAX_WAIT
+
+class RateLimitExceeded(Exception):
+    """Raised when a request would have to wait longer than allowed"""
+    
+    def __init__(self, wait: float):
+        self.wait = wait
+        super().__init__(f"Vượt quá giới hạn {MAX_REQUESTS_PER_MINUTE} yêu cầu/phút, vui lòng thử lại sau {wait:.0f} giây")
+
+class TokenBucket:
+    """Thread-safe token bucket
+    
+    Tokens refill continuously at rate_per_minute / 60 per second up to
+    capacity. A caller that finds the bucket empty reserves a future token
+    (the balance goes negative) and waits for it, so concurrent callers are
+    served in arrival order. Requests that would wait longer than max_wait
+    are shed instead of queued.
+    """
+    
+    def __init__(self, rate_per_minute: int, capacity: Optional[int] = None, max_wait: float = RATE_LIMIT_MAX_WAIT):
+        self.rate = max(1, rate_per_minute) / 60.0
+        self.capacity = capacity or max(1, rate_per_minute)
+        self.max_wait = max_wait
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+        
+        # Statistics
+        self.total_requests = 0
+        self.delayed_requests = 0
+        self.shed_requests = 0
+        self.total_wait = 0.0
+        self.last_wait = 0.0
+    
+    def _refill(self, now: float):
+        """Add the tokens earned since the last update"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """Reserve one token and return the seconds to wait before using it"""
+        max_wait = self.max_wait if max_wait is None else max_wait
+        
+        with self._lock:
+            self._refill(time.monotonic())
+            wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+            
+            if wait > max_wait:
+                self.shed_requests += 1
+                raise RateLimitExceeded(wait)
+            
+            self.tokens -= 1
+            self.total_requests += 1
+            self.last_wait = wait
+            if wait > 0:
+                self.delayed_requests += 1
+                self.total_wait += wait
+            return wait
+    
+    def acquire(self, max_wait: Optional[float] = None) -> float:
+        """Block until a token is available and return the time spent waiting"""
+        wait = self.reserve(max_wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def get_stats(self) -> Dict:
+        """Get limiter statistics for display"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                'available': max(0.0, self.tokens),
+                'queued': math.ceil(-self.tokens) if self.tokens < 0 else 0,
+                'total_requests': self.total_requests,
+                'delayed_requests': self.delayed_requests,
+                'shed_requests': self.shed_requests,
+                'average_wait': self.total_wait / self.delayed_requests if self.delayed_requests else 0.0,
+                'last_wait': self.last_wait
+            }
+
+# Process-wide limiter shared by every session's GoogleSheetsManager
+_shared_limiter: Optional[TokenBucket] = None
+_shared_limiter_lock = threading.Lock()
+
+def get_rate_limiter() -> TokenBucket:
+    """Get the process-wide Google Sheets rate limiter"""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = TokenBucket(MAX_REQUESTS_PER_MINUTE)
+        return _shared_limiter
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+Retry Policy for Level Up Application
+Quy tắc thử lại yêu cầu Google Sheets API, dùng chung cho bản đồng bộ và bất đồng bộ
+"""
+
+import random
+from typing import Optional
+
+from config import HTTP_MAX_BACKOFF
+
+# Responses worth retrying: quota exceeded and transient server errors
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# POST endpoints that can be replayed safely; values:append is not one of them
+IDEMPOTENT_POST_ENDPOINTS = {'/values:batchUpdate', '/values:batchClear'}
+
+class UnconfirmedWriteError(Exception):
+    """A non-idempotent write failed after it was sent, so it may or may not have been applied"""
+
+def is_idempotent(method: str, endpoint: str) -> bool:
+    """Check if a request can be retried without risk of applying it twice"""
+    return method in ('GET', 'PUT') or endpoint in IDEMPOTENT_POST_ENDPOINTS
+
+def backoff_delay(attempt: int, backoff_factor: float, retry_after: Optional[str] = None) -> float:
+    """Exponential backoff with full jitter, honoring Retry-After when sent
+    
+    Never longer than HTTP_MAX_BACKOFF, since the wait blocks the
+    calling script thread.
+    """
+    if retry_after:
+        try:
+            return max(0.0, min(float(retry_after), HTTP_MAX_BACKOFF))
+        except ValueError:
+            pass
+    return random.uniform(0, min(backoff_factor * (2 ** attempt), HTTP_MAX_BACKOFF))
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Settings Store for Level Up Application
+Cài đặt đọc một lần cho cả tiến trình, chỉ đọc lại khi tệp thay đổi và ghi nguyên tử
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from config import SETTINGS_FILE, SETTINGS_CHECK_INTERVAL
+
+class SettingsStore:
+    """The settings file, shared by every session of the process
+    
+    The file is parsed once and kept in memory. Reads stat it at most
+    every check_interval seconds and parse it again only when its inode,
+    mtime or size changed (an edit by hand, or a save from another
+    process), so a rerun normally touches no disk at all. Saves write a
+    temporary file next to it and rename it over the old one, so readers
+    never see a half-written file.
+    """
+    
+    def __init__(self, path: Path = SETTINGS_FILE, check_interval: float = SETTINGS_CHECK_INTERVAL):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._settings: Dict[str, Any] = {}
+        self._stamp: Optional[Tuple[int, int, int]] = None  # (inode, mtime_ns, size) of the loaded file
+        self._checked: Optional[float] = None
+        # Bumped whenever the in-memory settings change
+        self.version = 0
+    
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    
+    def _refresh(self, force: bool = False):
+        """Re-read the file if it changed (call with the lock held)"""
+        now = time.monotonic()
+        if not force and self._checked is not None and now - self._checked < self.check_interval:
+            return
+        self._checked = now
+        
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return
+        
+        settings = {}
+        if stamp is not None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    settings = json.load(f)
+            except (OSError, ValueError) as e:
+                # Report a broken file once, then keep the last good settings until it changes
+                self._stamp = stamp
+                raise Exception(f"Lỗi đọc cài đặt: {str(e)}")
+        self._settings = settings
+        self._stamp = stamp
+        self.version += 1
+    
+    def snapshot(self) -> Tuple[int, Dict[str, Any]]:
+        """Get (version, a copy of the saved settings)"""
+        with self._lock:
+            self._refresh()
+            return self.version, dict(self._settings)
+    
+    def save(self, settings: Dict[str, Any]) -> int:
+        """Write the settings atomically; returns the new version"""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix=f".{self.path.name}.", suffix='.tmp', dir=self.path.parent)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(settings, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise Exception(f"Lỗi lưu cài đặt: {str(e)}")
+            
+            self._settings = dict(settings)
+            self._stamp = self._file_stamp()
+            self._checked = time.monotonic()
+            self.version += 1
+            return self.version
+
+# Process-wide store shared by every session
+_shared_store: Optional[SettingsStore] = None
+_shared_store_lock = threading.Lock()
+
+def get_settings_store() -> SettingsStore:
+    """Get the process-wide settings store"""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = SettingsStore()
+        return _shared_store
\ No newline at end of file
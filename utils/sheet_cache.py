@@ -0,0 +1,187 @@
+"""
+Shared Sheet Cache for Level Up Application
+Bộ nhớ đệm dữ liệu Google Sheets dùng chung cho mọi phiên trong tiến trình
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import CACHE_TTL, CACHE_MAX_ENTRIES
+
+CacheKey = Tuple[str, str]  # (sheet_id, A1 range)
+
+class _Flight:
+    """A load in progress that other callers can wait on"""
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error: Optional[Exception] = None
+
+class SheetCache:
+    """Thread-safe TTL + LRU cache of raw range values keyed by (sheet_id, range)
+    
+    Entries expire ttl seconds after they were loaded, and the least
+    recently used entry is evicted once max_entries is reached. Keys that
+    are already being loaded by another thread are not fetched again: the
+    caller waits for that load instead (single flight). Cached values are
+    shared between sessions and must be treated as read-only.
+    """
+    
+    def __init__(self, ttl: float = CACHE_TTL, max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[CacheKey, Tuple[float, List[List[str]]]]" = OrderedDict()
+        self._inflight: Dict[CacheKey, _Flight] = {}
+        self._lock = threading.Lock()
+        
+        # Bumped by invalidate() so loads that started before a write are not cached
+        self._generation = 0
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.shared_loads = 0
+    
+    def _lookup(self, key: CacheKey, now: float):
+        """Get a live entry (caller holds the lock), refreshing its LRU position"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+    
+    def _store(self, key: CacheKey, value: List[List[str]], now: float):
+        """Insert an entry (caller holds the lock), evicting the oldest if full"""
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def get_many(self, keys: List[CacheKey], loader: Callable[[List[CacheKey]], List[List[List[str]]]],
+                 refresh: bool = False) -> Dict[CacheKey, List[List[str]]]:
+        """Get the values of keys, loading every missing key with one loader call
+        
+        loader receives the keys to fetch and returns their values in the
+        same order. With refresh=True cached entries are ignored and
+        replaced, but loads already in flight are still shared.
+        """
+        results: Dict[CacheKey, List[List[str]]] = {}
+        waiting: Dict[CacheKey, _Flight] = {}
+        to_load: List[CacheKey] = []
+        
+        with self._lock:
+            now = time.monotonic()
+            generation = self._generation
+            for key in keys:
+                entry = None if refresh else self._lookup(key, now)
+                if entry is not None:
+                    results[key] = entry[1]
+                    self.hits += 1
+                elif key in self._inflight:
+                    waiting[key] = self._inflight[key]
+                    self.shared_loads += 1
+                elif key not in to_load:
+                    self._inflight[key] = _Flight()
+                    to_load.append(key)
+                    self.misses += 1
+        
+        if to_load:
+            try:
+                values = loader(to_load)
+            except Exception as e:
+                with self._lock:
+                    for key in to_load:
+                        flight = self._inflight.pop(key)
+                        flight.error = e
+                        flight.event.set()
+                raise
+            
+            with self._lock:
+                now = time.monotonic()
+                for key, value in zip(to_load, values):
+                    if generation == self._generation:
+                        self._store(key, value, now)
+                    flight = self._inflight.pop(key)
+                    flight.value = value
+                    flight.event.set()
+                    results[key] = value
+        
+        for key, flight in waiting.items():
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            results[key] = flight.value
+        
+        return results
+    
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; pass it back to put_many()"""
+        return self._generation
+    
+    def peek_many(self, keys: List[CacheKey]) -> Dict[CacheKey, List[List[str]]]:
+        """Get the keys that are cached and fresh, without loading the others"""
+        results = {}
+        with self._lock:
+            now = time.monotonic()
+            for key in keys:
+                entry = self._lookup(key, now)
+                if entry is not None:
+                    results[key] = entry[1]
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        return results
+    
+    def put_many(self, items: Dict[CacheKey, List[List[str]]], generation: int):
+        """Store values loaded by the caller, unless an invalidation happened since generation"""
+        with self._lock:
+            if generation != self._generation:
+                return
+            now = time.monotonic()
+            for key, value in items.items():
+                self._store(key, value, now)
+    
+    def invalidate(self, sheet_id: str, tab: Optional[str] = None):
+        """Drop every cached range of a sheet, or only those of one tab"""
+        prefix = f"{tab}!" if tab else None
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._entries if k[0] == sheet_id and (prefix is None or k[1].startswith(prefix))]:
+                del self._entries[key]
+    
+    def clear(self):
+        """Drop every cached range"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict:
+        """Get cache statistics for display"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'shared_loads': self.shared_loads,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+# Process-wide cache shared by every session's GoogleSheetsManager
+_shared_cache: Optional[SheetCache] = None
+_shared_cache_lock = threading.Lock()
+
+def get_sheet_cache() -> SheetCache:
+    """Get the process-wide sheet cache"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = SheetCache()
+        return _shared_cache
\ No newline at end of file